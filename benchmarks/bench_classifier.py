@@ -0,0 +1,75 @@
+"""
+Benchmark klasifikasi industry: scan `any(k in text)` lama vs IndustryClassifier
+(Aho–Corasick) saat jumlah keyword bertambah.
+
+    python -m benchmarks.bench_classifier --keywords 10 100 1000 5000 --texts 20000
+"""
+import argparse
+import random
+import string
+import time
+
+from processors.classifier import POSITION_KEYWORDS, IndustryClassifier
+from scraper.api_scraper import POSITIONS
+
+
+def make_keyword_map(n, seed=0):
+    rng = random.Random(seed)
+    keyword_map = {industry: list(keywords) for industry, keywords in POSITION_KEYWORDS.items()}
+    industries = list(keyword_map)
+    for i in range(n):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10)))
+        keyword_map[industries[i % len(industries)]].append(word)
+    return keyword_map
+
+
+def make_texts(n, seed=1):
+    rng = random.Random(seed)
+    # teks unik supaya cache tidak membantu: yang diukur murni scan-nya
+    return [f"{rng.choice(POSITIONS)} {i}" for i in range(n)]
+
+
+def naive(keyword_map, texts):
+    out = []
+    for text in texts:
+        industry = "General"
+        for key, keywords in keyword_map.items():
+            if any(k.lower() in text.lower() for k in keywords):
+                industry = key
+                break
+        out.append(industry)
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keywords", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--texts", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    texts = make_texts(args.texts)
+    report = {}
+    for n in args.keywords:
+        keyword_map = make_keyword_map(n)
+        start = time.perf_counter()
+        expected = naive(keyword_map, texts)
+        naive_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        classifier = IndustryClassifier(keyword_map, cache_size=0)
+        compile_s = time.perf_counter() - start
+        start = time.perf_counter()
+        got = [classifier.classify(text) for text in texts]
+        automaton_s = time.perf_counter() - start
+        assert got == expected
+
+        report[n] = {"naive": naive_s, "automaton": automaton_s, "compile": compile_s}
+        print(
+            f"keywords={n:>6}: naive {len(texts) / naive_s:>10,.0f} texts/s | "
+            f"automaton {len(texts) / automaton_s:>10,.0f} texts/s (compile {compile_s * 1000:.1f} ms)"
+        )
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark models/codec.py vs json stdlib pada payload besar:
+- decode: body randomuser → record user (dulu response.json() + indexing dict)
+- encode: payload /leads → body (dulu jsonify: json.dumps sort_keys, ensure_ascii)
+
+    python -m benchmarks.bench_codec --sizes 100000
+"""
+import argparse
+import gc
+import json
+import time
+
+from models import codec
+from processors.scorer import LeadScorer
+from scraper.synthetic import SyntheticScraper
+from stubs.randomuser import make_page
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        # hasil sebelumnya dibuang dulu: setiap percobaan mulai dari heap yang sama
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def stdlib_decode(body):
+    return [
+        (f"{item['name']['first']} {item['name']['last']}", item["email"], item["location"]["city"])
+        for item in json.loads(body)["results"]
+    ]
+
+
+def stdlib_encode(payload):
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def run(n, repeat):
+    body = json.dumps(make_page("bench", 1, n)).encode("utf-8")
+    leads = LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"]).apply(SyntheticScraper().fetch(n))
+    payload = {"meta": {"count": n}, "data": [lead.to_dict() for lead in leads]}
+
+    print(f"n={n:,} (codec backend: {codec.BACKEND}, body {len(body) / 1e6:.1f} MB)")
+    slow, expected = best_of(lambda: stdlib_decode(body), repeat)
+    fast, got = best_of(lambda: codec.decode_users(body), repeat)
+    assert [tuple(user) for user in got] == expected
+    print(f"  decode: json {slow * 1000:8.1f} ms | codec {fast * 1000:8.1f} ms | {slow / fast:5.1f}x")
+
+    slow, expected = best_of(lambda: stdlib_encode(payload), repeat)
+    fast, got = best_of(lambda: codec.dumps(payload), repeat)
+    assert json.loads(got) == json.loads(expected)
+    print(f"  encode: json {slow * 1000:8.1f} ms | codec {fast * 1000:8.1f} ms | {slow / fast:5.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    for n in args.sizes:
+        run(n, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
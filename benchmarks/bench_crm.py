@@ -0,0 +1,42 @@
+"""
+Benchmark CRMPusher ke stub CRM lokal (stubs/crm.py): throughput per
+kombinasi batch size × worker, dengan latency per request buatan.
+
+    python -m benchmarks.bench_crm --leads 100000 --batch-sizes 1 100 1000 --workers 1 4 8
+"""
+import argparse
+import os
+import tempfile
+
+from crm.outbox import CRMOutbox
+from crm.pusher import CRMPusher
+from scraper.synthetic import SyntheticScraper
+from stubs.crm import StubCRMServer
+
+
+def run(leads, batch_size, workers, latency):
+    with tempfile.TemporaryDirectory() as directory, StubCRMServer(latency=latency) as stub:
+        with CRMOutbox(os.path.join(directory, "outbox.db")) as outbox:
+            queued = outbox.enqueue(leads)
+            with CRMPusher(stub.url, outbox, batch_size=batch_size, max_workers=workers) as pusher:
+                stats = pusher.drain()
+        assert stats["sent"] == queued == len(stub.records)
+        print(f"batch {batch_size:>5} × {workers} workers: {stats['seconds']:7.2f} s "
+              f"{stats['leads_per_second']:>10,.0f} leads/s  {stub.request_count:>7,} requests")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--leads", type=int, default=100_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--latency", type=float, default=0.005, help="detik per request di stub")
+    args = parser.parse_args()
+    leads = SyntheticScraper().fetch(args.leads)
+    for batch_size in args.batch_sizes:
+        for workers in args.workers:
+            run(leads, batch_size, workers, args.latency)
+
+
+if __name__ == "__main__":
+    main()
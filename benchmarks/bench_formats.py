@@ -0,0 +1,49 @@
+"""
+Bandingkan waktu tulis/baca ulang leads: CSV vs Parquet vs Arrow.
+
+    python -m benchmarks.bench_formats --n 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.bench_scorer import make_leads
+from exporters.csv_exporter import CSVExporter
+from exporters.parquet_exporter import ParquetExporter, load_frame
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    leads = make_leads(args.n)
+    directory = tempfile.mkdtemp()
+    report = {}
+    for label, exporter, filename, load in (
+        ("csv", CSVExporter(), "leads.csv", pd.read_csv),
+        ("parquet", ParquetExporter(), "leads.parquet", load_frame),
+        ("arrow", ParquetExporter(), "leads.arrow", load_frame),
+    ):
+        path = os.path.join(directory, filename)
+        write_s, _ = timed(lambda: exporter.export(leads, path))
+        read_s, frame = timed(lambda: load(path))
+        report[label] = {"write": write_s, "read": read_s, "bytes": os.path.getsize(path)}
+        print(
+            f"{label:>8}: write {write_s:6.2f}s | read {read_s:6.2f}s | "
+            f"{os.path.getsize(path) / 2**20:7.1f} MiB | tags dtype: {type(frame['tags'][0]).__name__}"
+        )
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark LeadIndex vs scan linear LeadFilter untuk filter gabungan & top-k.
+
+    python -m benchmarks.bench_index --sizes 100000 1000000
+"""
+import argparse
+import heapq
+import time
+
+from processors.filter import LeadFilter
+from processors.scorer import LeadScorer
+from processors.tagger import LeadTagger
+from scraper.synthetic import SyntheticScraper
+from storage.lead_index import LeadIndex
+
+
+def make_leads(n):
+    leads = SyntheticScraper().fetch(n)
+    leads = LeadScorer(target_cities=[leads[0].location], target_industries=["Tech"]).apply(leads)
+    return LeadTagger().add_tag_high_potential(leads)
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(n, repeat):
+    leads = make_leads(n)
+    build, index = best_of(lambda: LeadIndex(leads), 1)
+    print(f"n={n:,}: build index {build * 1000:.0f} ms")
+    city = leads[0].location
+    queries = {
+        "city": {"location": city},
+        "industry+size": {"industry": "Tech", "company_size": "Large"},
+        "city+industry+tag": {"location": city, "industry": "Tech", "tags": ["High Potential"]},
+        "industry+min_score": {"industry": "Tech", "min_score": 60},
+    }
+    scan, indexed = LeadFilter(), LeadFilter(index=index)
+    for name, query in queries.items():
+        linear, expected = best_of(lambda: scan.filter(list(leads), **query), repeat)
+        fast, got = best_of(lambda: indexed.filter(leads, **query), repeat)
+        assert got == expected
+        print(f"  {name:>20}: scan {linear * 1000:9.2f} ms | index {fast * 1000:9.3f} ms | {len(got):,} leads")
+
+    linear, expected = best_of(lambda: heapq.nlargest(10, (l for l in leads if l.industry == "Tech"),
+                                                      key=lambda l: l.score), repeat)
+    fast, got = best_of(lambda: index.top_leads(10, industry="Tech"), repeat)
+    assert [l.score for l in got] == [l.score for l in expected]
+    print(f"  {'top10 industry':>20}: scan {linear * 1000:9.2f} ms | index {fast * 1000:9.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for n in args.sizes:
+        run(n, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
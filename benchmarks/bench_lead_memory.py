@@ -0,0 +1,93 @@
+"""
+Memory benchmark: Lead lama (__dict__ + list tags) vs Lead __slots__ vs LeadBatch.
+
+    python -m benchmarks.bench_lead_memory --n 1000000
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+
+from models.lead import Lead
+from models.lead_batch import LeadBatch
+from scraper.api_scraper import COMPANIES, COMPANY_SIZES, INDUSTRIES, POSITIONS
+
+CITIES = ["Jakarta", "Bandung", "Surabaya", "London", "Tokyo", "Berlin"]
+
+
+class LegacyLead:
+    """Salinan Lead sebelum __slots__, sebagai baseline"""
+
+    def __init__(self, name, email, company, position=None, location=None, industry=None, company_size=None):
+        self.name = name
+        self.email = email
+        self.company = company
+        self.position = position or "Unknown"
+        self.location = location
+        self.industry = industry or "General"
+        self.company_size = company_size or "Medium"
+        self.tags = []
+        self.score = 0
+
+
+def generate_rows(n, seed=0):
+    rng = random.Random(seed)
+    for i in range(n):
+        # "".join → string baru per baris, seperti hasil parsing JSON dari API
+        yield (
+            f"User {i}", f"user{i}@example.com", "".join(rng.choice(COMPANIES)),
+            "".join(rng.choice(POSITIONS)), "".join(rng.choice(CITIES)),
+            "".join(rng.choice(INDUSTRIES)), "".join(rng.choice(COMPANY_SIZES)),
+        )
+
+
+def measure(build, n):
+    gc.collect()
+    tracemalloc.start()
+    obj = build(n)
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return current
+
+
+def build_legacy(n):
+    leads = [LegacyLead(*row) for row in generate_rows(n)]
+    for lead in leads[::3]:
+        lead.tags.append("High Potential")
+    return leads
+
+
+def build_slots(n):
+    leads = [Lead(*row) for row in generate_rows(n)]
+    for lead in leads[::3]:
+        lead.add_tag("High Potential")
+    return leads
+
+
+def build_batch(n):
+    batch = LeadBatch()
+    for i, row in enumerate(generate_rows(n)):
+        lead = Lead(*row)
+        if i % 3 == 0:
+            lead.add_tag("High Potential")
+        batch.append(lead)
+    return batch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for label, build in (("legacy", build_legacy), ("slots", build_slots), ("batch", build_batch)):
+        results[label] = measure(build, args.n)
+        print(f"{label:>7}: {results[label] / 2**20:8.1f} MiB  ({results[label] / args.n:6.1f} B/lead)")
+    print(f"slots vs legacy: {results['legacy'] / results['slots']:.2f}x smaller")
+    print(f"batch vs legacy: {results['legacy'] / results['batch']:.2f}x smaller")
+    return results
+
+
+if __name__ == "__main__":
+    main()
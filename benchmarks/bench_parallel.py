@@ -0,0 +1,69 @@
+"""
+Throughput enricher → scorer → tagger: serial vs ProcessExecutor dengan N worker.
+
+    python -m benchmarks.bench_parallel --n 200000 --workers 1 2 4 8
+
+Output tiap run dibandingkan dengan run serial (harus identik, termasuk
+company_size acak dari LeadEnricher(seed=...)).
+"""
+import argparse
+import os
+import time
+
+from benchmarks.bench_scorer import make_leads
+from processors.enricher import LeadEnricher
+from processors.executor import ProcessExecutor, SerialExecutor
+from processors.scorer import LeadScorer
+from processors.tagger import LeadTagger
+
+
+def make_stages(seed=0):
+    enricher = LeadEnricher(seed=seed)
+    scorer = LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"])
+    tagger = LeadTagger()
+    return [enricher.iter_enrich_leads, scorer.iter_apply, tagger.iter_tag_industry, tagger.iter_add_tag_high_potential]
+
+
+def make_input(n):
+    leads = make_leads(n)
+    for i, lead in enumerate(leads):
+        # sebagian lead butuh enrichment (company_size acak + industry dari company)
+        if i % 2:
+            lead.company_size = "Unknown"
+            lead.industry = "General"
+    return leads
+
+
+def run(executor, stages, n):
+    leads = make_input(n)
+    start = time.perf_counter()
+    records = [(lead.to_record(), lead.missing_info) for lead in executor.map(stages, leads)]
+    return time.perf_counter() - start, records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--shard-size", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    stages = make_stages()
+    serial_s, expected = run(SerialExecutor(), stages, args.n)
+    print(f"  serial: {args.n / serial_s:10,.0f} leads/s ({serial_s:.2f}s)")
+    report = {"n": args.n, "cpus": os.cpu_count(), "serial": serial_s, "workers": {}}
+    for workers in sorted(set(args.workers)):
+        with ProcessExecutor(workers=workers, shard_size=args.shard_size) as executor:
+            executor.map(stages, [])  # start pool di luar pengukuran
+            elapsed, records = run(executor, stages, args.n)
+        identical = records == expected
+        report["workers"][workers] = {"seconds": elapsed, "speedup": serial_s / elapsed, "identical": identical}
+        print(
+            f"{workers:>3} proc: {args.n / elapsed:10,.0f} leads/s ({elapsed:.2f}s) | "
+            f"speedup {serial_s / elapsed:4.2f}x | identical: {identical}"
+        )
+    return report
+
+
+if __name__ == "__main__":
+    main()
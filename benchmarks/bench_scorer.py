@@ -0,0 +1,71 @@
+"""
+Benchmark LeadScorer: per-lead apply() vs vectorized scoring.
+
+    python -m benchmarks.bench_scorer --sizes 100000 1000000
+"""
+import argparse
+import random
+import time
+
+from models.lead import Lead
+from models.lead_batch import LeadBatch
+from processors.scorer import LeadScorer
+from scraper.api_scraper import COMPANIES, COMPANY_SIZES, INDUSTRIES, POSITIONS
+
+CITIES = ["Jakarta", "Bandung", "Surabaya", "London", "Tokyo", "Berlin"]
+
+
+def make_leads(n, seed=0):
+    rng = random.Random(seed)
+    leads = []
+    for i in range(n):
+        lead = Lead(
+            f"User {i}", f"user{i}@example.com", rng.choice(COMPANIES), rng.choice(POSITIONS),
+            rng.choice(CITIES), rng.choice(INDUSTRIES), rng.choice(COMPANY_SIZES),
+        )
+        if i % 4 == 0:
+            lead.add_tag("High Potential")
+        leads.append(lead)
+    return leads
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def run(n, scorer):
+    leads = make_leads(n)
+    batch = LeadBatch(leads)
+    frame = batch.to_dataframe()
+
+    results = {}
+    results["apply"], expected = timed(lambda: [lead.score for lead in scorer.apply(leads)])
+    results["apply_batch"], got = timed(lambda: [lead.score for lead in scorer.apply_batch(leads)])
+    assert got == expected
+    results["score_batch"], got = timed(lambda: scorer.score_batch(batch))
+    assert got.tolist() == expected
+    results["score_frame"], got = timed(lambda: scorer.score_frame(frame))
+    assert got.tolist() == expected
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    scorer = LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"])
+    report = {}
+    for n in args.sizes:
+        report[n] = results = run(n, scorer)
+        base = results["apply"]
+        print(f"n={n:,}")
+        for label, seconds in results.items():
+            print(f"  {label:>12}: {seconds * 1000:9.1f} ms  ({base / seconds:6.1f}x)")
+    return report
+
+
+if __name__ == "__main__":
+    main()
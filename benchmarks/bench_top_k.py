@@ -0,0 +1,68 @@
+"""
+Benchmark TopKSelector (heap terbatas, streaming) vs list + sorted untuk
+daftar hand-off: top-k global dan top-N per kota.
+
+    python -m benchmarks.bench_top_k --sizes 100000 1000000 --k 100
+"""
+import argparse
+import time
+import tracemalloc
+
+from processors.scorer import LeadScorer
+from processors.top_k import TopKSelector
+from scraper.synthetic import SyntheticScraper
+
+
+def stream(n):
+    scraper = SyntheticScraper()
+    leads = scraper.iter_fetch_concurrent(results=n, page_size=5000)
+    return LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"]).iter_apply(leads)
+
+
+def sorted_top(leads, k, per_segment):
+    ranked = sorted(leads, key=lambda l: -l.score)
+    if per_segment is None:
+        return ranked[:k]
+    taken, result = {}, []
+    for lead in ranked:
+        if taken.get(lead.location, 0) < per_segment:
+            taken[lead.location] = taken.get(lead.location, 0) + 1
+            result.append(lead)
+    return result[:k]
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak, result
+
+
+def run(n, k, per_segment):
+    label = f"top{k}" + (f" (max {per_segment}/city)" if per_segment else "")
+    full, full_peak, expected = measure(lambda: sorted_top(list(stream(n)), k, per_segment))
+    segment_by = "location" if per_segment else None
+    heap, heap_peak, got = measure(
+        lambda: TopKSelector(k, per_segment, segment_by).extend(stream(n)).results()
+    )
+    assert [l.email for l in got] == [l.email for l in expected]
+    print(f"n={n:,} {label}: sorted {full:.2f} s / {full_peak / 1e6:.0f} MB | "
+          f"heap {heap:.2f} s / {heap_peak / 1e6:.0f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--k", type=int, default=100)
+    parser.add_argument("--per-segment", type=int, default=5)
+    args = parser.parse_args()
+    for n in args.sizes:
+        run(n, args.k, None)
+        run(n, args.k, args.per_segment)
+
+
+if __name__ == "__main__":
+    main()
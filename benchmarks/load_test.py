@@ -0,0 +1,152 @@
+"""
+Load test /leads terhadap stub upstream lokal: requests/detik & latency p50/p99.
+
+    python -m benchmarks.load_test --server asgi --requests 2000 --concurrency 50
+    python -m benchmarks.load_test --server flask
+
+Server dijalankan di thread (uvicorn untuk asgi, werkzeug threaded untuk flask),
+load generator di proses terpisah supaya tidak berebut GIL dengan server;
+upstream adalah stubs.randomuser dengan latency buatan.
+Burst pertama mengenai dataset yang belum di-load, jadi `upstream_requests`
+menunjukkan apakah request bersamaan berbagi satu fetch.
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import socket
+import statistics
+import threading
+import time
+
+from stubs.randomuser import StubRandomUserServer
+
+QUERIES = [
+    "/leads?limit=20",
+    "/leads?limit=50&city=Jakarta",
+    "/leads?limit=20&min_score=50&sort=score",
+    "/leads?limit=20&industry=Tech&tag_keyword=Tech",
+]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ServerThread:
+    def __init__(self, kind, upstream_url, dataset_size):
+        self.kind = kind
+        self.port = free_port()
+        if kind == "asgi":
+            import uvicorn
+            from scraper.async_client import AsyncAPIScraper
+            from ui.asgi_app import create_asgi_app
+
+            app = create_asgi_app(AsyncAPIScraper(api_url=upstream_url), dataset_size=dataset_size)
+            config = uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning", lifespan="on")
+            self._server = uvicorn.Server(config)
+        elif kind == "flask":
+            from werkzeug.serving import make_server
+            from scraper.api_scraper import APIScraper
+            from scraper.cache import CachedScraper
+            from ui.flask_app import create_app
+
+            app = create_app(CachedScraper(APIScraper(api_url=upstream_url)), dataset_size=dataset_size)
+            self._server = make_server("127.0.0.1", self.port, app, threaded=True)
+            logging.getLogger("werkzeug").setLevel(logging.WARNING)
+        else:
+            raise ValueError(f"Unknown server: {kind!r}")
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        target = self._server.run if self.kind == "asgi" else self._server.serve_forever
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+        if self.kind == "asgi":
+            while not self._server.started:
+                time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc):
+        if self.kind == "asgi":
+            self._server.should_exit = True
+        else:
+            self._server.shutdown()
+        self._thread.join()
+
+
+async def run_load(base_url, total, concurrency, queries=QUERIES):
+    import httpx
+
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        async def worker():
+            nonlocal errors
+            for i in counter:
+                start = time.perf_counter()
+                response = await client.get(queries[i % len(queries)])
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return elapsed, latencies, errors
+
+
+def run_load_process(base_url, total, concurrency, queries):
+    return asyncio.run(run_load(base_url, total, concurrency, queries))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--server", choices=["asgi", "flask"], default="asgi")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--dataset-size", type=int, default=500)
+    parser.add_argument("--upstream-latency", type=float, default=0.2)
+    parser.add_argument("--query", action="append", help="path+query (bisa diulang); default campuran /leads")
+    args = parser.parse_args(argv)
+
+    with StubRandomUserServer(latency=args.upstream_latency) as stub:
+        with ServerThread(args.server, stub.url, args.dataset_size) as server:
+            with multiprocessing.get_context("spawn").Pool(1) as pool:
+                elapsed, latencies, errors = pool.apply(
+                    run_load_process, (server.url, args.requests, args.concurrency, args.query or QUERIES)
+                )
+        upstream_requests = stub.request_count
+
+    report = {
+        "server": args.server,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "upstream_requests": upstream_requests,
+    }
+    print(
+        f"{report['server']:>6}: {report['rps']:8.0f} req/s | p50 {report['p50_ms']:7.1f} ms | "
+        f"p99 {report['p99_ms']:7.1f} ms | errors {errors} | upstream requests {upstream_requests}"
+    )
+    return report
+
+
+if __name__ == "__main__":
+    main()
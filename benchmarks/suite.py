@@ -0,0 +1,178 @@
+"""
+Benchmark suite offline (data dari SyntheticScraper): parsing, dedup, scoring,
+tagging, enrichment dan semua exporter. Hasil disimpan sebagai JSON supaya
+regresi bisa dilacak antar commit.
+
+    python -m benchmarks.suite --n 100000
+    python -m benchmarks.suite --only export --output output/benchmarks/latest.json
+    python -m benchmarks.suite --compare output/benchmarks/baseline.json --threshold 0.2
+
+Setiap case diulang `--repeat` kali dengan input baru (setup tidak ikut diukur);
+yang dilaporkan waktu minimum & median. Dengan --compare, exit code 1 jika ada
+case yang lebih lambat dari baseline melebihi threshold.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from exporters.csv_exporter import CSVExporter
+from exporters.excel_exporter import ExcelExporter
+from exporters.json_exporter import JSONExporter
+from exporters.jsonl_exporter import JSONLinesExporter
+from exporters.parquet_exporter import ParquetExporter
+from models import codec
+from models.lead_batch import LeadBatch
+from processors.dedup import LeadDeduplicator
+from processors.enricher import LeadEnricher
+from processors.filter import LeadFilter
+from processors.scorer import LeadScorer
+from processors.tagger import LeadTagger
+from scraper.api_scraper import APIScraper
+from scraper.synthetic import SyntheticScraper
+from stubs.randomuser import make_page
+
+DEFAULT_OUTPUT_DIR = os.path.join("output", "benchmarks")
+
+
+def synthetic_leads(n, duplicate_rate=0.1):
+    return SyntheticScraper(duplicate_rate=duplicate_rate).fetch(n)
+
+
+def scored_leads(n):
+    return LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"]).apply(synthetic_leads(n, 0.0))
+
+
+def make_cases(directory):
+    """[(nama, skala n, setup(n) → input, run(input))]; skala < 1 untuk case yang berat"""
+    scorer = LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"])
+    tagger = LeadTagger()
+    enricher = LeadEnricher()
+    parser = APIScraper(api_url="http://localhost/unused")
+
+    def export(exporter, filename):
+        path = os.path.join(directory, filename)
+        return lambda leads: exporter.export(leads, path)
+
+    def needs_enrichment(n):
+        leads = synthetic_leads(n, 0.0)
+        for lead in leads[::2]:
+            lead.company_size = "Unknown"
+            lead.industry = "General"
+        return leads
+
+    return [
+        ("synthetic.generate", 1, lambda n: n, lambda n: SyntheticScraper(duplicate_rate=0.1).fetch(n)),
+        ("fetch.parse", 1, lambda n: make_page("bench", 1, n)["results"],
+         lambda items: [parser._parse_item(item) for item in items]),
+        ("codec.decode", 1, lambda n: json.dumps(make_page("bench", 1, n)).encode("utf-8"), codec.decode_users),
+        ("codec.encode", 1, lambda n: {"data": [lead.to_dict() for lead in scored_leads(n)]}, codec.dumps),
+        ("dedup.exact", 1, synthetic_leads, LeadFilter().deduplicate),
+        ("dedup.fuzzy", 0.1, synthetic_leads, lambda leads: LeadDeduplicator().deduplicate(leads)),
+        ("score.apply", 1, lambda n: synthetic_leads(n, 0.0), scorer.apply),
+        ("score.batch", 1, lambda n: LeadBatch(synthetic_leads(n, 0.0)), scorer.score_batch),
+        ("tag.industry", 1, lambda n: synthetic_leads(n, 0.0), tagger.tag_industry),
+        ("tag.high_potential", 1, scored_leads, tagger.add_tag_high_potential),
+        ("enrich", 1, needs_enrichment, enricher.enrich_leads),
+        ("export.csv", 1, scored_leads, export(CSVExporter(), "leads.csv")),
+        ("export.csv_gzip", 1, scored_leads, export(CSVExporter(), "leads.csv.gz")),
+        ("export.json", 1, scored_leads, export(JSONExporter(), "leads.json")),
+        ("export.jsonl", 1, scored_leads, export(JSONLinesExporter(), "leads.jsonl")),
+        ("export.excel", 0.1, scored_leads, export(ExcelExporter(), "leads.xlsx")),
+        ("export.parquet", 1, scored_leads, export(ParquetExporter(), "leads.parquet")),
+        ("export.arrow", 1, scored_leads, export(ParquetExporter(), "leads.arrow")),
+    ]
+
+
+def run_case(setup, fn, n, repeat):
+    timings = []
+    for _ in range(repeat):
+        data = setup(n)
+        start = time.perf_counter()
+        fn(data)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "n": n,
+        "repeat": repeat,
+        "min_s": best,
+        "median_s": statistics.median(timings),
+        "leads_per_s": n / best if best else None,
+    }
+
+
+def metadata(args):
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "n": args.n,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return daftar (case, rasio) yang lebih lambat dari baseline > threshold"""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get("results", {}).get(name)
+        if not before or before["n"] != result["n"]:
+            continue
+        ratio = result["min_s"] / before["min_s"]
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="pola nama case, mis. 'export.*' atau 'dedup'")
+    parser.add_argument("--output", help=f"file JSON hasil (default {DEFAULT_OUTPUT_DIR}/suite-<waktu>.json)")
+    parser.add_argument("--compare", help="file JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="toleransi perlambatan (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, scale, setup, fn in make_cases(directory):
+            if args.only and not any(fnmatch.fnmatch(name, f"{p}*") for p in args.only):
+                continue
+            n = max(1, int(args.n * scale))
+            results[name] = result = run_case(setup, fn, n, args.repeat)
+            print(f"{name:>20}: {result['min_s'] * 1000:9.1f} ms | {result['leads_per_s']:12,.0f} leads/s | n={n:,}")
+
+    report = {"meta": metadata(args), "results": results}
+    output = args.output or os.path.join(DEFAULT_OUTPUT_DIR, f"suite-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"📄 Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for name, ratio in regressions:
+            print(f"⚠️  {name}: {ratio:.2f}x slower than baseline")
+        report["regressions"] = regressions
+        if regressions and argv is None:
+            sys.exit(1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Konfigurasi pipeline runner (lihat processors/runner.py dan `python main.py --help`).
+
+Config bisa dari file JSON atau TOML; nilai yang tidak diisi memakai
+DEFAULT_CONFIG (sama dengan perilaku main.py sebelumnya). Contoh TOML:
+
+    [fetch]
+    results = 100000
+    page_size = 5000
+    max_workers = 16
+    seed = "nightly"
+
+    [pipeline]
+    stages = ["dedup", "enrich", "score", "tag_industry", "tag_high_potential"]
+    workers = 4
+    batch_size = 900
+    checkpoint_every = 20000
+
+    [scorer]
+    target_cities = ["Jakarta", "Surabaya"]
+    weights = { city = 40, industry = 40 }
+
+    [[exporters]]
+    path = "output/leads.parquet"
+
+    [handoff]                     # daftar hand-off harian: top-k streaming (processors/top_k.py)
+    path = "output/handoff.csv"
+    k = 200
+    per_segment = 20
+    segment_by = "location"
+
+    [crm]                         # kirim lead High Potential ke CRM (crm/pusher.py)
+    url = "https://crm.example.com/api/leads/bulk"
+    workers = 4
+    rate = 10
+"""
+import copy
+import json
+import os
+
+from config import settings
+
+# stage per-lead (bisa dijalankan di ProcessExecutor); dedup stateful → selalu di proses utama
+PER_LEAD_STAGES = ("enrich", "score", "tag_industry", "tag_high_potential", "tag_defaults")
+STAGE_NAMES = ("dedup",) + PER_LEAD_STAGES
+SOURCES = ("api", "synthetic")
+HANDOFF_SEGMENTS = ("location", "industry", "company_size")
+# argumen LeadScorer (processors/scorer.py)
+SCORER_KEYS = ("target_cities", "target_industries", "base_score", "weights", "max_score")
+
+DEFAULT_CONFIG = {
+    "fetch": {
+        "source": "api",        # api | synthetic (offline, lihat scraper/synthetic.py)
+        "results": 50,
+        "page_size": 500,
+        "max_workers": 8,       # thread fetch paralel
+        "seed": None,           # seed randomuser; wajib untuk resume yang konsisten
+    },
+    "pipeline": {
+        "stages": ["dedup", "score", "tag_industry", "tag_high_potential"],
+        "workers": 0,           # >0 → stage per-lead dijalankan di ProcessExecutor
+        "batch_size": 500,      # batch commit store & chunk exporter
+        "checkpoint_every": 5000,
+    },
+    "scorer": {
+        "target_cities": settings.TARGET_CITIES,
+        "target_industries": settings.TARGET_INDUSTRIES,
+        "base_score": 10,
+        "weights": {},
+    },
+    "store": settings.LEAD_STORE_PATH,
+    "checkpoint": os.path.join(settings.OUTPUT_DIR, "checkpoint.json"),
+    "report_dir": settings.RUN_REPORT_DIR,
+    "exporters": [{"format": "csv", "path": os.path.join(settings.OUTPUT_DIR, "leads.csv")}],
+    "handoff": {
+        "path": None,           # file hand-off (format dari ekstensi); None = tidak dibuat
+        "k": 100,               # total lead, score tertinggi dulu (None = hanya per_segment)
+        "per_segment": None,    # maksimal lead per segment, mis. top-N per kota
+        "segment_by": None,     # location | industry | company_size
+        "min_score": None,      # mis. 50 = hanya lead High Potential
+    },
+    "crm": {
+        "url": settings.CRM_URL or None,  # None = tidak dikirim
+        "outbox": settings.CRM_OUTBOX_PATH,
+        "tag": "High Potential",          # hanya lead dengan tag ini (None = semua lead)
+        "batch_size": settings.CRM_BATCH_SIZE,
+        "workers": settings.CRM_WORKERS,
+        "rate": settings.CRM_RATE,        # request per detik (0 = tanpa batas)
+    },
+}
+
+
+def load_config(path=None, overrides=None):
+    """DEFAULT_CONFIG ← file config (JSON/TOML) ← overrides (dari flag CLI), lalu divalidasi"""
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    if path:
+        merge(config, read_config_file(path))
+    if overrides:
+        merge(config, overrides)
+    validate(config)
+    return config
+
+
+def read_config_file(path):
+    if path.endswith(".toml"):
+        import tomllib
+
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def merge(base, update):
+    """Deep merge `update` ke `base` (dict di-merge, nilai lain diganti)"""
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict) and key != "weights":
+            merge(base[key], value)
+        else:
+            base[key] = copy.deepcopy(value)
+    return base
+
+
+def validate(config):
+    """ValueError (bukan TypeError/KeyError) untuk config yang tidak valid: config juga datang dari body POST /jobs"""
+    unknown = set(config) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ValueError(f"unknown config section(s): {', '.join(sorted(unknown))}")
+    for section, default in DEFAULT_CONFIG.items():
+        if isinstance(default, (dict, list)) and not isinstance(config[section], type(default)):
+            kind = "table" if isinstance(default, dict) else "list"
+            raise ValueError(f"{section} must be a {kind}, got {config[section]!r}")
+    fetch, pipeline, scorer = config["fetch"], config["pipeline"], config["scorer"]
+    if fetch["source"] not in SOURCES:
+        raise ValueError(f"fetch.source must be one of {', '.join(SOURCES)}")
+    for section, key in (("fetch", "results"), ("fetch", "page_size"), ("fetch", "max_workers"),
+                         ("pipeline", "batch_size"), ("pipeline", "checkpoint_every")):
+        value = config[section][key]
+        if not _is_int(value) or value < 1:
+            raise ValueError(f"{section}.{key} must be a positive integer, got {value!r}")
+    if not _is_int(pipeline["workers"]) or pipeline["workers"] < 0:
+        raise ValueError(f"pipeline.workers must be >= 0, got {pipeline['workers']!r}")
+    if not _is_str_list(pipeline["stages"]):
+        raise ValueError(f"pipeline.stages must be a list of stage names, got {pipeline['stages']!r}")
+    unknown_stages = [stage for stage in pipeline["stages"] if stage not in STAGE_NAMES]
+    if unknown_stages:
+        raise ValueError(f"unknown stage(s): {', '.join(unknown_stages)}; available: {', '.join(STAGE_NAMES)}")
+    validate_scorer(scorer)
+    for exporter in config["exporters"]:
+        if not isinstance(exporter, dict) or not exporter.get("path"):
+            raise ValueError("every exporter needs a path")
+    handoff = config["handoff"]
+    if handoff["path"]:
+        for key in ("k", "per_segment"):
+            value = handoff[key]
+            if value is not None and (not isinstance(value, int) or value < 1):
+                raise ValueError(f"handoff.{key} must be a positive integer, got {value!r}")
+        if handoff["k"] is None and handoff["per_segment"] is None:
+            raise ValueError("handoff needs k, per_segment or both")
+        if handoff["per_segment"] is not None and handoff["segment_by"] not in HANDOFF_SEGMENTS:
+            raise ValueError(f"handoff.segment_by must be one of {', '.join(HANDOFF_SEGMENTS)}")
+    crm = config["crm"]
+    if crm["url"]:
+        for key in ("batch_size", "workers"):
+            if not isinstance(crm[key], int) or crm[key] < 1:
+                raise ValueError(f"crm.{key} must be a positive integer, got {crm[key]!r}")
+        if not crm["outbox"]:
+            raise ValueError("crm.outbox must be set when crm.url is set")
+    return config
+
+
+def validate_scorer(scorer):
+    unknown = set(scorer) - set(SCORER_KEYS)
+    if unknown:
+        raise ValueError(f"unknown scorer option(s): {', '.join(sorted(unknown))}; available: {', '.join(SCORER_KEYS)}")
+    for key in ("target_cities", "target_industries"):
+        if scorer.get(key) is not None and not _is_str_list(scorer[key]):
+            raise ValueError(f"scorer.{key} must be a list of strings, got {scorer[key]!r}")
+    for key in ("base_score", "max_score"):
+        if key in scorer and not _is_int(scorer[key]):
+            raise ValueError(f"scorer.{key} must be an integer, got {scorer[key]!r}")
+    weights = scorer.get("weights")
+    if weights is None:
+        return
+    if not isinstance(weights, dict):
+        raise ValueError(f"scorer.weights must be a table, got {weights!r}")
+    for key, value in weights.items():
+        # integer (city, industry) atau tabel nilai → integer (company_size, tags); score selalu int (LeadBatch)
+        values = value.values() if isinstance(value, dict) else [value]
+        if not all(_is_int(item) for item in values):
+            raise ValueError(f"scorer.weights.{key} must be an integer or a table of integers, got {value!r}")
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_str_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
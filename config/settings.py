@@ -1,2 +1,56 @@
+import os
+
 API_URL = "https://randomuser.me/api/"
 OUTPUT_DIR = "output/"
+
+# SQLite lead store untuk run incremental (lihat storage/lead_store.py); kosongkan untuk menonaktifkan
+LEAD_STORE_PATH = os.environ.get("LEAD_SCRAPER_STORE", os.path.join(OUTPUT_DIR, "leads.db"))
+
+# snapshot index kota geonames (lihat models/cities.py); kosongkan untuk menonaktifkan
+CITY_INDEX_CACHE = os.environ.get("LEAD_SCRAPER_CITY_CACHE", os.path.join(OUTPUT_DIR, "cache", "cities.pkl"))
+
+# cache hasil fetch APIScraper (lihat scraper/cache.py)
+FETCH_CACHE_SIZE = int(os.environ.get("LEAD_SCRAPER_FETCH_CACHE_SIZE", "32"))
+FETCH_CACHE_TTL = float(os.environ.get("LEAD_SCRAPER_FETCH_CACHE_TTL", "300"))
+FETCH_CACHE_DIR = os.environ.get("LEAD_SCRAPER_FETCH_CACHE_DIR") or None
+# stream yang lebih besar dari ini tidak di-cache (record tidak dikumpulkan di memory)
+FETCH_CACHE_MAX_RESULTS = int(os.environ.get("LEAD_SCRAPER_FETCH_CACHE_MAX_RESULTS", "10000"))
+
+# dataset untuk endpoint /leads di ui/flask_app.py (di-fetch sekali, lalu di-query dari index)
+API_DATASET_SIZE = int(os.environ.get("LEAD_SCRAPER_API_DATASET_SIZE", "500"))
+# batas limit & results untuk /leads?stream=1 (results = fetch live dari upstream)
+STREAM_MAX_RESULTS = int(os.environ.get("LEAD_SCRAPER_STREAM_MAX_RESULTS", "10000"))
+TARGET_CITIES = ["Jakarta"]
+TARGET_INDUSTRIES = ["Tech"]
+
+# jumlah lead yang di-load dashboard Streamlit (ui/streamlit_app.py)
+DASHBOARD_RESULTS = int(os.environ.get("LEAD_SCRAPER_DASHBOARD_RESULTS", "200"))
+
+# seed untuk nilai sintetis (company, position, industry, city, company_size) yang
+# diturunkan dari hash email — output sama di setiap run (lihat models/seeding.py)
+RANDOM_SEED = os.environ.get("LEAD_SCRAPER_SEED", "lead-scraper")
+
+# report per run dari main.py (waktu per stage, leads/s, memory, latency HTTP; lihat
+# monitoring/run_report.py); kosongkan untuk menonaktifkan
+RUN_REPORT_DIR = os.environ.get("LEAD_SCRAPER_REPORT_DIR", os.path.join(OUTPUT_DIR, "reports"))
+
+# profiling opt-in untuk satu run: "cpu", "memory" atau "all" (lihat monitoring/profiling.py)
+PROFILE = os.environ.get("LEAD_SCRAPER_PROFILE", "")
+PROFILE_DIR = os.environ.get("LEAD_SCRAPER_PROFILE_DIR", os.path.join(OUTPUT_DIR, "profiles"))
+
+# pengiriman lead ke CRM (lihat crm/pusher.py); kosongkan CRM_URL untuk mode simulasi
+CRM_URL = os.environ.get("LEAD_SCRAPER_CRM_URL", "")
+CRM_TOKEN = os.environ.get("LEAD_SCRAPER_CRM_TOKEN", "")
+CRM_OUTBOX_PATH = os.environ.get("LEAD_SCRAPER_CRM_OUTBOX", os.path.join(OUTPUT_DIR, "crm_outbox.db"))
+CRM_BATCH_SIZE = int(os.environ.get("LEAD_SCRAPER_CRM_BATCH_SIZE", "500"))
+CRM_WORKERS = int(os.environ.get("LEAD_SCRAPER_CRM_WORKERS", "4"))
+CRM_RATE = float(os.environ.get("LEAD_SCRAPER_CRM_RATE", "10"))  # request per detik
+
+# job pipeline di background untuk API (POST /jobs, lihat processors/jobs.py)
+JOB_DIR = os.environ.get("LEAD_SCRAPER_JOB_DIR", os.path.join(OUTPUT_DIR, "jobs"))
+JOB_WORKERS = int(os.environ.get("LEAD_SCRAPER_JOB_WORKERS", "2"))
+JOB_MAX_RESULTS = int(os.environ.get("LEAD_SCRAPER_JOB_MAX_RESULTS", "5000000"))
+# batas body job: thread fetch (fetch.max_workers) dan lead per page / batch (fetch.page_size,
+# pipeline.batch_size); pipeline.workers (proses) dibatasi JOB_WORKERS
+JOB_MAX_THREADS = int(os.environ.get("LEAD_SCRAPER_JOB_MAX_THREADS", "16"))
+JOB_MAX_BATCH_SIZE = int(os.environ.get("LEAD_SCRAPER_JOB_MAX_BATCH_SIZE", "5000"))
@@ -0,0 +1,247 @@
+"""
+Outbox persisten (SQLite) untuk pengiriman lead ke CRM: lead di-enqueue dulu,
+baru dikirim per batch oleh CRMPusher (crm/pusher.py). Batch yang gagal
+dijadwalkan ulang dengan backoff dan tetap ada di file, jadi proses yang
+berhenti di tengah bisa dilanjutkan tanpa kehilangan atau mengirim dobel.
+
+Satu baris per lead, key = idempotency key dari email (lead_key). Enqueue
+ulang lead yang sudah terkirim dengan payload sama tidak melakukan apa-apa;
+payload berubah → dikirim lagi (CRM meng-upsert berdasarkan key yang sama).
+
+Status: pending → in_flight → sent, atau kembali ke pending (retry) sampai
+max_attempts, lalu dead.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from config import settings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    key          TEXT PRIMARY KEY,
+    payload      TEXT NOT NULL,
+    status       TEXT NOT NULL DEFAULT 'pending',
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL DEFAULT 0,
+    last_error   TEXT,
+    updated_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox(status, next_attempt);
+"""
+
+STATUSES = ("pending", "in_flight", "sent", "dead")
+
+
+def lead_key(email):
+    """Idempotency key: hash dari email yang dinormalisasi (sama di setiap run & retry)"""
+    normalized = (email or "").strip().lower()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def lead_payload(lead):
+    """Lead / dict → record untuk CRM, termasuk idempotency_key"""
+    record = lead.to_dict() if hasattr(lead, "to_dict") else dict(lead)
+    record["idempotency_key"] = lead_key(record.get("email"))
+    return record
+
+
+class CRMOutbox:
+    """
+    path         : file SQLite (":memory:" untuk test)
+    max_attempts : jumlah percobaan per lead sebelum status dead
+    batch_size   : jumlah lead per transaksi enqueue
+    """
+
+    def __init__(self, path=settings.CRM_OUTBOX_PATH, max_attempts=5, batch_size=500):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.max_attempts = max_attempts
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            # in_flight dari proses yang mati di tengah kirim → kirim ulang (aman, idempotent)
+            self._conn.execute("UPDATE outbox SET status = 'pending' WHERE status = 'in_flight'")
+
+    # --- enqueue
+
+    def enqueue(self, leads):
+        """Tambah lead ke antrian; return jumlah lead baru / berubah yang perlu dikirim"""
+        queued = 0
+        batch = []
+        for lead in leads:
+            batch.append(lead)
+            if len(batch) >= self.batch_size:
+                queued += self._enqueue_batch(batch)
+                batch = []
+        if batch:
+            queued += self._enqueue_batch(batch)
+        return queued
+
+    def iter_enqueue(self, leads, tag=None):
+        """
+        Stage pass-through untuk LeadPipeline: semua lead diteruskan, yang punya
+        `tag` (None = semua) di-enqueue per batch
+        """
+        batch = []
+        selected = []
+        for lead in leads:
+            batch.append(lead)
+            if tag is None or tag in lead.tags:
+                selected.append(lead)
+            if len(batch) >= self.batch_size:
+                if selected:
+                    self._enqueue_batch(selected)
+                yield from batch
+                batch, selected = [], []
+        if selected:
+            self._enqueue_batch(selected)
+        yield from batch
+
+    def _enqueue_batch(self, leads):
+        now = time.time()
+        rows = []
+        for lead in leads:
+            record = lead_payload(lead)
+            rows.append((record["idempotency_key"], json.dumps(record, sort_keys=True), now))
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                """
+                INSERT INTO outbox (key, payload, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    payload = excluded.payload, status = 'pending', attempts = 0,
+                    next_attempt = 0, last_error = NULL, updated_at = excluded.updated_at
+                WHERE outbox.payload != excluded.payload OR outbox.status = 'dead'
+                """,
+                rows,
+            )
+            return self._conn.total_changes - before
+
+    # --- pengiriman (dipanggil CRMPusher, aman dari banyak thread)
+
+    def claim(self, limit, now=None, keys=None):
+        """
+        Ambil maksimal `limit` lead yang jatuh tempo → in_flight; return [(key, payload dict)].
+        keys: hanya lead dengan key ini (None = seluruh antrian)
+        """
+        now = time.time() if now is None else now
+        sql = "SELECT key, payload FROM outbox WHERE status = 'pending' AND next_attempt <= ?"
+        with self._lock, self._conn:
+            if keys is None:
+                rows = self._conn.execute(f"{sql} ORDER BY next_attempt, rowid LIMIT ?", (now, limit)).fetchall()
+            else:
+                rows = []
+                for chunk in _chunks(keys):
+                    rows += self._conn.execute(
+                        f"{sql} AND key IN ({','.join('?' * len(chunk))}) ORDER BY next_attempt, rowid LIMIT ?",
+                        (now, *chunk, limit - len(rows)),
+                    ).fetchall()
+                    if len(rows) >= limit:
+                        break
+            self._conn.executemany(
+                "UPDATE outbox SET status = 'in_flight', updated_at = ? WHERE key = ?",
+                [(now, key) for key, _ in rows],
+            )
+        return [(key, json.loads(payload)) for key, payload in rows]
+
+    # update hanya untuk baris in_flight: lead yang di-enqueue ulang (payload berubah)
+    # selama dikirim tetap pending dan ikut batch berikutnya
+
+    def mark_sent(self, keys):
+        self._update(keys, "UPDATE outbox SET status = 'sent', attempts = attempts + 1, last_error = NULL, "
+                           "updated_at = ? WHERE key = ? AND status = 'in_flight'")
+
+    def mark_dead(self, keys, error):
+        self._update(keys, "UPDATE outbox SET status = 'dead', attempts = attempts + 1, last_error = ?, "
+                           "updated_at = ? WHERE key = ? AND status = 'in_flight'", error)
+
+    def retry(self, keys, error, backoff=1.0):
+        """
+        Jadwalkan ulang dengan backoff eksponensial (backoff * 2**attempts);
+        yang sudah max_attempts kali gagal → dead. Return jumlah lead yang dead.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                UPDATE outbox SET attempts = attempts + 1, last_error = ?, updated_at = ?,
+                    status = CASE WHEN attempts + 1 >= ? THEN 'dead' ELSE 'pending' END,
+                    next_attempt = ? + ? * (1 << MIN(attempts, 16))
+                WHERE key = ? AND status = 'in_flight'
+                """,
+                [(error, now, self.max_attempts, now, backoff, key) for key in keys],
+            )
+            placeholders = ",".join("?" * len(keys))
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM outbox WHERE status = 'dead' AND key IN ({placeholders})", list(keys)
+            ).fetchone()[0] if keys else 0
+
+    def _update(self, keys, sql, *params):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(sql, [(*params, now, key) for key in keys])
+
+    # --- status
+
+    def next_due(self, keys=None):
+        """Waktu (time.time) lead pending berikutnya jatuh tempo, atau None jika tidak ada"""
+        sql = "SELECT MIN(next_attempt) FROM outbox WHERE status = 'pending'"
+        with self._lock:
+            if keys is None:
+                return self._conn.execute(sql).fetchone()[0]
+            due = [
+                self._conn.execute(f"{sql} AND key IN ({','.join('?' * len(chunk))})", chunk).fetchone()[0]
+                for chunk in _chunks(keys)
+            ]
+        due = [value for value in due if value is not None]
+        return min(due) if due else None
+
+    def statuses(self, keys):
+        """{key: status} untuk lead yang ada di outbox"""
+        result = {}
+        with self._lock:
+            for chunk in _chunks(keys):
+                result.update(self._conn.execute(
+                    f"SELECT key, status FROM outbox WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall())
+        return result
+
+    def counts(self):
+        """{status: jumlah lead}"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        counts = dict.fromkeys(STATUSES, 0)
+        counts.update(rows)
+        return counts
+
+    def requeue_dead(self):
+        """Kirim ulang lead yang dead (mis. setelah CRM diperbaiki)"""
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE outbox SET status = 'pending', attempts = 0, next_attempt = 0 WHERE status = 'dead'"
+            ).rowcount
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _chunks(keys, size=500):
+    # batas jumlah parameter SQLite per query
+    keys = list(keys)
+    for start in range(0, len(keys), size):
+        yield keys[start:start + size]
@@ -0,0 +1,180 @@
+"""
+Pengiriman lead ke CRM: lead dari CRMOutbox (crm/outbox.py) dikirim sebagai
+payload bulk (batch_size lead per request) oleh beberapa worker thread,
+dibatasi rate limiter (request/detik). Setiap lead membawa idempotency_key
+dari email, setiap request membawa header Idempotency-Key dari isi batch,
+jadi retry / kirim ulang aman.
+
+    with CRMOutbox(settings.CRM_OUTBOX_PATH) as outbox:
+        pusher = CRMPusher(settings.CRM_URL, outbox, batch_size=500, max_workers=4, rate=20)
+        stats = pusher.push(leads)      # enqueue + kirim lead ini sampai terkirim / dead
+
+Gagal sementara (429/5xx, koneksi / RequestException lain) → retry di dalam request (get_with_retry
+style), lalu batch dijadwalkan ulang di outbox dengan backoff; 4xx lain →
+dead (payload ditolak, retry tidak membantu). Metric ada di REGISTRY
+(/metrics): jumlah lead per hasil, latency per batch, isi antrian.
+"""
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from config import settings
+from monitoring.metrics import REGISTRY
+from crm.outbox import lead_payload
+from scraper.http_client import HostRateLimiter, build_session, request_with_retry
+
+CRM_LEADS = REGISTRY.counter(
+    "lead_scraper_crm_leads_total", "Lead yang diproses CRMPusher per hasil", labels=("result",),
+)
+CRM_BATCH_SECONDS = REGISTRY.histogram(
+    "lead_scraper_crm_batch_duration_seconds", "Latency request bulk ke CRM (termasuk retry)", labels=("result",),
+)
+CRM_QUEUE = REGISTRY.gauge("lead_scraper_crm_outbox_leads", "Isi outbox CRM per status", labels=("status",))
+
+
+class CRMPusher:
+    """
+    url         : endpoint bulk upsert CRM (POST {"leads": [...]})
+    outbox      : CRMOutbox
+    batch_size  : lead per request
+    max_workers : request paralel
+    rate        : maksimal request per detik (None = tanpa batas)
+    max_retries : retry di dalam satu request sebelum batch dijadwalkan ulang
+    backoff     : detik; dasar backoff retry (request & outbox)
+    wait        : tunggu batch yang dijadwalkan ulang sampai terkirim/dead (False = sekali jalan)
+    headers     : header tambahan (mis. Authorization)
+    """
+
+    @classmethod
+    def from_settings(cls, outbox, **kwargs):
+        """CRMPusher dengan URL, token, batch, worker & rate dari config/settings.py; kwargs menimpa"""
+        headers = {"Authorization": f"Bearer {settings.CRM_TOKEN}"} if settings.CRM_TOKEN else None
+        options = {"url": settings.CRM_URL, "batch_size": settings.CRM_BATCH_SIZE,
+                   "max_workers": settings.CRM_WORKERS, "rate": settings.CRM_RATE or None,
+                   "headers": headers, **kwargs}
+        return cls(outbox=outbox, **options)
+
+    def __init__(self, url, outbox, batch_size=500, max_workers=4, rate=None, max_retries=2,
+                 backoff=0.5, timeout=30, wait=True, headers=None):
+        self.url = url
+        self.outbox = outbox
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.rate_limiter = HostRateLimiter(rate) if rate else None
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.wait = wait
+        self.headers = dict(headers or {})
+        self.session = build_session(pool_size=max_workers)
+        self._stats_lock = threading.Lock()
+
+    def push(self, leads):
+        """
+        Enqueue lead lalu kirim lead tersebut (bukan seluruh antrian outbox); return stats.
+        stats["keys"] = idempotency key lead yang di-push, untuk CRMOutbox.statuses
+        """
+        leads = list(leads)
+        queued = self.outbox.enqueue(leads)
+        keys = [lead_payload(lead)["idempotency_key"] for lead in leads]
+        stats = self.drain(keys)
+        stats["queued"] = queued
+        stats["keys"] = keys
+        return stats
+
+    def drain(self, keys=None):
+        """
+        Kirim lead pending di outbox sampai habis (atau sampai yang tersisa belum jatuh tempo jika wait=False).
+        keys: hanya lead dengan key ini (None = seluruh antrian). Stats per panggilan, aman dipanggil bersamaan.
+        """
+        stats = {"sent": 0, "retried": 0, "dead": 0, "batches": 0, "seconds": 0.0}
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crm") as pool:
+            for future in [pool.submit(self._worker, stats, keys) for _ in range(self.max_workers)]:
+                future.result()
+        seconds = time.perf_counter() - start
+        stats["seconds"] = seconds
+        stats["leads_per_second"] = stats["sent"] / seconds if seconds else 0.0
+        stats["outbox"] = self.publish_queue()
+        return stats
+
+    def publish_queue(self):
+        counts = self.outbox.counts()
+        for status, count in counts.items():
+            CRM_QUEUE.set(count, status=status)
+        return counts
+
+    def _worker(self, stats, keys=None):
+        while True:
+            batch = self.outbox.claim(self.batch_size, keys=keys)
+            if batch:
+                try:
+                    self._send(batch, stats)
+                except Exception as exc:
+                    # error di luar HTTP (bug, payload tidak bisa di-encode): batch jangan tertinggal in_flight
+                    self.outbox.retry([key for key, _ in batch], f"{type(exc).__name__}: {exc}"[:200], self.backoff)
+                    raise
+                continue
+            due = self.outbox.next_due(keys)
+            if due is None or not self.wait:
+                return
+            # hanya batch yang menunggu backoff tersisa
+            time.sleep(min(max(0.0, due - time.time()), 1.0))
+
+    def _send(self, batch, stats):
+        keys = [key for key, _ in batch]
+        payloads = [payload for _, payload in batch]
+        headers = {**self.headers, "Idempotency-Key": batch_key(payloads)}
+        start = time.perf_counter()
+        try:
+            request_with_retry(
+                self.session, "POST", self.url, self.max_retries, self.backoff, self.timeout,
+                self.rate_limiter, json={"leads": payloads}, headers=headers,
+            ).close()
+        except requests.HTTPError as exc:
+            status = exc.response.status_code
+            if status < 500 and status != 429:
+                self.outbox.mark_dead(keys, f"HTTP {status}: {exc.response.text[:200]}")
+                self._record(stats, "dead", len(keys), start)
+                return
+            dead = self.outbox.retry(keys, f"HTTP {status}", self.backoff)
+            self._record(stats, "retried", len(keys) - dead, start, dead)
+            return
+        except requests.RequestException as exc:
+            # koneksi, timeout, redirect, body terputus, dll. → jadwalkan ulang
+            dead = self.outbox.retry(keys, f"{type(exc).__name__}: {exc}"[:200], self.backoff)
+            self._record(stats, "retried", len(keys) - dead, start, dead)
+            return
+        self.outbox.mark_sent(keys)
+        self._record(stats, "sent", len(keys), start)
+
+    def _record(self, stats, result, count, start, dead=0):
+        CRM_BATCH_SECONDS.observe(time.perf_counter() - start, result=result)
+        CRM_LEADS.inc(count, result=result)
+        if dead:
+            CRM_LEADS.inc(dead, result="dead")
+        with self._stats_lock:
+            stats["batches"] += 1
+            stats[result] += count
+            stats["dead"] += dead
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def batch_key(payloads):
+    """Idempotency-Key satu request: hash dari isi batch (urutan lead tidak berpengaruh)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for raw in sorted(json.dumps(payload, sort_keys=True) for payload in payloads):
+        digest.update(raw.encode("utf-8"))
+    return digest.hexdigest()
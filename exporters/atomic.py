@@ -0,0 +1,80 @@
+"""
+Helper tulis file secara atomic (tulis ke file sementara lalu rename) dengan
+kompresi opsional. Kalau proses crash di tengah export, file lama tetap utuh.
+"""
+import gzip
+import io
+import os
+import secrets
+from contextlib import contextmanager
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+
+def detect_compression(filename, compression="auto"):
+    """'auto' → tebak dari ekstensi (.gz / .zst); None → tanpa kompresi"""
+    if compression != "auto":
+        return compression
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(filename)[1].lower())
+
+
+@contextmanager
+def atomic_path(filename):
+    """Yield path sementara di folder yang sama; di-rename ke `filename` jika sukses"""
+    directory = os.path.dirname(filename) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = _create_temp(directory, os.path.basename(filename))
+    try:
+        yield tmp_path
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _create_temp(directory, basename):
+    # seperti mkstemp, tapi mode 0666: kernel menerapkan umask → hasil sama dengan open() biasa (mkstemp = 0600)
+    for _ in range(100):
+        path = os.path.join(directory, f".{basename}.{secrets.token_hex(6)}.tmp")
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+            return path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"no usable temporary file name in {directory}")
+
+
+@contextmanager
+def atomic_open(filename, compression="auto", newline=None, encoding="utf-8"):
+    """File text untuk ditulis secara atomic, opsional gzip/zstd"""
+    compression = detect_compression(filename, compression)
+    with atomic_path(filename) as tmp_path:
+        with open(tmp_path, "wb") as raw:
+            if compression == "gzip":
+                binary = gzip.GzipFile(fileobj=raw, mode="wb", mtime=0)
+            elif compression == "zstd":
+                binary = _zstd_writer(raw)
+            elif compression is None:
+                binary = raw
+            else:
+                raise ValueError(f"Unknown compression: {compression!r}")
+            text = io.TextIOWrapper(binary, encoding=encoding, newline=newline, write_through=False)
+            try:
+                yield text
+                text.flush()
+            finally:
+                if binary is not raw:
+                    text.close()
+                else:
+                    text.detach()
+            raw.flush()
+            os.fsync(raw.fileno())
+
+
+def _zstd_writer(raw):
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError("zstd compression requires the 'zstandard' package (pip install zstandard)") from exc
+    return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
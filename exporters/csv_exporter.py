@@ -1,9 +1,44 @@
-import pandas as pd
+import csv
 import os
+from itertools import islice
+from exporters.atomic import atomic_open
+from models.lead import Lead
 
 class CSVExporter:
+    def __init__(self, chunk_size=5000, compression="auto"):
+        """
+        chunk_size  : jumlah baris yang ditulis per writerows()
+        compression : "auto" (dari ekstensi .gz/.zst), "gzip", "zstd" atau None
+        """
+        self.chunk_size = chunk_size
+        self.compression = compression
+
     def export(self, leads, filename="output/leads.csv"):
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        df = pd.DataFrame([lead.to_dict() for lead in leads])
-        df.to_csv(filename, index=False)
+        """
+        Tulis lead per chunk; `leads` boleh list atau generator dari pipeline.
+        File ditulis ke file sementara lalu di-rename, jadi tidak pernah setengah jadi.
+        """
+        leads = iter(leads)
+        count = 0
+        with atomic_open(filename, self.compression, newline="") as f:
+            # lineterminator sama dengan DataFrame.to_csv
+            writer = csv.writer(f, lineterminator=os.linesep)
+            while True:
+                chunk = [self._row(lead) for lead in islice(leads, self.chunk_size)]
+                if not chunk:
+                    break
+                if count == 0:
+                    writer.writerow(Lead.FIELDS)
+                writer.writerows(chunk)
+                count += len(chunk)
+            if count == 0:
+                f.write(os.linesep)
         print(f"✅ Data exported to {filename}")
+        return count
+
+    @staticmethod
+    def _row(lead):
+        row = list(lead.to_record())
+        # sama seperti DataFrame.to_csv: list tags ditulis sebagai repr list
+        row[7] = str(list(row[7]))
+        return row
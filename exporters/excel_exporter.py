@@ -1,10 +1,21 @@
-import pandas as pd
+from openpyxl import Workbook
+from exporters.atomic import atomic_path
 
 class ExcelExporter:
     """Export leads ke Excel (.xlsx)"""
 
     def export(self, leads, filepath):
-        data = [lead.to_dict() for lead in leads]
-        df = pd.DataFrame(data)
-        df.to_excel(filepath, index=False, engine="openpyxl")
+        # write_only workbook: baris di-stream ke file, tidak disimpan semua di memory
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        count = 0
+        for lead in leads:
+            row = lead.to_dict()
+            if count == 0:
+                ws.append(list(row))
+            ws.append([str(v) if isinstance(v, list) else v for v in row.values()])
+            count += 1
+        with atomic_path(filepath) as tmp_path:
+            wb.save(tmp_path)
         print(f"[EXPORT] Data diekspor ke {filepath}")
+        return count
@@ -1,10 +1,41 @@
 import json
-import os
+from itertools import islice
+from exporters.atomic import atomic_open
 
 class JSONExporter:
+    def __init__(self, chunk_size=5000, indent=4, compression="auto"):
+        """
+        indent=4    : format sama seperti json.dump(data, indent=4)
+        indent=None : JSON compact (lebih kecil & cepat untuk data besar)
+        """
+        self.chunk_size = chunk_size
+        self.indent = indent
+        self.compression = compression
+
     def export(self, leads, filename="output/leads.json"):
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        data = [lead.to_dict() for lead in leads]
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=4)
+        """Tulis JSON array per chunk tanpa menampung semua lead di memory"""
+        leads = iter(leads)
+        if self.indent is None:
+            separator, encode = ",", json.JSONEncoder(separators=(",", ":")).encode
+        else:
+            pad = " " * self.indent
+            separator = ",\n" + pad
+            encoder = json.JSONEncoder(indent=self.indent)
+            # indent ulang supaya output sama persis dengan json.dump(data, indent=...)
+            encode = lambda d: encoder.encode(d).replace("\n", "\n" + pad)
+
+        count = 0
+        with atomic_open(filename, self.compression) as f:
+            f.write("[")
+            while True:
+                chunk = [encode(lead.to_dict()) for lead in islice(leads, self.chunk_size)]
+                if not chunk:
+                    break
+                f.write(separator if count else separator.lstrip(","))
+                f.write(separator.join(chunk))
+                count += len(chunk)
+            if count and self.indent is not None:
+                f.write("\n")
+            f.write("]")
         print(f"✅ Data exported to {filename}")
+        return count
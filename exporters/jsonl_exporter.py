@@ -0,0 +1,25 @@
+import json
+from itertools import islice
+from exporters.atomic import atomic_open
+
+class JSONLinesExporter:
+    """Export leads ke JSON Lines (.jsonl): satu objek JSON per baris"""
+
+    def __init__(self, chunk_size=5000, compression="auto"):
+        self.chunk_size = chunk_size
+        self.compression = compression
+
+    def export(self, leads, filename="output/leads.jsonl"):
+        leads = iter(leads)
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        count = 0
+        with atomic_open(filename, self.compression) as f:
+            while True:
+                chunk = [encode(lead.to_dict()) for lead in islice(leads, self.chunk_size)]
+                if not chunk:
+                    break
+                f.write("\n".join(chunk))
+                f.write("\n")
+                count += len(chunk)
+        print(f"✅ Data exported to {filename}")
+        return count
@@ -0,0 +1,164 @@
+"""
+Export/load leads dalam format kolumnar (Parquet atau Arrow IPC).
+
+Kolom kategori (position, location, industry, company_size) disimpan sebagai
+dictionary<int32, string>, tags sebagai list<string>, score int32 — tipe
+tetap benar saat dibaca lagi (tidak seperti CSV yang men-stringify tags).
+Butuh package `pyarrow`.
+"""
+import os
+from array import array
+from itertools import islice
+
+import numpy as np
+
+from exporters.atomic import atomic_path
+from models.lead import Lead
+from models.lead_batch import LeadBatch, CategoricalColumn
+
+CATEGORICAL = LeadBatch.CATEGORICAL
+FORMATS = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError("Parquet/Arrow export requires the 'pyarrow' package (pip install pyarrow)") from exc
+    return pyarrow
+
+
+def lead_schema():
+    pa = _require_pyarrow()
+    categorical = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("name", pa.string()),
+        ("email", pa.string()),
+        ("company", pa.string()),
+        ("position", categorical),
+        ("location", categorical),
+        ("industry", categorical),
+        ("company_size", categorical),
+        ("tags", pa.list_(pa.string())),
+        ("score", pa.int32()),
+    ])
+
+
+def detect_format(filename, fmt="auto"):
+    if fmt != "auto":
+        return fmt
+    return FORMATS.get(os.path.splitext(filename)[1].lower(), "parquet")
+
+
+class ParquetExporter:
+    """
+    batch_size  : jumlah lead per record batch / row group
+    compression : codec Parquet ("zstd", "snappy", None, ...)
+    fmt         : "auto" (dari ekstensi), "parquet" atau "arrow"
+    """
+
+    def __init__(self, batch_size=50_000, compression="zstd", fmt="auto"):
+        self.batch_size = batch_size
+        self.compression = compression
+        self.fmt = fmt
+
+    def export(self, leads, filename="output/leads.parquet"):
+        pa = _require_pyarrow()
+        fmt = detect_format(filename, self.fmt)
+        schema = lead_schema()
+        # dictionary dipakai terus antar batch → Arrow IPC cukup menulis delta
+        dictionaries = {field: CategoricalColumn() for field in CATEGORICAL}
+        leads = iter(leads)
+        count = 0
+        with atomic_path(filename) as tmp_path:
+            writer = self._open_writer(pa, fmt, tmp_path, schema)
+            try:
+                while True:
+                    chunk = list(islice(leads, self.batch_size))
+                    if not chunk:
+                        break
+                    writer.write_batch(self._record_batch(pa, schema, chunk, dictionaries))
+                    count += len(chunk)
+            finally:
+                writer.close()
+        print(f"✅ Data exported to {filename}")
+        return count
+
+    def _open_writer(self, pa, fmt, path, schema):
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(path, schema, compression=self.compression)
+        if fmt == "arrow":
+            import pyarrow.ipc as ipc
+            options = ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+            return ipc.new_file(path, schema, options=options)
+        raise ValueError(f"Unknown format: {fmt!r}")
+
+    @staticmethod
+    def _record_batch(pa, schema, chunk, dictionaries):
+        records = [lead.to_record() for lead in chunk]
+        name, email, company, position, location, industry, company_size, tags, score = zip(*records)
+        columns = [pa.array(name, pa.string()), pa.array(email, pa.string()), pa.array(company, pa.string())]
+        for field, values in zip(CATEGORICAL, (position, location, industry, company_size)):
+            column = dictionaries[field]
+            column.codes = array("I")
+            for value in values:
+                column.append(value)
+            indices = pa.array(np.frombuffer(column.codes, dtype=np.uint32).astype(np.int32))
+            columns.append(pa.DictionaryArray.from_arrays(indices, pa.array(column.categories, pa.string())))
+        columns.append(pa.array([list(t) for t in tags], pa.list_(pa.string())))
+        columns.append(pa.array(score, pa.int32()))
+        return pa.record_batch(columns, schema=schema)
+
+
+def read_table(filename, columns=None, filters=None, fmt="auto"):
+    """pyarrow.Table dari file; `filters` hanya untuk Parquet (mis. [("score", ">=", 50)])"""
+    _require_pyarrow()
+    fmt = detect_format(filename, fmt)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        return pq.read_table(filename, columns=columns, filters=filters)
+    import pyarrow.ipc as ipc
+    table = ipc.open_file(filename).read_all()
+    return table.select(columns) if columns else table
+
+
+def load_frame(filename, columns=None, filters=None, tags_as_list=True):
+    """
+    DataFrame dengan kolom kategori sebagai pd.Categorical dan tags sebagai list.
+    tags_as_list=False → tags tetap array numpy (lebih cepat untuk data besar).
+    """
+    frame = read_table(filename, columns, filters).to_pandas()
+    if tags_as_list and "tags" in frame:
+        frame["tags"] = [list(tags) for tags in frame["tags"]]
+    return frame
+
+
+def load_batch(filename, filters=None):
+    """LeadBatch langsung dari kode dictionary (tanpa objek Lead per baris)"""
+    table = read_table(filename, filters=filters).unify_dictionaries().combine_chunks()
+    batch = LeadBatch()
+    batch.names = table.column("name").to_pylist()
+    batch.emails = table.column("email").to_pylist()
+    batch.companies = table.column("company").to_pylist()
+    for field, attr in zip(CATEGORICAL, ("positions", "locations", "industries", "company_sizes")):
+        chunks = table.column(field).chunks
+        if chunks:
+            dictionary = chunks[0]
+            codes = array("I")
+            codes.frombytes(dictionary.indices.to_numpy(zero_copy_only=False).astype(np.uint32).tobytes())
+            column = CategoricalColumn.from_codes(codes, dictionary.dictionary.to_pylist())
+        else:
+            column = CategoricalColumn()
+        setattr(batch, attr, column)
+    for tags in table.column("tags").to_pylist():
+        batch.tags.append(tuple(tags) if tags else ())
+    batch.scores = array("i")
+    batch.scores.frombytes(table.column("score").to_numpy().astype(np.int32).tobytes())
+    return batch
+
+
+def load_leads(filename, filters=None):
+    """Iterator Lead dari file (untuk dipakai lagi di pipeline)"""
+    for record in load_batch(filename, filters).to_records():
+        yield Lead.from_record(record)
@@ -1,31 +1,150 @@
-from scraper.api_scraper import APIScraper
-from processors.filter import LeadFilter
-from processors.tagger import LeadTagger
-from processors.scorer import LeadScorer
-from exporters.csv_exporter import CSVExporter
-
-def main():
-    # fetch
-    scraper = APIScraper()
-    leads = scraper.fetch()
-    print(f"📥 {len(leads)} leads fetched.")
-
-    # deduplicate
-    lead_filter = LeadFilter()
-    leads = lead_filter.deduplicate(leads)
-    print(f"🔹 {len(leads)} unique leads after deduplication.")
-
-    # scoring
-    scorer = LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"])
-    leads = scorer.apply(leads)
-
-    # tagging
-    tagger = LeadTagger()
-    leads = tagger.tag_industry(leads)
-    leads = tagger.add_tag_high_potential(leads)
-
-    # export
-    CSVExporter().export(leads)
+"""
+Jalankan pipeline lead: fetch → deduplicate → (skip lead lama) → scoring →
+tagging → (simpan) → export. Semua bagian bisa diatur dari file config
+(JSON/TOML, lihat config/pipeline.py) atau flag; flag menimpa config.
+
+    python main.py
+    python main.py --config nightly.toml --resume
+    python main.py --results 100000 --page-size 5000 --workers 4 --export output/leads.parquet
+    python main.py --config nightly.toml --dry-run
+    python main.py --config nightly.toml --benchmark --results 200000
+    python main.py --handoff output/handoff.csv --top 200 --per-segment 20 --segment-by location
+"""
+import argparse
+import json
+
+from config import settings
+from config.pipeline import HANDOFF_SEGMENTS, STAGE_NAMES, load_config
+from monitoring.profiling import profile_run
+from processors.runner import PipelineRunner
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", help="file config JSON/TOML")
+    fetch = parser.add_argument_group("fetch")
+    fetch.add_argument("--source", choices=["api", "synthetic"])
+    fetch.add_argument("--results", type=int, help="jumlah lead yang di-fetch")
+    fetch.add_argument("--page-size", type=int)
+    fetch.add_argument("--max-workers", type=int, help="thread fetch paralel")
+    fetch.add_argument("--seed", help="seed randomuser (disarankan untuk --resume)")
+    pipeline = parser.add_argument_group("pipeline")
+    pipeline.add_argument("--stages", help=f"dipisah koma, dari: {', '.join(STAGE_NAMES)}")
+    pipeline.add_argument("--workers", type=int, help="proses untuk stage per-lead (0 = serial)")
+    pipeline.add_argument("--batch-size", type=int, help="batch commit store & chunk exporter")
+    pipeline.add_argument("--checkpoint-every", type=int, help="jumlah lead per checkpoint")
+    scorer = parser.add_argument_group("scorer")
+    scorer.add_argument("--target-city", action="append", help="bisa diulang")
+    scorer.add_argument("--target-industry", action="append", help="bisa diulang")
+    scorer.add_argument("--weight", action="append", metavar="KEY=VALUE", help="mis. city=40 (bisa diulang)")
+    output = parser.add_argument_group("output")
+    output.add_argument("--export", action="append", metavar="PATH",
+                        help="file export, format dari ekstensi (bisa diulang; menggantikan exporters di config)")
+    output.add_argument("--store", help="file SQLite lead store")
+    output.add_argument("--no-store", action="store_true", help="tanpa store (dan tanpa checkpoint)")
+    output.add_argument("--checkpoint", help="file checkpoint")
+    output.add_argument("--report-dir", help="folder run report (string kosong = tidak disimpan)")
+    handoff = parser.add_argument_group("hand-off (top-k streaming)")
+    handoff.add_argument("--handoff", metavar="PATH", help="file daftar hand-off, format dari ekstensi")
+    handoff.add_argument("--top", type=int, help="jumlah lead hand-off (score tertinggi dulu)")
+    handoff.add_argument("--per-segment", type=int, help="maksimal lead per segment")
+    handoff.add_argument("--segment-by", choices=HANDOFF_SEGMENTS)
+    handoff.add_argument("--min-score", type=int, help="mis. 50 = hanya High Potential")
+    crm = parser.add_argument_group("crm")
+    crm.add_argument("--crm-url", help="endpoint bulk CRM; lead High Potential dikirim setelah pipeline")
+    crm.add_argument("--crm-workers", type=int, help="request CRM paralel")
+    crm.add_argument("--crm-rate", type=float, help="maksimal request CRM per detik (0 = tanpa batas)")
+    crm.add_argument("--crm-outbox", help="file SQLite antrian retry CRM")
+    mode = parser.add_argument_group("mode")
+    mode.add_argument("--resume", action="store_true", help="lanjutkan dari checkpoint terakhir")
+    mode.add_argument("--dry-run", action="store_true", help="tampilkan rencana run tanpa fetch/tulis")
+    mode.add_argument("--benchmark", action="store_true",
+                      help="data sintetis offline, tanpa store, export ke folder sementara")
+    return parser
+
+
+def overrides_from_args(args):
+    """Flag yang diisi → dict dengan bentuk sama seperti file config"""
+    overrides = {"fetch": {}, "pipeline": {}, "scorer": {}, "handoff": {}, "crm": {}}
+    for key in ("source", "results", "page_size", "max_workers", "seed"):
+        if getattr(args, key) is not None:
+            overrides["fetch"][key] = getattr(args, key)
+    for key in ("workers", "batch_size", "checkpoint_every"):
+        if getattr(args, key) is not None:
+            overrides["pipeline"][key] = getattr(args, key)
+    if args.stages is not None:
+        overrides["pipeline"]["stages"] = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    if args.target_city:
+        overrides["scorer"]["target_cities"] = args.target_city
+    if args.target_industry:
+        overrides["scorer"]["target_industries"] = args.target_industry
+    if args.weight:
+        overrides["scorer"]["weights"] = dict(parse_weight(weight) for weight in args.weight)
+    if args.export:
+        overrides["exporters"] = [{"path": path} for path in args.export]
+    if args.store is not None:
+        overrides["store"] = args.store
+    if args.no_store:
+        overrides["store"] = None
+    if args.checkpoint is not None:
+        overrides["checkpoint"] = args.checkpoint
+    if args.report_dir is not None:
+        overrides["report_dir"] = args.report_dir
+    for key, dest in (("path", "handoff"), ("k", "top"), ("per_segment", "per_segment"),
+                      ("segment_by", "segment_by"), ("min_score", "min_score")):
+        if getattr(args, dest) is not None:
+            overrides["handoff"][key] = getattr(args, dest)
+    for key in ("url", "workers", "rate", "outbox"):
+        if getattr(args, f"crm_{key}") is not None:
+            overrides["crm"][key] = getattr(args, f"crm_{key}")
+    return overrides
+
+
+def parse_weight(value):
+    key, sep, number = value.partition("=")
+    try:
+        return key.strip(), int(number)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid weight {value!r}, expected KEY=INT") from None
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        config = load_config(args.config, overrides_from_args(args))
+    except (OSError, ValueError, argparse.ArgumentTypeError) as exc:
+        parser.error(str(exc))
+
+    runner = PipelineRunner(config, benchmark=args.benchmark)
+    if args.dry_run:
+        plan = runner.plan(resume=args.resume)
+        print(json.dumps(plan, indent=2))
+        return plan
+
+    report = runner.run(resume=args.resume)
+    stats = runner.stats
+    print(f"📥 {stats['fetched']} leads fetched.")
+    if "dedup" in config["pipeline"]["stages"]:
+        print(f"🔹 {stats['unique']} unique leads after deduplication.")
+    if runner.store is not None:
+        store = runner.store.stats
+        print(f"💾 {store['new']} new, {store['changed']} changed, {store['unchanged']} unchanged "
+              f"({stats['stored']} leads in store).")
+    if "handoff" in stats:
+        print(f"📋 {stats['handoff']} leads in hand-off list {config['handoff']['path']}.")
+    if "crm" in stats:
+        crm = stats["crm"]
+        print(f"🔗 {crm['sent']} leads sent to CRM in {crm['batches']} batches "
+              f"({crm['leads_per_second']:,.0f} leads/s); outbox: {crm['outbox']}.")
+    print(report.format())
+    if config["report_dir"]:
+        print(f"📊 Run report saved to {report.save(config['report_dir'])}")
+    return report
+
 
 if __name__ == "__main__":
-    main()
+    with profile_run(settings.PROFILE, settings.PROFILE_DIR) as profiles:
+        main()
+    for kind, path in profiles.items():
+        print(f"🔬 {kind} profile saved to {path}")
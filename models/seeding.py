@@ -0,0 +1,29 @@
+"""
+Sumber "acak" yang deterministik: nilai sintetis diturunkan dari hash stabil
+(blake2b) atas key lead — biasanya email — plus seed dan salt per field.
+
+Lead yang sama selalu mendapat company/position/industry/city yang sama, di
+setiap run dan di setiap proses, jadi hasil fetch/enrichment bisa di-cache,
+di-memoize dan dibandingkan antar benchmark. Ganti seed (settings.RANDOM_SEED
+atau argumen `seed`) untuk mendapat dataset sintetis lain.
+"""
+import hashlib
+
+from config import settings
+
+
+def stable_hash(key, salt="", seed=None):
+    """Integer 64-bit dari (seed, salt, key); tidak tergantung PYTHONHASHSEED"""
+    seed = settings.RANDOM_SEED if seed is None else seed
+    digest = hashlib.blake2b(
+        str(key).encode("utf-8"),
+        digest_size=8,
+        key=str(seed).encode("utf-8")[:64],
+        salt=str(salt).encode("utf-8")[:16],
+    )
+    return int.from_bytes(digest.digest(), "little")
+
+
+def stable_choice(options, key, salt="", seed=None):
+    """Pilih satu elemen `options` secara deterministik untuk `key`"""
+    return options[stable_hash(key, salt, seed) % len(options)]
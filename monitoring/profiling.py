@@ -0,0 +1,83 @@
+"""
+Profiling opt-in untuk satu run: cProfile (CPU) dan/atau tracemalloc (memory).
+
+    with profile_run(["cpu", "memory"], "output/profiles") as paths:
+        main()
+    # paths: {"cpu": ".../run-....prof", "cpu_text": ...txt, "memory": ...txt}
+
+File .prof bisa dibuka dengan `python -m pstats` atau snakeviz. cProfile hanya
+melihat thread pemanggil; waktu di worker fetch tetap terlihat sebagai stage
+"fetch" di RunReport.
+"""
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+PROFILE_KINDS = ("cpu", "memory")
+
+
+def parse_kinds(value):
+    """"cpu", "memory", "cpu,memory" atau "all" → list; string kosong → []"""
+    kinds = [kind.strip().lower() for kind in (value or "").split(",") if kind.strip()]
+    if "all" in kinds:
+        return list(PROFILE_KINDS)
+    unknown = set(kinds) - set(PROFILE_KINDS)
+    if unknown:
+        raise ValueError(f"unknown profile kind(s): {', '.join(sorted(unknown))}; use cpu, memory or all")
+    return kinds
+
+
+@contextmanager
+def profile_run(kinds, directory, name="run", top=30):
+    """Jalankan blok dengan profiler aktif lalu tulis hasilnya ke `directory`"""
+    kinds = parse_kinds(kinds) if isinstance(kinds, str) else list(kinds)
+    paths = {}
+    if not kinds:
+        yield paths
+        return
+
+    os.makedirs(directory, exist_ok=True)
+    prefix = os.path.join(directory, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}")
+    profiler = cProfile.Profile() if "cpu" in kinds else None
+    started_tracing = "memory" in kinds and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(10)
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield paths
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            paths["cpu"] = f"{prefix}.prof"
+            profiler.dump_stats(paths["cpu"])
+            paths["cpu_text"] = f"{prefix}-cpu.txt"
+            _write(paths["cpu_text"], _cpu_summary(profiler, top))
+        if "memory" in kinds:
+            paths["memory"] = f"{prefix}-memory.txt"
+            _write(paths["memory"], _memory_summary(top))
+            if started_tracing:
+                tracemalloc.stop()
+
+
+def _cpu_summary(profiler, top):
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(top)
+    return out.getvalue()
+
+
+def _memory_summary(top):
+    current, peak = tracemalloc.get_traced_memory()
+    lines = [f"current: {current / 2 ** 20:.1f} MiB, peak: {peak / 2 ** 20:.1f} MiB", ""]
+    for stat in tracemalloc.take_snapshot().statistics("lineno")[:top]:
+        lines.append(str(stat))
+    return "\n".join(lines) + "\n"
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
@@ -0,0 +1,270 @@
+"""
+Instrumentasi satu run pipeline: waktu per stage, leads/s, peak memory dan
+ringkasan latency HTTP, sebagai report terstruktur (dict/JSON) sekaligus
+metric di REGISTRY untuk /metrics.
+
+Stage pipeline saling menarik lead (generator), jadi waktu sebuah stage
+dihitung eksklusif: waktu next() stage itu dikurangi waktu menunggu stage
+sebelumnya. Jumlah waktu semua stage ≈ total waktu run.
+
+    report = RunReport()
+    pipeline = LeadPipeline(report=report)          # stage otomatis di-wrap
+    source = report.source("fetch", scraper.iter_fetch_concurrent(results=50))
+    pipeline.run_into(source, report.exporter("export.csv", CSVExporter()))
+    report.finish()
+    print(report.format())
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+
+from monitoring.metrics import HTTP_LATENCY, REGISTRY, quantile
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+STAGE_SECONDS = REGISTRY.counter(
+    "lead_scraper_stage_seconds_total", "Waktu eksklusif per stage pipeline", labels=("stage",)
+)
+STAGE_LEADS = REGISTRY.counter(
+    "lead_scraper_stage_leads_total", "Jumlah lead yang diproses per stage pipeline", labels=("stage",)
+)
+RUNS = REGISTRY.counter("lead_scraper_runs_total", "Jumlah run pipeline yang selesai")
+PEAK_MEMORY = REGISTRY.gauge("lead_scraper_peak_memory_bytes", "Peak resident memory proses")
+
+
+def peak_rss_bytes():
+    """Peak RSS proses (None jika tidak tersedia di platform ini)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KiB, macOS: byte
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageStats:
+    __slots__ = ("name", "items_in", "items_out", "seconds")
+
+    def __init__(self, name):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.seconds = 0.0
+
+    def to_dict(self):
+        processed = max(self.items_in, self.items_out)
+        return {
+            "stage": self.name,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "seconds": round(self.seconds, 6),
+            "leads_per_s": round(processed / self.seconds, 1) if self.seconds else None,
+        }
+
+
+class _TimedInput:
+    """Iterator input sebuah stage: hitung lead & waktu menunggu stage sebelumnya"""
+
+    def __init__(self, leads, stats):
+        self._leads = iter(leads)
+        self._stats = stats
+        self.waited = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = perf_counter()
+        try:
+            lead = next(self._leads)
+        finally:
+            self.waited += perf_counter() - start
+        self._stats.items_in += 1
+        return lead
+
+
+class _InstrumentedExporter:
+    def __init__(self, report, name, exporter):
+        self._report = report
+        self._name = name
+        self._exporter = exporter
+
+    def export(self, leads, *args, **kwargs):
+        stats = self._report.stage(self._name)
+        source = _TimedInput(leads, stats)
+        start = perf_counter()
+        try:
+            result = self._exporter.export(source, *args, **kwargs)
+        finally:
+            stats.seconds += perf_counter() - start - source.waited
+        stats.items_out = stats.items_in
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self._exporter, name)
+
+
+class RunReport:
+    def __init__(self, name="pipeline"):
+        self.name = name
+        self.stages = {}
+        self.started_at = time.time()
+        self.finished_at = None
+        self._start = perf_counter()
+        self._duration = None
+        self._http_before = HTTP_LATENCY.snapshot()
+        self._http = None
+        self._peak_rss = None
+        self._peak_traced = None
+
+    def stage(self, name):
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        return stats
+
+    def instrument(self, name, stage):
+        """Wrap stage `iterable -> iterable` supaya waktunya tercatat atas nama `name`"""
+        stats = self.stage(name)  # didaftarkan sekarang → urutan report = urutan pipeline
+
+        def timed(leads):
+            source = _TimedInput(leads, stats)
+            start = perf_counter()
+            output = iter(stage(source))
+            stats.seconds += perf_counter() - start - source.waited
+            while True:
+                start = perf_counter()
+                waited = source.waited
+                try:
+                    lead = next(output)
+                except StopIteration:
+                    return
+                finally:
+                    stats.seconds += perf_counter() - start - (source.waited - waited)
+                stats.items_out += 1
+                yield lead
+        return timed
+
+    def source(self, name, leads):
+        """Wrap sumber lead (scraper): semua waktu next() dihitung untuk `name`"""
+        return self._timed_source(self.stage(name), iter(leads))
+
+    @staticmethod
+    def _timed_source(stats, leads):
+        while True:
+            start = perf_counter()
+            try:
+                lead = next(leads)
+            except StopIteration:
+                return
+            finally:
+                stats.seconds += perf_counter() - start
+            stats.items_out += 1
+            yield lead
+
+    def exporter(self, name, exporter):
+        """Exporter dengan export() yang tercatat; atribut lain diteruskan"""
+        return _InstrumentedExporter(self, name, exporter)
+
+    @contextmanager
+    def timed(self, name, items=None):
+        """Untuk langkah non-streaming: `with report.timed("process", len(leads)):`"""
+        stats = self.stage(name)
+        start = perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.seconds += perf_counter() - start
+            if items is not None:
+                stats.items_in += items
+                stats.items_out += items
+
+    def finish(self):
+        """Tutup run: hitung durasi, memory & HTTP, lalu publish ke REGISTRY"""
+        if self._duration is not None:
+            return self
+        self._duration = perf_counter() - self._start
+        self.finished_at = time.time()
+        self._peak_rss = peak_rss_bytes()
+        if tracemalloc.is_tracing():
+            self._peak_traced = tracemalloc.get_traced_memory()[1]
+        self._http = _http_delta(self._http_before, HTTP_LATENCY.snapshot())
+
+        for stats in self.stages.values():
+            STAGE_SECONDS.inc(stats.seconds, stage=stats.name)
+            STAGE_LEADS.inc(max(stats.items_in, stats.items_out), stage=stats.name)
+        RUNS.inc()
+        if self._peak_rss is not None:
+            PEAK_MEMORY.set_max(self._peak_rss)
+        return self
+
+    def to_dict(self):
+        self.finish()
+        return {
+            "name": self.name,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            "duration_s": round(self._duration, 6),
+            "peak_rss_bytes": self._peak_rss,
+            "peak_traced_bytes": self._peak_traced,
+            "stages": [stats.to_dict() for stats in self.stages.values()],
+            "http": self._http,
+        }
+
+    def save(self, directory):
+        """Simpan report sebagai JSON di `directory`; return path file"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.name}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def format(self):
+        """Tabel ringkas untuk dicetak di akhir run"""
+        report = self.to_dict()
+        lines = [f"⏱️  {report['name']}: {report['duration_s']:.3f}s"]
+        for stage in report["stages"]:
+            rate = f"{stage['leads_per_s']:>12,.0f} leads/s" if stage["leads_per_s"] else f"{'-':>12} leads/s"
+            lines.append(
+                f"   {stage['stage']:<36} {stage['seconds'] * 1000:>9.1f} ms  {rate}"
+                f"  ({stage['items_in']} → {stage['items_out']})"
+            )
+        for host, summary in report["http"].items():
+            p50 = summary["p50_s"] * 1000 if summary["p50_s"] is not None else 0
+            p99 = summary["p99_s"] * 1000 if summary["p99_s"] is not None else 0
+            lines.append(f"   http {host}: {summary['requests']} requests, p50 {p50:.0f} ms, p99 {p99:.0f} ms")
+        if report["peak_rss_bytes"]:
+            lines.append(f"   peak memory: {report['peak_rss_bytes'] / 2 ** 20:.1f} MiB")
+        return "\n".join(lines)
+
+
+def _http_delta(before, after):
+    """Ringkasan latency HTTP selama run, per host: jumlah request, status, p50/p95/p99"""
+    hosts = {}
+    for (host, status), (counts, total, count) in after.items():
+        prev_counts, prev_total, prev_count = before.get((host, status), ([0] * len(counts), 0.0, 0))
+        count -= prev_count
+        if not count:
+            continue
+        entry = hosts.setdefault(host, {"counts": [0] * len(counts), "total": 0.0, "statuses": {}})
+        entry["counts"] = [a + b - c for a, b, c in zip(entry["counts"], counts, prev_counts)]
+        entry["total"] += total - prev_total
+        entry["statuses"][status] = count
+
+    summary = {}
+    for host, entry in hosts.items():
+        requests = sum(entry["counts"])
+        summary[host] = {
+            "requests": requests,
+            "statuses": entry["statuses"],
+            "mean_s": round(entry["total"] / requests, 6),
+            "p50_s": quantile(HTTP_LATENCY.buckets, entry["counts"], 0.5),
+            "p95_s": quantile(HTTP_LATENCY.buckets, entry["counts"], 0.95),
+            "p99_s": quantile(HTTP_LATENCY.buckets, entry["counts"], 0.99),
+        }
+    return summary
@@ -0,0 +1,149 @@
+"""
+Keyword → industry classifier dipakai bersama oleh LeadTagger (position)
+dan LeadEnricher (company).
+
+Semua keyword dikompilasi sekali ke automaton Aho–Corasick, jadi satu teks
+cukup di-scan satu kali berapapun jumlah keyword-nya. Kalau beberapa
+industry cocok, yang menang adalah industry yang muncul paling awal di
+keyword map — sama dengan loop `for key, keywords in map: if any(...)`.
+"""
+from functools import lru_cache
+
+# keyword dari LeadTagger.tag_industry (dicocokkan ke position)
+POSITION_KEYWORDS = {
+    "Tech": ["software", "developer", "engineer"],
+    "Finance": ["finance", "bank", "investment"],
+    "Retail": ["retail", "store", "shop"],
+    "Healthcare": ["health", "medical", "clinic"]
+}
+
+# keyword dari LeadEnricher._enrich_industry (dicocokkan ke company)
+COMPANY_KEYWORDS = {
+    "Tech": ["tech"],
+    "Education": ["edu"],
+    "Healthcare": ["health"],
+}
+
+
+class KeywordAutomaton:
+    """Aho–Corasick: cari semua keyword (substring) dalam satu pass"""
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        # prioritas terbaik (angka terkecil) yang berakhir di node ini, termasuk via fail link
+        self._best = [None]
+        self._compiled = False
+
+    def add(self, keyword, priority):
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(None)
+            node = nxt
+        self._best[node] = _min_priority(self._best[node], priority)
+        self._compiled = False
+
+    def compile(self):
+        # BFS untuk fail link
+        queue = list(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._best[child] = _min_priority(self._best[child], self._best[self._fail[child]])
+        self._compiled = True
+        return self
+
+    def best_match(self, text):
+        """Prioritas terkecil dari keyword yang muncul di `text`, atau None"""
+        if not self._compiled:
+            self.compile()
+        goto, fail, best_at = self._goto, self._fail, self._best
+        node = 0
+        best = None
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            found = best_at[node]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+        return best
+
+
+def _min_priority(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+class IndustryClassifier:
+    """
+    keyword_map : {industry: [keyword, ...]} — urutan key = prioritas
+    default     : industry jika tidak ada keyword yang cocok
+    cache_size  : jumlah teks unik yang hasilnya di-cache (position/company sering berulang)
+    """
+
+    def __init__(self, keyword_map, default="General", cache_size=4096):
+        self.keyword_map = {industry: list(keywords) for industry, keywords in keyword_map.items()}
+        self.default = default
+        self.cache_size = cache_size
+        self.industries = list(self.keyword_map)
+        self._automaton = KeywordAutomaton()
+        for priority, keywords in enumerate(self.keyword_map.values()):
+            for keyword in keywords:
+                if keyword:
+                    self._automaton.add(keyword.lower(), priority)
+        self._automaton.compile()
+        self._classify_cached = lru_cache(maxsize=cache_size)(self._classify) if cache_size else self._classify
+
+    def __reduce__(self):
+        # automaton & lru_cache tidak bisa di-pickle → dibangun ulang di proses tujuan
+        return IndustryClassifier, (self.keyword_map, self.default, self.cache_size)
+
+    def classify(self, text):
+        """Industry untuk `text` (case-insensitive substring match), atau default"""
+        if not text:
+            return self.default
+        return self._classify_cached(text)
+
+    def classify_many(self, texts):
+        """Klasifikasi batch; tiap teks unik hanya di-scan sekali"""
+        results = {}
+        return [
+            results[text] if text in results else results.setdefault(text, self.classify(text))
+            for text in texts
+        ]
+
+    def _classify(self, text):
+        priority = self._automaton.best_match(text.lower())
+        return self.default if priority is None else self.industries[priority]
+
+
+@lru_cache(maxsize=None)
+def position_classifier():
+    return IndustryClassifier(POSITION_KEYWORDS)
+
+
+@lru_cache(maxsize=None)
+def company_classifier():
+    return IndustryClassifier(COMPANY_KEYWORDS)
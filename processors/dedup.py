@@ -0,0 +1,205 @@
+"""
+Fuzzy deduplication.
+
+Dua lead dianggap duplikat jika:
+  - email ternormalisasi sama (case, +alias, titik gmail), atau
+  - berada di block yang sama (company + soundex nama belakang + inisial)
+    dan kemiripan nama (MinHash atas 3-gram) >= threshold.
+
+Kandidat dalam block dicari lewat LSH banding, jadi tiap lead hanya
+dibandingkan dengan segelintir kandidat — tidak kuadratik meski jutaan lead.
+Lead pertama yang terlihat jadi representative; yang lain dicatat di cluster.
+"""
+import unicodedata
+import zlib
+from collections import namedtuple
+import random
+
+import numpy as np
+
+GMAIL_DOMAINS = {"gmail.com", "googlemail.com"}
+
+DedupResult = namedtuple("DedupResult", ["unique", "clusters"])
+
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 31) - 1
+
+
+def normalize_email(email):
+    """'John.Doe+crm@GoogleMail.com ' → 'johndoe@gmail.com'"""
+    email = (email or "").strip().lower()
+    local, sep, domain = email.rpartition("@")
+    if not sep:
+        return email
+    local = local.split("+", 1)[0]
+    if domain in GMAIL_DOMAINS:
+        local = local.replace(".", "")
+        domain = "gmail.com"
+    return f"{local}@{domain}"
+
+
+def fold_text(text):
+    """Lowercase, tanpa aksen, spasi dirapikan"""
+    if not text:
+        return ""
+    if text.isascii():
+        return " ".join(text.lower().split())
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"), "l": "4", **dict.fromkeys("mn", "5"), "r": "6",
+}
+
+
+def soundex(word):
+    letters = [ch for ch in fold_text(word) if ch.isalpha()]
+    if not letters:
+        return ""
+    first = letters[0]
+    codes = []
+    previous = _SOUNDEX_CODES.get(first, "")
+    for ch in letters[1:]:
+        code = _SOUNDEX_CODES.get(ch, "")
+        if code and code != previous:
+            codes.append(code)
+        if ch not in "hw":
+            previous = code
+    return (first.upper() + "".join(codes) + "000")[:4]
+
+
+def block_key(lead):
+    """Blocking key: company ternormalisasi + soundex nama belakang + inisial depan"""
+    parts = fold_text(lead.name).split()
+    first = parts[0][:1] if parts else ""
+    last = soundex(parts[-1]) if parts else ""
+    return (fold_text(lead.company), last, first)
+
+
+def shingles(text, k=3):
+    text = f" {fold_text(text)} "
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+class MinHasher:
+    def __init__(self, num_perm=32, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        # a, h < 2**31 → a * h + b muat di uint64 tanpa overflow
+        self._a = np.array([rng.randrange(1, 1 << 31) for _ in range(num_perm)], dtype=np.uint64)[:, None]
+        self._b = np.array([rng.randrange(0, 1 << 31) for _ in range(num_perm)], dtype=np.uint64)[:, None]
+
+    def signature(self, tokens):
+        # crc32 → stabil antar proses (tidak tergantung PYTHONHASHSEED)
+        hashes = np.fromiter(
+            (zlib.crc32(token.encode("utf-8")) & _MAX_HASH for token in tokens), dtype=np.uint64, count=len(tokens)
+        )
+        return tuple(((self._a * hashes + self._b) % _PRIME).min(axis=1).tolist())
+
+    @staticmethod
+    def similarity(sig_a, sig_b):
+        return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+class DuplicateCluster:
+    """Satu representative + lead lain yang di-merge ke dalamnya"""
+
+    def __init__(self, kept):
+        self.kept = kept
+        self.duplicates = []  # [(lead, reason, similarity)]
+
+    def add(self, lead, reason, similarity=1.0):
+        self.duplicates.append((lead, reason, similarity))
+
+    def to_dict(self):
+        return {
+            "kept": self.kept.email,
+            "duplicates": [
+                {"email": lead.email, "name": lead.name, "reason": reason, "similarity": round(similarity, 3)}
+                for lead, reason, similarity in self.duplicates
+            ],
+        }
+
+    def __repr__(self):
+        return f"<DuplicateCluster {self.kept.email} +{len(self.duplicates)}>"
+
+
+class LeadDeduplicator:
+    """
+    threshold : minimal estimasi Jaccard nama (0..1) untuk dianggap duplikat
+    num_perm  : panjang signature MinHash
+    bands     : jumlah band LSH (num_perm harus habis dibagi bands)
+    """
+
+    def __init__(self, threshold=0.8, num_perm=32, bands=8):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self.reset()
+
+    def reset(self):
+        self._block_ids = {}
+        self._by_email = {}
+        self._buckets = {}
+        self._clusters = {}
+
+    @property
+    def clusters(self):
+        """Cluster yang benar-benar berisi duplikat, urut sesuai representative"""
+        return [cluster for cluster in self._clusters.values() if cluster.duplicates]
+
+    def run(self, leads):
+        unique = list(self.iter_unique(leads))
+        return DedupResult(unique, self.clusters)
+
+    def deduplicate(self, leads):
+        return list(self.iter_unique(leads))
+
+    def iter_unique(self, leads):
+        """Streaming: yield representative saat pertama kali terlihat"""
+        for lead in leads:
+            email_key = normalize_email(lead.email)
+            kept = self._by_email.get(email_key)
+            if kept is not None:
+                self._clusters[id(kept)].add(lead, "email")
+                continue
+
+            block = self._block_ids.setdefault(block_key(lead), len(self._block_ids))
+            signature = self.hasher.signature(shingles(lead.name))
+            match, similarity = self._find_similar(block, signature)
+            if match is not None:
+                self._by_email[email_key] = match
+                self._clusters[id(match)].add(lead, "name+company", similarity)
+                continue
+
+            self._by_email[email_key] = lead
+            self._clusters[id(lead)] = DuplicateCluster(lead)
+            for band_key in self._band_keys(block, signature):
+                self._buckets.setdefault(band_key, []).append((lead, signature))
+            yield lead
+
+    def _band_keys(self, block, signature):
+        # block berupa id integer → hash band key murah
+        rows = self.rows
+        return [(block, band) + signature[band * rows:(band + 1) * rows] for band in range(self.bands)]
+
+    def _find_similar(self, block, signature):
+        best, best_similarity = None, 0.0
+        seen = set()
+        for band_key in self._band_keys(block, signature):
+            for candidate, candidate_sig in self._buckets.get(band_key, ()):
+                if id(candidate) in seen:
+                    continue
+                seen.add(id(candidate))
+                similarity = MinHasher.similarity(signature, candidate_sig)
+                if similarity >= self.threshold and similarity > best_similarity:
+                    best, best_similarity = candidate, similarity
+        return best, best_similarity
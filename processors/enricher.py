@@ -1,33 +1,36 @@
-import random
+from models.seeding import stable_choice
+from processors.classifier import IndustryClassifier, company_classifier
 
 class LeadEnricher:
     """Class untuk enrichment lead: company size, industry, missing info"""
 
-    def __init__(self, default_company_sizes=None):
+    def __init__(self, default_company_sizes=None, company_keywords=None, seed=None):
+        """
+        seed : company_size untuk lead tanpa data diturunkan dari hash (seed, email);
+               None = settings.RANDOM_SEED. Enrichment jadi fungsi murni: hasil sama
+               di setiap run dan tidak tergantung urutan/pembagian shard
+        """
         self.default_company_sizes = default_company_sizes or ["Small", "Medium", "Large"]
+        self.classifier = IndustryClassifier(company_keywords) if company_keywords else company_classifier()
+        self.seed = seed
 
     def enrich_leads(self, leads):
+        return list(self.iter_enrich_leads(leads))
+
+    def iter_enrich_leads(self, leads):
         for lead in leads:
             self._enrich_company_size(lead)
             self._enrich_industry(lead)
             self._flag_missing_info(lead)
-        return leads
+            yield lead
 
     def _enrich_company_size(self, lead):
         if not getattr(lead, "company_size", None) or lead.company_size == "Unknown":
-            lead.company_size = random.choice(self.default_company_sizes)
+            lead.company_size = stable_choice(self.default_company_sizes, lead.email, "company_size", self.seed)
 
     def _enrich_industry(self, lead):
         if not getattr(lead, "industry", None) or lead.industry in [None, "General", "Unknown"]:
-            company_name = getattr(lead, "company", "").lower()
-            if "tech" in company_name:
-                lead.industry = "Tech"
-            elif "edu" in company_name:
-                lead.industry = "Education"
-            elif "health" in company_name:
-                lead.industry = "Healthcare"
-            else:
-                lead.industry = "General"
+            lead.industry = self.classifier.classify(getattr(lead, "company", ""))
 
     def _flag_missing_info(self, lead):
         missing = any([
@@ -0,0 +1,116 @@
+"""
+Executor untuk stage processor per-lead (enricher, scorer, tagger).
+
+    executor = ProcessExecutor(workers=4)
+    pipeline.add_stage(lead_filter.iter_deduplicate)          # stateful → tetap di proses utama
+    pipeline.add_stage(executor.stage(enricher.iter_enrich_leads, scorer.iter_apply, tagger.iter_tag_industry))
+
+Hanya untuk stage yang memproses tiap lead secara independen: dedup dan stage
+lain yang butuh melihat lead sebelumnya tidak boleh di-shard. Stage harus bisa
+di-pickle (bound method processor bisa, lambda tidak). Shard dikirim ke
+worker sebagai record tuple (Lead.to_record), bukan objek Lead, dan hasilnya
+dikembalikan sesuai urutan input.
+"""
+import multiprocessing
+import os
+from collections import deque
+from itertools import islice
+
+from models.lead import Lead
+
+
+class SerialExecutor:
+    """Menjalankan stage di proses ini (default; dipakai juga sebagai pembanding)"""
+
+    def map(self, stages, leads):
+        leads = iter(leads)
+        for stage in stages:
+            leads = stage(leads)
+        return leads
+
+    def stage(self, *stages):
+        """Gabungkan beberapa stage jadi satu stage untuk LeadPipeline.add_stage"""
+        return lambda leads: self.map(stages, leads)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ProcessExecutor(SerialExecutor):
+    """
+    workers     : jumlah proses (default os.cpu_count())
+    shard_size  : jumlah lead per shard yang dikirim ke worker
+    max_pending : shard yang boleh in-flight sekaligus (default 2 × workers),
+                  supaya input streaming tidak dibaca habis ke memory
+    """
+
+    def __init__(self, workers=None, shard_size=2000, max_pending=None, mp_context=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.max_pending = max_pending or 2 * self.workers
+        self.mp_context = mp_context
+        self._pool = None
+        self._pool_stages = None
+
+    def map(self, stages, leads):
+        pool = self._get_pool(tuple(stages))
+        leads = iter(leads)
+        pending = deque()
+        while True:
+            while len(pending) < self.max_pending:
+                shard = [_dump(lead) for lead in islice(leads, self.shard_size)]
+                if not shard:
+                    break
+                pending.append(pool.apply_async(_process_shard, (shard,)))
+            if not pending:
+                return
+            # urutan hasil = urutan shard dikirim
+            for row in pending.popleft().get():
+                yield _load(row)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _get_pool(self, stages):
+        # stage di-pickle sekali per worker (initializer), bukan per shard
+        if self._pool is None or self._pool_stages != stages:
+            self.close()
+            context = multiprocessing.get_context(self.mp_context)
+            self._pool = context.Pool(self.workers, initializer=_init_worker, initargs=(stages,))
+            self._pool_stages = stages
+        return self._pool
+
+
+# --- sisi worker
+
+_worker_stages = ()
+
+
+def _init_worker(stages):
+    global _worker_stages
+    _worker_stages = stages
+
+
+def _process_shard(shard):
+    leads = SerialExecutor().map(_worker_stages, (_load(row) for row in shard))
+    return [_dump(lead) for lead in leads]
+
+
+def _dump(lead):
+    return lead.to_record(), lead.missing_info
+
+
+def _load(row):
+    record, missing_info = row
+    lead = Lead.from_record(record)
+    lead.missing_info = missing_info
+    return lead
@@ -1,21 +1,79 @@
+from processors.dedup import LeadDeduplicator
+from storage.lead_index import ANY
+
+
 class LeadFilter:
-    """Filter leads by criteria and deduplicate"""
+    """
+    Filter leads by criteria and deduplicate
+
+    index : LeadIndex opsional (storage/lead_index.py); filter pada list berisi
+            lead yang sama dengan snapshot index dijawab dari index tanpa scan
+
+    None dan "All" berarti tanpa filter, baik lewat index maupun scan.
+    """
+
+    def __init__(self, index=None):
+        self.index = index
 
     def filter_by_location(self, leads, location):
-        if location == "All":
+        if location in ANY:
             return leads
-        return [lead for lead in leads if lead.location == location]
+        if self._indexed(leads):
+            return self.index.filter(location=location)
+        return list(self.iter_filter_by_location(leads, location))
 
     def filter_by_industry(self, leads, industry):
-        if industry == "All":
+        if industry in ANY:
             return leads
-        return [lead for lead in leads if lead.industry == industry]
+        if self._indexed(leads):
+            return self.index.filter(industry=industry)
+        return list(self.iter_filter_by_industry(leads, industry))
+
+    def filter(self, leads, location="All", industry="All", company_size="All", tags=None, min_score=None):
+        """Semua kriteria sekaligus ("All" = tanpa filter); tags harus dimiliki semua"""
+        if self._indexed(leads):
+            return self.index.filter(
+                location=location, industry=industry, company_size=company_size, tags=tags, min_score=min_score,
+            )
+        criteria = [(field, value) for field, value in
+                    (("location", location), ("industry", industry), ("company_size", company_size))
+                    if value not in ANY]
+        return [
+            lead for lead in leads
+            if all(getattr(lead, field) == value for field, value in criteria)
+            and all(tag in lead.tags for tag in tags or ())
+            and (min_score is None or lead.score >= min_score)
+        ]
 
     def deduplicate(self, leads):
-        seen = set()
-        unique = []
+        return list(self.iter_deduplicate(leads))
+
+    def fuzzy_deduplicate(self, leads, threshold=0.8):
+        """
+        Dedup dengan email ternormalisasi + kemiripan nama per company.
+        Return DedupResult(unique, clusters) — cluster berisi lead yang di-merge.
+        """
+        return LeadDeduplicator(threshold=threshold).run(leads)
+
+    def _indexed(self, leads):
+        return self.index is not None and self.index.covers(leads)
+
+    # --- streaming versions: terima iterable, yield lead satu per satu
+
+    def iter_filter_by_location(self, leads, location):
+        for lead in leads:
+            if location in ANY or lead.location == location:
+                yield lead
+
+    def iter_filter_by_industry(self, leads, industry):
+        for lead in leads:
+            if industry in ANY or lead.industry == industry:
+                yield lead
+
+    def iter_deduplicate(self, leads, seen=None):
+        # seen bisa dibagi antar panggilan (mis. run per chunk di processors/runner.py)
+        seen = set() if seen is None else seen
         for lead in leads:
             if lead.email not in seen:
                 seen.add(lead.email)
-                unique.append(lead)
-        return unique
+                yield lead
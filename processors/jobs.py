@@ -0,0 +1,168 @@
+"""
+Antrian job pipeline di background untuk API (POST /jobs di ui/flask_app.py):
+run besar (jutaan lead) berjalan di worker thread, bukan di dalam request HTTP.
+
+Body job = potongan config pipeline (section fetch, pipeline, scorer; lihat
+config/pipeline.py) + "format" hasil. Lokasi store, checkpoint dan file hasil
+ditentukan server: satu folder per job di JOB_DIR. Progress (lead yang sudah
+diproses) dan waktu per stage ditulis ke JobStore setelah setiap chunk.
+
+    queue = JobQueue("output/jobs", workers=2)
+    job = queue.submit({"fetch": {"results": 1_000_000, "page_size": 5000}, "format": "jsonl"})
+    queue.get(job["id"])      # status, processed/total, stages, result_count
+    queue.result_path(job["id"])
+"""
+import copy
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import settings
+from config.pipeline import load_config
+from processors.runner import PipelineRunner
+from storage.job_store import JobStore
+
+# format hasil → (nama file, mimetype)
+RESULT_FORMATS = {
+    "jsonl": ("leads.jsonl", "application/x-ndjson"),
+    "csv": ("leads.csv", "text/csv"),
+    "json": ("leads.json", "application/json"),
+}
+JOB_SECTIONS = ("fetch", "pipeline", "scorer")
+
+
+class JobQueue:
+    """
+    directory       : folder job (jobs.db + satu subfolder per job)
+    workers         : job yang berjalan bersamaan
+    max_results     : batas fetch.results per job (batas lain dari JOB_MAX_THREADS / JOB_MAX_BATCH_SIZE;
+                      pipeline.checkpoint_every maksimal JOB_MAX_BATCH_SIZE * 20)
+    scraper_factory : callable(config) → scraper (default dari fetch.source)
+    """
+
+    def __init__(self, directory=settings.JOB_DIR, workers=settings.JOB_WORKERS,
+                 max_results=settings.JOB_MAX_RESULTS, scraper_factory=None):
+        self.directory = directory
+        self.max_results = max_results
+        self.scraper_factory = scraper_factory
+        self.store = JobStore(os.path.join(directory, "jobs.db"))
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self._futures = {}
+        self._lock = threading.Lock()
+        # job yang terputus karena restart → lanjut dari checkpoint-nya
+        for job_id in self.store.unfinished():
+            self._schedule(job_id, resume=True)
+
+    def submit(self, body):
+        """Validasi body, simpan job (queued) lalu jadwalkan; return job dict. ValueError jika body tidak valid."""
+        if not isinstance(body, dict):
+            raise ValueError("job body must be a JSON object")
+        body = copy.deepcopy(body)
+        fmt = body.pop("format", "jsonl")
+        if fmt not in RESULT_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(RESULT_FORMATS)}")
+        unknown = set(body) - set(JOB_SECTIONS)
+        if unknown:
+            raise ValueError(f"unknown job section(s): {', '.join(sorted(unknown))}; allowed: {', '.join(JOB_SECTIONS)}")
+        config = self._config(body, fmt, self.directory)
+        # body datang dari HTTP: jumlah thread/proses & ukuran batch dibatasi server
+        limits = {
+            ("fetch", "results"): self.max_results,
+            ("fetch", "page_size"): settings.JOB_MAX_BATCH_SIZE,
+            ("fetch", "max_workers"): settings.JOB_MAX_THREADS,
+            ("pipeline", "batch_size"): settings.JOB_MAX_BATCH_SIZE,
+            ("pipeline", "workers"): settings.JOB_WORKERS,
+            # _run_chunks menahan checkpoint_every // page_size page di memory per chunk
+            ("pipeline", "checkpoint_every"): settings.JOB_MAX_BATCH_SIZE * 20,
+        }
+        for (section, key), maximum in limits.items():
+            if config[section][key] > maximum:
+                raise ValueError(f"{section}.{key} must be <= {maximum}")
+        job_id = self.store.create(body, fmt, total=config["fetch"]["results"])
+        self._schedule(job_id)
+        return self.get(job_id)
+
+    def get(self, job_id):
+        job = self.store.get(job_id)
+        if job is not None:
+            job.pop("result_path")
+        return job
+
+    def list(self, limit=20):
+        jobs = self.store.list(limit)
+        for job in jobs:
+            job.pop("result_path")
+        return jobs
+
+    def result_path(self, job_id):
+        """(path, mimetype) hasil job yang sudah selesai, atau None"""
+        job = self.store.get(job_id)
+        if job is None or job["status"] != "succeeded" or not job["result_path"]:
+            return None
+        return job["result_path"], RESULT_FORMATS[job["format"]][1]
+
+    def wait(self, job_id, timeout=None):
+        """Tunggu job selesai (untuk test / CLI); return job dict"""
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None:
+            future.result(timeout)
+        return self.get(job_id)
+
+    def shutdown(self, wait=True):
+        self._pool.shutdown(wait=wait)
+        self.store.close()
+
+    def _schedule(self, job_id, resume=False):
+        future = self._pool.submit(self._run, job_id, resume)
+        with self._lock:
+            self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._forget(job_id))
+
+    def _forget(self, job_id):
+        with self._lock:
+            self._futures.pop(job_id, None)
+
+    def _config(self, body, fmt, directory):
+        filename = RESULT_FORMATS[fmt][0]
+        return load_config(overrides={
+            **body,
+            "store": os.path.join(directory, "leads.db"),
+            "checkpoint": os.path.join(directory, "checkpoint.json"),
+            "report_dir": "",
+            "exporters": [{"format": fmt, "path": os.path.join(directory, filename)}],
+            "handoff": {"path": None},
+            "crm": {"url": None},
+        })
+
+    def _run(self, job_id, resume):
+        job = self.store.get(job_id)
+        self.store.update(job_id, status="running", started_at=job["started_at"] or time.time(), error=None)
+        runner = None
+        try:
+            config = self._config(job["config"], job["format"], os.path.join(self.directory, job_id))
+            scraper = self.scraper_factory(config) if self.scraper_factory is not None else None
+            runner = PipelineRunner(config, scraper=scraper, progress=lambda fetched, report: self.store.update(
+                job_id, processed=fetched, stages=_stages(report),
+            ))
+            report = runner.run(resume=resume)
+        except Exception as exc:
+            stages = _stages(runner.report) if runner is not None and runner.report is not None else []
+            self.store.update(job_id, status="failed", error=f"{type(exc).__name__}: {exc}",
+                              stages=stages, finished_at=time.time())
+            return
+        path = config["exporters"][0]["path"]
+        self.store.update(
+            job_id, status="succeeded", processed=runner.stats["fetched"], stages=report.to_dict()["stages"],
+            result_path=path, result_count=runner.stats["exported"][path], finished_at=time.time(),
+        )
+        # store & checkpoint hanya untuk resume; hasil job = file export
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(config["store"] + suffix):
+                os.remove(config["store"] + suffix)
+
+
+def _stages(report):
+    # dibaca dari thread job saat pipeline berjalan; list() dulu karena stage bisa bertambah
+    return [stats.to_dict() for stats in list(report.stages.values())]
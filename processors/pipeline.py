@@ -0,0 +1,57 @@
+class LeadPipeline:
+    """
+    Streaming pipeline: setiap stage adalah callable `iterable -> iterable`
+    (mis. LeadFilter().iter_deduplicate, LeadScorer().iter_apply).
+
+    Lead mengalir satu per satu dari source → stages → sink, jadi memory
+    tidak bertambah sesuai jumlah lead dan exporter sudah menulis baris
+    pertama sebelum fetch selesai.
+
+    report : RunReport opsional (monitoring/run_report.py); jika ada, setiap
+             stage dicatat waktunya atas nama stage tersebut
+    """
+
+    def __init__(self, stages=None, report=None):
+        self.stages = list(stages or [])
+        self.names = [stage_name(stage) for stage in self.stages]
+        self.counts = {}
+        self.report = report
+
+    def add_stage(self, stage, name=None):
+        self.stages.append(stage)
+        self.names.append(name or stage_name(stage))
+        return self
+
+    def count(self, name):
+        """Stage pass-through yang menghitung lead yang lewat ke self.counts[name]"""
+        def counter(leads):
+            self.counts[name] = 0
+            for lead in leads:
+                self.counts[name] += 1
+                yield lead
+        counter.__qualname__ = f"count[{name}]"
+        return counter
+
+    def run(self, source):
+        leads = iter(source)
+        for name, stage in zip(self.names, self.stages):
+            if self.report is not None:
+                stage = self.report.instrument(name, stage)
+            leads = stage(leads)
+        return leads
+
+    def consume(self, source):
+        """Jalankan pipeline sampai habis tanpa menyimpan hasil; return jumlah lead"""
+        count = 0
+        for _ in self.run(source):
+            count += 1
+        return count
+
+    def run_into(self, source, exporter, *args, **kwargs):
+        """Jalankan pipeline langsung ke exporter.export(leads, ...)"""
+        return exporter.export(self.run(source), *args, **kwargs)
+
+
+def stage_name(stage):
+    """Nama default stage untuk report, mis. LeadScorer.iter_apply"""
+    return getattr(stage, "__qualname__", None) or type(stage).__name__
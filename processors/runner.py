@@ -0,0 +1,407 @@
+"""
+Pipeline runner deklaratif: urutan stage, bobot scorer, ukuran fetch,
+concurrency, batch size dan exporter diambil dari config (config/pipeline.py),
+bukan di-hardcode di main.py.
+
+    runner = PipelineRunner(load_config("nightly.toml"))
+    runner.plan()          # dry-run: rencana run tanpa fetch/tulis apa pun
+    report = runner.run(resume=True)
+
+Dengan store aktif, page di-fetch & diproses per chunk (pipeline.checkpoint_every
+lead); setelah satu chunk ter-commit ke store, nomor page berikutnya ditulis ke
+file checkpoint. Run yang terputus bisa dilanjutkan dengan resume=True selama
+config fetch/stage/scorer sama. Export selalu dari isi store setelah semua
+chunk selesai, jadi hasilnya sama dengan run tanpa putus.
+
+Jika config handoff.path diisi, daftar hand-off (top-k per segment) dipilih
+secara streaming dengan TopKSelector — dari seluruh isi store, atau sebagai
+stage pass-through di akhir pipeline tanpa store — lalu diekspor terpisah.
+
+Jika crm.url diisi, lead yang lewat pipeline (dengan store: hanya yang baru /
+berubah) dan punya crm.tag masuk outbox CRM, lalu dikirim per batch setelah
+pipeline selesai (crm/pusher.py). Lead yang sudah terkirim tidak dikirim lagi.
+"""
+import hashlib
+import json
+import math
+import os
+import tempfile
+from functools import partial
+from time import perf_counter
+
+from config.pipeline import PER_LEAD_STAGES
+from crm.outbox import CRMOutbox
+from crm.pusher import CRMPusher
+from exporters.atomic import atomic_path
+from exporters.csv_exporter import CSVExporter
+from exporters.json_exporter import JSONExporter
+from exporters.jsonl_exporter import JSONLinesExporter
+from monitoring.run_report import RunReport
+from processors.enricher import LeadEnricher
+from processors.executor import ProcessExecutor, SerialExecutor
+from processors.filter import LeadFilter
+from processors.pipeline import LeadPipeline
+from processors.scorer import LeadScorer
+from processors.tagger import LeadTagger
+from processors.top_k import TopKSelector
+from storage.lead_store import LeadStore
+
+EXPORT_FORMATS = {
+    ".csv": "csv", ".json": "json", ".jsonl": "jsonl", ".ndjson": "jsonl",
+    ".xlsx": "excel", ".parquet": "parquet", ".arrow": "parquet", ".feather": "parquet",
+}
+
+
+def detect_export_format(path):
+    """Format exporter dari ekstensi; .gz/.zst dilewati (leads.csv.gz → csv)"""
+    root, ext = os.path.splitext(path.lower())
+    if ext in (".gz", ".zst"):
+        ext = os.path.splitext(root)[1]
+    if ext not in EXPORT_FORMATS:
+        raise ValueError(f"cannot detect export format for {path!r}; set 'format' explicitly")
+    return EXPORT_FORMATS[ext]
+
+
+def make_exporter(fmt, batch_size):
+    if fmt == "csv":
+        return CSVExporter(chunk_size=batch_size)
+    if fmt == "json":
+        return JSONExporter(chunk_size=batch_size)
+    if fmt == "jsonl":
+        return JSONLinesExporter(chunk_size=batch_size)
+    if fmt == "excel":
+        from exporters.excel_exporter import ExcelExporter
+
+        return ExcelExporter()
+    if fmt == "parquet":
+        from exporters.parquet_exporter import ParquetExporter
+
+        return ParquetExporter(batch_size=max(batch_size, 10_000))
+    raise ValueError(f"unknown export format {fmt!r}")
+
+
+def make_scraper(fetch):
+    if fetch["source"] == "synthetic":
+        from scraper.synthetic import SyntheticScraper
+
+        return SyntheticScraper(page_size=fetch["page_size"])
+    from scraper.api_scraper import APIScraper
+
+    return APIScraper(max_workers=fetch["max_workers"], page_size=fetch["page_size"])
+
+
+class Checkpoint:
+    """File JSON {fingerprint, next_page, fetched}; ditulis atomic setelah tiap chunk"""
+
+    def __init__(self, path, fingerprint):
+        self.path = path
+        self.fingerprint = fingerprint
+
+    def load(self):
+        """Return state checkpoint yang cocok dengan config ini, atau None"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return state if state.get("fingerprint") == self.fingerprint else None
+
+    def save(self, next_page, fetched):
+        with atomic_path(self.path) as tmp_path:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": self.fingerprint, "next_page": next_page, "fetched": fetched}, f)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class PipelineRunner:
+    """
+    config    : hasil config.pipeline.load_config
+    scraper   : override sumber lead (default dari fetch.source)
+    benchmark : sumber sintetis offline, tanpa store/checkpoint, export ke folder
+                sementara — untuk mengukur throughput suatu config
+    progress  : callable(fetched, report) dipanggil setelah setiap chunk ter-commit
+                (hanya dengan store), mis. untuk status job di API
+    """
+
+    def __init__(self, config, scraper=None, benchmark=False, progress=None):
+        self.config = config
+        self.benchmark = benchmark
+        self.progress = progress
+        self.report = None
+        if benchmark:
+            fetch = {**config["fetch"], "source": "synthetic"}
+            self.scraper = scraper or make_scraper(fetch)
+        else:
+            self.scraper = scraper or make_scraper(config["fetch"])
+        self.store = None
+        self.stats = {"fetched": 0, "unique": 0, "exported": {}, "start_page": 1}
+
+    # --- rencana
+
+    @property
+    def store_path(self):
+        return None if self.benchmark else self.config["store"]
+
+    @property
+    def checkpoint_path(self):
+        return self.config["checkpoint"] if self.store_path else None
+
+    def fingerprint(self):
+        """Hash bagian config yang menentukan isi run; checkpoint hanya berlaku jika sama"""
+        fetch = self.config["fetch"]
+        raw = json.dumps(
+            [fetch["source"], fetch["results"], fetch["page_size"], fetch["seed"],
+             self.config["pipeline"]["stages"], self.config["scorer"]],
+            sort_keys=True,
+        )
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()
+
+    def store_fingerprint(self):
+        """Hash config yang menentukan hasil pemrosesan per lead; berubah → store di-invalidate"""
+        raw = json.dumps([self.config["pipeline"]["stages"], self.config["scorer"]], sort_keys=True)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()
+
+    def exporters(self, directory=None):
+        """[(format, path)]; directory mengganti folder output (mode benchmark)"""
+        specs = []
+        for spec in self.config["exporters"]:
+            path = spec["path"]
+            if directory is not None:
+                path = os.path.join(directory, os.path.basename(path))
+            specs.append((spec.get("format") or detect_export_format(path), path))
+        return specs
+
+    @property
+    def crm_url(self):
+        return None if self.benchmark else self.config["crm"]["url"]
+
+    def handoff_selector(self):
+        """TopKSelector sesuai config handoff, atau None jika hand-off tidak dibuat"""
+        handoff = self.config["handoff"]
+        if not handoff["path"]:
+            return None
+        return TopKSelector(
+            k=handoff["k"], per_segment=handoff["per_segment"],
+            segment_by=handoff["segment_by"], min_score=handoff["min_score"],
+        )
+
+    def handoff_path(self, directory=None):
+        path = self.config["handoff"]["path"]
+        if path and directory is not None:
+            path = os.path.join(directory, os.path.basename(path))
+        return path
+
+    def layout(self):
+        """
+        Langkah pipeline sesuai urutan eksekusi, tiap langkah = list nama stage.
+        Store menyaring lead lama setelah dedup dan menyimpan hasil di akhir;
+        dengan workers, stage per-lead yang berurutan digabung jadi satu grup.
+        """
+        stages = self.config["pipeline"]["stages"]
+        workers = self.config["pipeline"]["workers"]
+        steps = []
+        if self.store_path and "dedup" not in stages:
+            steps.append(["store.new_or_changed"])
+        for name in stages:
+            if name == "dedup":
+                steps.append(["dedup"])
+                if self.store_path:
+                    steps.append(["store.new_or_changed"])
+            elif workers and steps and steps[-1][0] in PER_LEAD_STAGES:
+                steps[-1].append(name)
+            else:
+                steps.append([name])
+        if self.store_path:
+            steps.append(["store.upsert"])
+        elif self.config["handoff"]["path"]:
+            steps.append(["handoff.select"])
+        if self.crm_url:
+            steps.append(["crm.enqueue"])
+        return steps
+
+    def stage_names(self):
+        workers = self.config["pipeline"]["workers"]
+        return [
+            f"workers[{'+'.join(step)}]" if workers and step[0] in PER_LEAD_STAGES else step[0]
+            for step in self.layout()
+        ]
+
+    def plan(self, resume=False):
+        """Dry-run: apa yang akan dijalankan, tanpa fetch, store atau file baru"""
+        fetch = self.config["fetch"]
+        pages = math.ceil(fetch["results"] / fetch["page_size"])
+        start_page = 1
+        if resume and self.checkpoint_path:
+            state = Checkpoint(self.checkpoint_path, self.fingerprint()).load()
+            start_page = state["next_page"] if state else 1
+        return {
+            "mode": "benchmark" if self.benchmark else "run",
+            "source": "synthetic" if self.benchmark else fetch["source"],
+            "results": fetch["results"],
+            "pages": pages,
+            "page_size": fetch["page_size"],
+            "start_page": start_page,
+            "max_workers": fetch["max_workers"],
+            "workers": self.config["pipeline"]["workers"],
+            "batch_size": self.config["pipeline"]["batch_size"],
+            "stages": self.stage_names(),
+            "store": self.store_path,
+            "checkpoint": self.checkpoint_path,
+            "checkpoint_every": self.config["pipeline"]["checkpoint_every"] if self.checkpoint_path else None,
+            "exporters": [{"format": fmt, "path": path} for fmt, path in self.exporters()],
+            "handoff": dict(self.config["handoff"]) if self.config["handoff"]["path"] else None,
+            "crm": dict(self.config["crm"]) if self.crm_url else None,
+        }
+
+    # --- eksekusi
+
+    def build_stages(self, executor, selector=None, outbox=None):
+        """[(nama, stage)] sesuai layout(); dedup memakai `seen` yang sama antar chunk"""
+        scorer = LeadScorer(**self.config["scorer"])
+        tagger = LeadTagger()
+        enricher = LeadEnricher()
+        functions = {
+            "dedup": partial(LeadFilter().iter_deduplicate, seen=set()),
+            "enrich": enricher.iter_enrich_leads,
+            "score": scorer.iter_apply,
+            "tag_industry": tagger.iter_tag_industry,
+            "tag_high_potential": tagger.iter_add_tag_high_potential,
+            "tag_defaults": tagger.iter_tag_defaults,
+        }
+        if self.store is not None:
+            functions["store.new_or_changed"] = self.store.iter_new_or_changed
+            functions["store.upsert"] = self.store.iter_upsert
+        if selector is not None:
+            functions["handoff.select"] = selector.iter_collect
+        if outbox is not None:
+            functions["crm.enqueue"] = partial(outbox.iter_enqueue, tag=self.config["crm"]["tag"])
+
+        workers = self.config["pipeline"]["workers"]
+        stages = []
+        for name, step in zip(self.stage_names(), self.layout()):
+            if workers and step[0] in PER_LEAD_STAGES:
+                stages.append((name, executor.stage(*(functions[stage] for stage in step))))
+            else:
+                stages.append((name, functions[step[0]]))
+        return stages
+
+    def run(self, resume=False):
+        """Jalankan pipeline; return RunReport (statistik juga ada di self.stats)"""
+        if self.benchmark:
+            with tempfile.TemporaryDirectory() as directory:
+                return self._run(self.exporters(directory), resume=False, handoff_path=self.handoff_path(directory))
+        return self._run(self.exporters(), resume, self.handoff_path())
+
+    def _run(self, exporters, resume, handoff_path=None):
+        config = self.config
+        fetch, batch_size = config["fetch"], config["pipeline"]["batch_size"]
+        report = self.report = RunReport("benchmark" if self.benchmark else "pipeline")
+        self.store = LeadStore(self.store_path, batch_size=batch_size) if self.store_path else None
+        if self.store is not None:
+            # hash input store hanya data upstream: stage/scorer berubah → semua lead diproses ulang
+            self.store.sync_fingerprint(self.store_fingerprint())
+        checkpoint = Checkpoint(self.checkpoint_path, self.fingerprint()) if self.checkpoint_path else None
+        workers = config["pipeline"]["workers"]
+        executor = ProcessExecutor(workers, shard_size=batch_size) if workers else SerialExecutor()
+        selector = self.handoff_selector()
+        outbox = CRMOutbox(self.config["crm"]["outbox"], batch_size=batch_size) if self.crm_url else None
+
+        start_page = 1
+        if resume and checkpoint is not None:
+            state = checkpoint.load()
+            if state:
+                start_page = state["next_page"]
+                print(f"⏩ Resuming from page {start_page} ({state['fetched']} leads already processed).")
+        self.stats["start_page"] = start_page
+
+        try:
+            with executor:
+                pipeline = LeadPipeline(report=report)
+                for name, stage in self.build_stages(executor, selector, outbox):
+                    pipeline.add_stage(stage, name=name)
+                pages = self.scraper.iter_pages(
+                    fetch["results"], fetch["page_size"], fetch["max_workers"], fetch["seed"], start_page=start_page,
+                )
+                if self.store is not None:
+                    self._run_chunks(pipeline, report, pages, checkpoint)
+                    self._export(report, exporters, self.store.iter_query)
+                    if selector is not None:
+                        # hand-off dari seluruh isi store (termasuk lead dari run sebelumnya)
+                        for _ in report.instrument("handoff.select", selector.iter_collect)(self.store.iter_query()):
+                            pass
+                    self.stats["stored"] = self.store.count()
+                else:
+                    source = report.source("fetch", (lead for _, leads in pages for lead in leads))
+                    if len(exporters) == 1:
+                        fmt, path = exporters[0]
+                        exporter = report.exporter(f"export.{fmt}", make_exporter(fmt, batch_size))
+                        self.stats["exported"][path] = pipeline.run_into(source, exporter, path)
+                    else:
+                        # tanpa store, beberapa exporter butuh hasil lengkap di memory
+                        leads = list(pipeline.run(source))
+                        self._export(report, exporters, lambda: leads)
+                if selector is not None:
+                    handoff = selector.results()
+                    fmt = self.config["handoff"].get("format") or detect_export_format(handoff_path)
+                    exporter = report.exporter("export.handoff", make_exporter(fmt, batch_size))
+                    self.stats["handoff"] = exporter.export(handoff, handoff_path)
+                if outbox is not None:
+                    self._push_crm(report, outbox)
+            if checkpoint is not None:
+                checkpoint.clear()
+        finally:
+            if self.store is not None:
+                self.store.close()
+            if outbox is not None:
+                outbox.close()
+
+        self.stats["fetched"] = report.stage("fetch").items_out
+        if "dedup" in report.stages:
+            self.stats["unique"] = report.stage("dedup").items_out
+        return report.finish()
+
+    def _run_chunks(self, pipeline, report, pages, checkpoint):
+        fetch = self.config["fetch"]
+        pages_per_chunk = max(1, self.config["pipeline"]["checkpoint_every"] // fetch["page_size"])
+        pages = iter(pages)
+        fetch_stats = report.stage("fetch")
+        fetched = (self.stats["start_page"] - 1) * fetch["page_size"]
+        while True:
+            chunk = []
+            last_page = None
+            for _ in range(pages_per_chunk):
+                start = perf_counter()
+                item = next(pages, None)
+                fetch_stats.seconds += perf_counter() - start
+                if item is None:
+                    break
+                last_page, leads = item
+                fetch_stats.items_out += len(leads)
+                chunk.extend(leads)
+            if last_page is None:
+                return
+            # consume sampai habis → batch terakhir iter_upsert sudah ter-commit
+            pipeline.consume(chunk)
+            fetched += len(chunk)
+            if checkpoint is not None:
+                checkpoint.save(last_page + 1, fetched)
+            if self.progress is not None:
+                self.progress(fetched, report)
+
+    def _push_crm(self, report, outbox):
+        crm = self.config["crm"]
+        pusher = CRMPusher.from_settings(
+            outbox, url=crm["url"], batch_size=crm["batch_size"], max_workers=crm["workers"], rate=crm["rate"] or None,
+        )
+        with pusher, report.timed("crm.push") as stats:
+            self.stats["crm"] = pusher.drain()
+            stats.items_in = stats.items_out = self.stats["crm"]["sent"]
+
+    def _export(self, report, exporters, leads):
+        batch_size = self.config["pipeline"]["batch_size"]
+        for fmt, path in exporters:
+            exporter = report.exporter(f"export.{fmt}", make_exporter(fmt, batch_size))
+            self.stats["exported"][path] = exporter.export(leads(), path)
@@ -1,35 +1,155 @@
+from array import array
+from numbers import Integral
+
+import numpy as np
+
+DEFAULT_WEIGHTS = {
+    "city": 30,          # lead.location ada di target_cities
+    "industry": 40,      # lead.industry ada di target_industries
+    "company_size": {"Large": 20, "Medium": 10, "Small": 0},
+    "tags": {"High Potential": 10},
+}
+
+
+def merge_weights(weights):
+    """
+    Weights parsial di-merge ke default, tabel satu level lebih dalam:
+    {"city": 50, "company_size": {"Large": 5}} → Medium & Small tetap dari default
+    """
+    merged = {key: dict(value) if isinstance(value, dict) else value for key, value in DEFAULT_WEIGHTS.items()}
+    for key, value in (weights or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key].update(value)
+        else:
+            merged[key] = value
+    return merged
+
+
 class LeadScorer:
     """Enhanced lead scoring based on target cities, industries, company size, and tags"""
 
-    def __init__(self, target_cities=None, target_industries=None, base_score=10):
+    def __init__(self, target_cities=None, target_industries=None, base_score=10, weights=None, max_score=100):
         self.target_cities = target_cities or []
         self.target_industries = target_industries or []
         self.base_score = base_score
+        self.max_score = max_score
+        self.weights = merge_weights(weights)
+        # score disimpan sebagai int (LeadBatch.scores, kolom parquet int32, store) → bobot harus bulat
+        values = [base_score, max_score]
+        for value in self.weights.values():
+            values.extend(value.values() if isinstance(value, dict) else [value])
+        if not all(isinstance(value, Integral) and not isinstance(value, bool) for value in values):
+            raise ValueError(f"scores and weights must be integers, got base_score={base_score!r}, "
+                             f"max_score={max_score!r}, weights={self.weights!r}")
+        self._target_cities = frozenset(self.target_cities)
+        self._target_industries = frozenset(self.target_industries)
 
     def apply(self, leads):
+        return list(self.iter_apply(leads))
+
+    def iter_apply(self, leads):
+        for lead in leads:
+            lead.score = self.score(lead)
+            yield lead
+
+    def score(self, lead):
+        weights = self.weights
+        score = self.base_score
+
+        # city bonus
+        if lead.location in self._target_cities:
+            score += weights["city"]
+
+        # industry bonus
+        if getattr(lead, "industry", None) in self._target_industries:
+            score += weights["industry"]
+
+        # company size bonus (Small → +0)
+        score += weights["company_size"].get(getattr(lead, "company_size", "Medium"), 0)
+
+        # tag bonus (High Potential → +10)
+        tags = getattr(lead, "tags", ())
+        for tag, bonus in weights["tags"].items():
+            if tag in tags:
+                score += bonus
+
+        # cap maximum
+        return min(score, self.max_score)
+
+    # --- vectorized scoring (hasil identik dengan score())
+
+    def apply_batch(self, leads, memo_size=100_000):
+        """
+        Seperti apply(), hasil identik. LeadBatch → score_batch() (vectorized);
+        list Lead → skor di-memo per kombinasi (location, industry, company_size, tags).
+        """
+        from models.lead_batch import LeadBatch
+
+        if isinstance(leads, LeadBatch):
+            self.score_batch(leads)
+            return leads
+        return list(self.iter_apply_batched(leads, memo_size))
+
+    def iter_apply_batched(self, leads, memo_size=100_000):
+        # objek Lead tidak bisa di-vectorize tanpa menyalin kolom dulu; tapi nilai
+        # kategori sedikit, jadi skor per kombinasi cukup dihitung sekali
+        memo = {}
         for lead in leads:
-            score = self.base_score
+            key = (lead.location, lead.industry, lead.company_size, lead.tags)
+            score = memo.get(key)
+            if score is None:
+                if len(memo) >= memo_size:
+                    memo.clear()
+                score = memo[key] = self.score(lead)
+            lead.score = score
+            yield lead
 
-            # city bonus
-            if lead.location in self.target_cities:
-                score += 30
+    def score_batch(self, batch):
+        """
+        Skor untuk LeadBatch sebagai np.ndarray (int64). Kolom kategori sudah
+        berupa kode integer, jadi bonus dihitung sekali per kategori lalu
+        di-index dengan kode → tanpa loop Python per lead.
+        """
+        scores = np.full(len(batch), self.base_score, dtype=np.int64)
+        scores += self._category_bonus(batch.locations, lambda v: self.weights["city"] if v in self._target_cities else 0)
+        scores += self._category_bonus(batch.industries, lambda v: self.weights["industry"] if v in self._target_industries else 0)
+        scores += self._category_bonus(batch.company_sizes, lambda v: self.weights["company_size"].get(v, 0))
+        scores += self._category_bonus(batch.tags, self._tags_bonus)
+        np.minimum(scores, self.max_score, out=scores)
+        batch.scores = array("i", scores.astype(np.int32).tobytes())
+        return scores
 
-            # industry bonus
-            if getattr(lead, "industry", None) in self.target_industries:
-                score += 40
+    def score_frame(self, df):
+        """Skor untuk DataFrame hasil to_dict()/LeadBatch.to_dataframe() sebagai pd.Series"""
+        import pandas as pd
 
-            # company size bonus
-            if getattr(lead, "company_size", "Medium") == "Large":
-                score += 20
-            elif getattr(lead, "company_size", "Medium") == "Medium":
-                score += 10
-            # Small → +0
+        scores = np.full(len(df), self.base_score, dtype=np.int64)
+        scores += self._series_bonus(df["location"], lambda v: self.weights["city"] if v in self._target_cities else 0)
+        scores += self._series_bonus(df["industry"], lambda v: self.weights["industry"] if v in self._target_industries else 0)
+        scores += self._series_bonus(df["company_size"], lambda v: self.weights["company_size"].get(v, 0))
+        # tags berupa list per baris → satu pass membership per tag berbobot
+        for tag, bonus in self.weights["tags"].items():
+            if bonus:
+                has_tag = np.fromiter((tag in tags for tags in df["tags"]), dtype=bool, count=len(df))
+                scores += has_tag * bonus
+        np.minimum(scores, self.max_score, out=scores)
+        return pd.Series(scores, index=df.index, name="score")
 
-            # High Potential tag bonus
-            if "High Potential" in getattr(lead, "tags", []):
-                score += 10
+    def _tags_bonus(self, tags):
+        return sum(bonus for tag, bonus in self.weights["tags"].items() if tag in tags)
 
-            # cap maximum 100
-            lead.score = min(score, 100)
+    @staticmethod
+    def _category_bonus(column, bonus):
+        table = np.fromiter((bonus(value) for value in column.categories), dtype=np.int64, count=len(column.categories))
+        if not len(table):
+            return 0
+        return table[np.frombuffer(column.codes, dtype=np.uint32)]
 
-        return leads
+    @staticmethod
+    def _series_bonus(series, bonus):
+        codes, uniques = series.factorize()
+        if not len(uniques):
+            return 0
+        table = np.fromiter((bonus(value) for value in uniques), dtype=np.int64, count=len(uniques))
+        # factorize: NaN/None → kode -1, tidak dapat bonus
+        return np.where(codes >= 0, table[codes], 0)
@@ -1,34 +1,57 @@
+from processors.classifier import POSITION_KEYWORDS, IndustryClassifier, position_classifier
+
+
 class LeadTagger:
     """Tagging lead dengan industry & high potential"""
 
+    INDUSTRY_MAP = POSITION_KEYWORDS
+
+    def __init__(self, industry_map=None):
+        # industry_map custom → classifier sendiri; default → classifier bersama
+        self.classifier = IndustryClassifier(industry_map) if industry_map else position_classifier()
+
     def tag_industry(self, leads):
-        industry_map = {
-            "Tech": ["software", "developer", "engineer"],
-            "Finance": ["finance", "bank", "investment"],
-            "Retail": ["retail", "store", "shop"],
-            "Healthcare": ["health", "medical", "clinic"]
-        }
+        return list(self.iter_tag_industry(leads))
+
+    def add_tag_high_potential(self, leads):
+        return list(self.iter_add_tag_high_potential(leads))
+
+    def tag_defaults(self, leads):
+        """Assign default values if missing"""
+        return list(self.iter_tag_defaults(leads))
+
+    def tag_keyword(self, leads, keyword):
+        """Tambah tag "<keyword> Industry" untuk lead yang company-nya mengandung keyword"""
+        return list(self.iter_tag_keyword(leads, keyword))
+
+    # --- streaming versions
+
+    def iter_tag_industry(self, leads):
+        classify = self.classifier.classify
         for lead in leads:
             if not lead.industry or lead.industry == "General":
-                # assign industry based on position/company keyword
-                lead.industry = "General"
-                for key, keywords in industry_map.items():
-                    if any(k.lower() in (lead.position or "").lower() for k in keywords):
-                        lead.industry = key
-                        break
-        return leads
+                # assign industry based on position keyword
+                lead.industry = classify(lead.position)
+            yield lead
 
-    def add_tag_high_potential(self, leads):
+    def iter_add_tag_high_potential(self, leads):
         for lead in leads:
             if lead.score >= 50:
                 lead.add_tag("High Potential")
-        return leads
+            yield lead
 
-    def tag_defaults(self, leads):
-        """Assign default values if missing"""
+    def iter_tag_defaults(self, leads):
         for lead in leads:
             if not lead.industry:
                 lead.industry = "General"
             if not lead.company_size:
                 lead.company_size = "Medium"
-        return leads
+            yield lead
+
+    def iter_tag_keyword(self, leads, keyword):
+        needle = keyword.casefold()
+        tag = f"{keyword} Industry"
+        for lead in leads:
+            if needle in (lead.company or "").casefold():
+                lead.add_tag(tag)
+            yield lead
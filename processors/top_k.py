@@ -0,0 +1,117 @@
+"""
+Seleksi top-k streaming dengan heap terbatas: lead dibaca satu per satu,
+memory O(k) (atau O(segment × quota)), waktu O(n log k) — tanpa menampung
+atau mengurutkan seluruh input.
+
+    selector = TopKSelector(k=100, per_segment=10, segment_by="location")
+    selector.extend(scorer.iter_apply(scraper.iter_fetch_concurrent(results=1_000_000)))
+    handoff = selector.results()          # maks 10 per kota, total 100, score tertinggi dulu
+
+Urutan hasil: score desc; score sama → yang datang lebih dulu menang (sama
+dengan sort stabil). Score diambil saat lead masuk, jadi jangan ubah score
+lead setelah di-push.
+"""
+import heapq
+from itertools import count
+from operator import attrgetter
+
+
+class TopKSelector:
+    """
+    k           : jumlah hasil maksimal (None = hanya dibatasi per_segment)
+    per_segment : maksimal lead per segment (mis. top-N per kota)
+    segment_by  : nama atribut ("location", "industry", ...) atau callable item → segment
+    key         : callable item → score (default lead.score)
+    min_score   : item dengan score di bawah ini dilewati
+    """
+
+    def __init__(self, k=None, per_segment=None, segment_by=None, key=None, min_score=None):
+        if k is None and per_segment is None:
+            raise ValueError("set k, per_segment or both")
+        if per_segment is not None and segment_by is None:
+            raise ValueError("per_segment needs segment_by")
+        if (k is not None and k < 0) or (per_segment is not None and per_segment < 0):
+            raise ValueError("k and per_segment must be >= 0")
+        self.k = k
+        self.per_segment = per_segment
+        self.segment_by = attrgetter(segment_by) if isinstance(segment_by, str) else segment_by
+        self.key = key or attrgetter("score")
+        self.min_score = min_score
+        # min-heap per segment berisi (score, -urutan, item): heap[0] = kandidat terlemah
+        self._heaps = {}
+        self._limit = per_segment if per_segment is not None else k
+        self._seq = count()
+        self._size = 0
+        # dengan segment + k: peringkat ke-k dari gabungan heap hanya bisa naik,
+        # jadi item di bawahnya tidak akan pernah masuk hasil (lihat _prune)
+        self._threshold = None
+        self.seen = 0
+
+    def push(self, item):
+        self.seen += 1
+        score = self.key(item)
+        if self.min_score is not None and score < self.min_score:
+            return
+        rank = (score, -next(self._seq))
+        if self._threshold is not None and rank < self._threshold:
+            return
+        segment = self.segment_by(item) if self.segment_by is not None else None
+        heap = self._heaps.get(segment)
+        if heap is None:
+            heap = self._heaps[segment] = []
+        if len(heap) < self._limit:
+            heapq.heappush(heap, rank + (item,))
+            self._size += 1
+            if self.k is not None and self.per_segment is not None and self._size > 2 * self.k + self._limit:
+                self._prune()
+        elif heap and rank > heap[0][:2]:
+            heapq.heapreplace(heap, rank + (item,))
+
+    def extend(self, items):
+        for item in items:
+            self.push(item)
+        return self
+
+    def iter_collect(self, leads):
+        """Stage pass-through untuk LeadPipeline: lead diteruskan, top-k dikumpulkan di samping"""
+        for lead in leads:
+            self.push(lead)
+            yield lead
+
+    def _prune(self):
+        """Buang entry di bawah peringkat ke-k gabungan; amortized O(log k) per push"""
+        entries = [entry for heap in self._heaps.values() for entry in heap]
+        self._threshold = _rank(heapq.nlargest(self.k, entries, key=_rank)[-1])
+        heaps = {}
+        for segment, heap in self._heaps.items():
+            kept = [entry for entry in heap if _rank(entry) >= self._threshold]
+            if kept:
+                heapq.heapify(kept)
+                heaps[segment] = kept
+        self._heaps = heaps
+        self._size = sum(len(heap) for heap in heaps.values())
+
+    def results(self):
+        """Semua item terpilih, score desc (dibatasi k jika diisi)"""
+        entries = [entry for heap in self._heaps.values() for entry in heap]
+        if self.k is not None and len(entries) > self.k:
+            entries = heapq.nlargest(self.k, entries, key=_rank)
+        else:
+            entries.sort(key=_rank, reverse=True)
+        return [item for _, _, item in entries]
+
+    def segments(self):
+        """{segment: item terpilih score desc} (sebelum batas total k)"""
+        return {
+            segment: [item for _, _, item in sorted(heap, key=_rank, reverse=True)]
+            for segment, heap in self._heaps.items()
+        }
+
+
+def _rank(entry):
+    return entry[0], entry[1]
+
+
+def select_top(items, k=None, per_segment=None, segment_by=None, key=None, min_score=None):
+    """Satu kali jalan: TopKSelector(...).extend(items).results()"""
+    return TopKSelector(k, per_segment, segment_by, key, min_score).extend(items).results()
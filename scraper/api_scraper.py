@@ -1,10 +1,9 @@
-import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from models.cities import get_city_index
+from models.codec import decode_users, user_record
 from models.lead import Lead
-import random
-import geonamescache
-
-gc = geonamescache.GeonamesCache()
-CITIES = [city['name'] for city in gc.get_cities().values()]
+from models.seeding import stable_choice
+from scraper.http_client import HostRateLimiter, build_session, get_with_retry
 
 COMPANIES = [
     "TechNova", "Innova Solutions", "Caprae Finance", "HealthPlus", 
@@ -19,28 +18,149 @@ POSITIONS = [
 INDUSTRIES = ["Tech", "Finance", "Healthcare", "Education", "Retail", "Consulting", "Other"]
 COMPANY_SIZES = ["Small", "Medium", "Large"]
 
+def __getattr__(name):
+    if name == "CITIES":
+        return get_city_index().names
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 class APIScraper:
     API_URL = "https://randomuser.me/api/"
 
+    def __init__(self, api_url=None, max_workers=8, page_size=500, rate_limit=None,
+                 max_retries=3, backoff=0.5, timeout=30, session=None, random_seed=None):
+        """
+        api_url     : override endpoint (mis. stub server lokal untuk test)
+        max_workers : jumlah page yang di-fetch bersamaan di fetch_concurrent
+        page_size   : jumlah lead per request di fetch_concurrent
+        rate_limit  : maksimal request/detik per host (None = tanpa limit)
+        random_seed : seed nilai sintetis (company, position, ...); None = settings.RANDOM_SEED
+        """
+        self.api_url = api_url or self.API_URL
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.rate_limiter = HostRateLimiter(rate_limit) if rate_limit else None
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._session = session
+        self.random_seed = random_seed
+
+    @property
+    def session(self):
+        # satu pooled session dipakai bersama oleh semua worker thread
+        if self._session is None:
+            self._session = build_session(pool_size=self.max_workers)
+        return self._session
+
     def fetch(self, results=50):
-        response = requests.get(f"{self.API_URL}?results={results}")
-        response.raise_for_status()
-        data = response.json()
-        leads = []
-
-        for item in data["results"]:
-            city = item["location"]["city"]
-            if city not in CITIES:
-                city = random.choice(CITIES)
-
-            lead = Lead(
-                name=f"{item['name']['first']} {item['name']['last']}",
-                email=item["email"],
-                company=random.choice(COMPANIES),
-                position=random.choice(POSITIONS),
-                location=city,
-                industry=random.choice(INDUSTRIES),
-                company_size=random.choice(COMPANY_SIZES)
-            )
-            leads.append(lead)
-        return leads
+        return [self._parse_user(user) for user in self._get_page({"results": results})]
+
+    def fetch_concurrent(self, results=50, page_size=None, max_workers=None, seed=None):
+        """Fetch `results` leads split into pages fetched in parallel, in page order"""
+        return list(self.iter_fetch_concurrent(results, page_size, max_workers, seed))
+
+    def iter_fetch_concurrent(self, results=50, page_size=None, max_workers=None, seed=None, ordered=True):
+        """
+        Yield leads page by page while the remaining pages are still in flight.
+        ordered=True  → leads keluar sesuai urutan page
+        ordered=False → leads keluar sesuai urutan page yang selesai duluan
+        """
+        for _, leads in self.iter_pages(results, page_size, max_workers, seed, ordered=ordered):
+            yield from leads
+
+    def iter_pages(self, results=50, page_size=None, max_workers=None, seed=None, start_page=1, ordered=True):
+        """
+        Seperti iter_fetch_concurrent, tapi yield (page, leads) per page dan bisa
+        mulai dari `start_page` (resume dari checkpoint; page sebelumnya tidak di-fetch).
+
+        Maksimal max_workers * 2 page in flight / menunggu dikonsumsi: page berikutnya
+        baru di-submit saat satu page diambil, jadi memori tidak tumbuh dengan `results`.
+        """
+        page_size = page_size or self.page_size
+        max_workers = max_workers or self.max_workers
+        pages = [(page, keep) for page, keep in self._plan_pages(results, page_size) if page >= start_page]
+        if not pages:
+            return
+
+        pending = iter(pages)
+        # future → page; dict menjaga urutan submit = urutan page
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as pool:
+
+            def submit_next():
+                for page, keep in pending:
+                    in_flight[pool.submit(self._fetch_page, page, page_size, seed, keep)] = page
+                    return
+
+            for _ in range(max_workers * 2):
+                submit_next()
+            try:
+                while in_flight:
+                    if ordered:
+                        future = next(iter(in_flight))
+                    else:
+                        future = next(iter(wait(in_flight, return_when=FIRST_COMPLETED).done))
+                    page = in_flight.pop(future)
+                    leads = future.result()
+                    submit_next()
+                    del future
+                    yield page, leads
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def _fetch_page(self, page, page_size, seed=None, keep=None):
+        # page terakhir tetap minta page_size penuh: offset di API = (page - 1) * results,
+        # jadi ukuran page harus sama supaya page tidak saling overlap
+        params = {"results": page_size, "page": page}
+        if seed is not None:
+            params["seed"] = seed
+        return [self._parse_user(user) for user in self._get_page(params, keep)]
+
+    def _get_page(self, params, limit=None):
+        """Satu request → list UserRecord (body di-decode langsung, lihat models/codec.py)"""
+        response = get_with_retry(
+            self.session,
+            self.api_url,
+            params=params,
+            max_retries=self.max_retries,
+            backoff=self.backoff,
+            timeout=self.timeout,
+            rate_limiter=self.rate_limiter,
+        )
+        return decode_users(response.content, limit)
+
+    @staticmethod
+    def _plan_pages(results, page_size):
+        # [(page, jumlah lead yang dipakai dari page itu), ...]
+        pages = []
+        page = 1
+        remaining = results
+        while remaining > 0:
+            keep = min(page_size, remaining)
+            pages.append((page, keep))
+            remaining -= keep
+            page += 1
+        return pages
+
+    def _parse_item(self, item):
+        """User randomuser dalam bentuk dict (mis. dari cache/stub) → Lead"""
+        return self._parse_user(user_record(item))
+
+    def _parse_user(self, user):
+        # nilai sintetis diturunkan dari email → lead yang sama selalu sama di setiap run
+        email = user.email
+        seed = self.random_seed
+        # O(1) lookup, case/accent-insensitive ("sao paulo" → "São Paulo")
+        cities = get_city_index()
+        city = cities.canonical(user.city) or stable_choice(cities.names, email, "location", seed)
+
+        return Lead(
+            name=user.name,
+            email=email,
+            company=stable_choice(COMPANIES, email, "company", seed),
+            position=stable_choice(POSITIONS, email, "position", seed),
+            location=city,
+            industry=stable_choice(INDUSTRIES, email, "industry", seed),
+            company_size=stable_choice(COMPANY_SIZES, email, "company_size", seed)
+        )
@@ -0,0 +1,157 @@
+"""
+Versi async dari APIScraper untuk server ASGI (ui/asgi_app.py).
+
+Satu httpx.AsyncClient (connection pool) dipakai bersama oleh semua request,
+dibuka di startup dan ditutup di shutdown. Butuh package `httpx`.
+"""
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from models.codec import decode_users
+from monitoring.metrics import HTTP_LATENCY
+from scraper.api_scraper import APIScraper
+from scraper.http_client import MAX_BACKOFF, RETRY_STATUSES, _retry_delay
+
+
+def _require_httpx():
+    try:
+        import httpx
+    except ImportError as exc:
+        raise ImportError("async mode requires the 'httpx' package (pip install httpx)") from exc
+    return httpx
+
+
+class Coalescer:
+    """
+    Request identik yang sedang berjalan berbagi satu hasil:
+    `await run(key, factory)` hanya memanggil factory sekali per key in-flight.
+    """
+
+    def __init__(self):
+        self._in_flight = {}
+        self.stats = {"calls": 0, "coalesced": 0}
+
+    async def run(self, key, factory):
+        self.stats["calls"] += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+        # shield: request yang dibatalkan tidak membatalkan fetch milik request lain
+        return await asyncio.shield(task)
+
+
+class AsyncRateLimiter:
+    """Token bucket seperti http_client.RateLimiter, tapi menunggu dengan asyncio.sleep"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst or max(1, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = None
+
+    async def acquire(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # lock dipegang selama menunggu → token dibagi urut kedatangan
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncAPIScraper:
+    """
+    api_url    : override endpoint (mis. stub server lokal)
+    pool_size  : maksimal koneksi (dan request in flight) ke upstream
+    rate_limit : maksimal request/detik ke upstream (None = tanpa limit)
+    """
+
+    def __init__(self, api_url=None, pool_size=20, max_retries=3, backoff=0.5, timeout=30, client=None,
+                 rate_limit=None):
+        self.api_url = api_url or APIScraper.API_URL
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.rate_limiter = AsyncRateLimiter(rate_limit) if rate_limit else None
+        self._client = client
+        # request in flight dibatasi pool_size: sisanya menunggu di sini, bukan di pool httpx (PoolTimeout)
+        self._slots = None
+        self._parser = APIScraper(api_url=self.api_url)
+        self.coalescer = Coalescer()
+
+    async def start(self):
+        if self._client is None:
+            httpx = _require_httpx()
+            limits = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+            self._client = httpx.AsyncClient(limits=limits, timeout=self.timeout)
+        return self
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._slots = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def fetch(self, results=50):
+        users = await self.coalescer.run(("fetch", results), lambda: self._get_page({"results": results}))
+        return [self._parser._parse_user(user) for user in users]
+
+    async def fetch_concurrent(self, results=50, page_size=500, seed=None):
+        """Page di-fetch bersamaan (maksimal pool_size in flight), hasil urut sesuai page"""
+        pages = APIScraper._plan_pages(results, page_size)
+        users = await asyncio.gather(*(
+            self._get_page({"results": page_size, "page": page, **({"seed": seed} if seed is not None else {})}, keep)
+            for page, keep in pages
+        ))
+        return [self._parser._parse_user(user) for page_users in users for user in page_users]
+
+    async def _get_page(self, params, limit=None):
+        """GET dengan retry pada 429/5xx & error koneksi (sama seperti get_with_retry)"""
+        if self._client is None:
+            raise RuntimeError("AsyncAPIScraper not started; call `await scraper.start()` first")
+        httpx = _require_httpx()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+        host = urlsplit(self.api_url).netloc
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                async with self._slots:
+                    response = await self._client.get(self.api_url, params=params)
+            except (httpx.ConnectError, httpx.TimeoutException):
+                HTTP_LATENCY.observe(time.perf_counter() - start, host=host, status="error")
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(min(self.backoff * (2 ** attempt), MAX_BACKOFF))
+                attempt += 1
+                continue
+            HTTP_LATENCY.observe(time.perf_counter() - start, host=host, status=response.status_code)
+
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                await asyncio.sleep(_retry_delay(response, self.backoff * (2 ** attempt)))
+                attempt += 1
+                continue
+
+            response.raise_for_status()
+            return decode_users(response.content, limit)
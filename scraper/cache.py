@@ -0,0 +1,183 @@
+"""
+Cache hasil fetch APIScraper: LRU in-memory dengan TTL + cache disk opsional.
+
+Yang disimpan adalah record tuple (Lead.to_record), bukan objek Lead, jadi
+setiap hit mengembalikan Lead baru — scoring/tagging di satu request tidak
+bocor ke request lain.
+"""
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from config import settings
+from models.lead import Lead
+
+_MISSING = object()
+
+
+def make_key(*parts, **params):
+    """Key stabil dari parameter request"""
+    raw = json.dumps([parts, params], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    maxsize  : jumlah entry di memory (LRU)
+    ttl      : detik sebelum entry dianggap basi
+    disk_dir : folder untuk cache disk (None = memory saja)
+    """
+
+    def __init__(self, maxsize=32, ttl=300, disk_dir=None, clock=time.time):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.clock = clock
+        self._entries = OrderedDict()  # key → (expires_at, value)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "disk_hits": 0, "evictions": 0, "expired": 0}
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def get(self, key, default=None):
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return value
+                del self._entries[key]
+                self.stats["expired"] += 1
+
+        entry = self._read_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.stats["misses"] += 1
+                return default
+            self.stats["disk_hits"] += 1
+            self._store(key, entry)
+            return entry[1]
+
+    def set(self, key, value):
+        entry = (self.clock() + self.ttl, value)
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+
+    def get_or_set(self, key, factory):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.pkl")
+
+    def _read_disk(self, key, now):
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if entry[0] <= now:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def _write_disk(self, key, entry):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # cache disk bersifat best-effort
+
+
+class CachedScraper:
+    """
+    Interface sama dengan APIScraper, tapi hasil fetch diambil dari ResponseCache.
+    max_cached_results: stream iter_fetch_concurrent yang lebih besar tidak di-cache
+    """
+
+    def __init__(self, scraper=None, cache=None, max_cached_results=settings.FETCH_CACHE_MAX_RESULTS):
+        if scraper is None:
+            from scraper.api_scraper import APIScraper
+            scraper = APIScraper()
+        self.scraper = scraper
+        self.cache = cache or ResponseCache(
+            maxsize=settings.FETCH_CACHE_SIZE, ttl=settings.FETCH_CACHE_TTL, disk_dir=settings.FETCH_CACHE_DIR
+        )
+        self.max_cached_results = max_cached_results
+
+    def fetch(self, results=50):
+        key = make_key(self.scraper.api_url, "fetch", results=results)
+        return self._cached(key, lambda: self.scraper.fetch(results=results))
+
+    def fetch_concurrent(self, results=50, page_size=None, max_workers=None, seed=None):
+        key = make_key(self.scraper.api_url, "fetch_concurrent", results=results, page_size=page_size, seed=seed)
+        return self._cached(key, lambda: self.scraper.fetch_concurrent(results, page_size, max_workers, seed))
+
+    def iter_fetch_concurrent(self, results=50, page_size=None, max_workers=None, seed=None, ordered=True):
+        if results > self.max_cached_results:
+            return self.scraper.iter_fetch_concurrent(results, page_size, max_workers, seed)
+        key = make_key(self.scraper.api_url, "fetch_concurrent", results=results, page_size=page_size, seed=seed)
+        records = self.cache.get(key)
+        if records is not None:
+            return (Lead.from_record(record) for record in records)
+        return self._iter_and_store(key, self.scraper.iter_fetch_concurrent(results, page_size, max_workers, seed))
+
+    def _iter_and_store(self, key, leads):
+        # cache miss: lead diteruskan sambil di-fetch, cache diisi hanya jika stream selesai utuh
+        # dan tidak lebih dari max_cached_results (di atas itu record berhenti dikumpulkan)
+        records = []
+        for lead in leads:
+            if records is not None:
+                records.append(lead.to_record())
+                if len(records) > self.max_cached_results:
+                    records = None
+            yield lead
+        if records is not None:
+            self.cache.set(key, tuple(records))
+
+    def invalidate(self):
+        self.cache.clear()
+
+    def _cached(self, key, fetch):
+        records = self.cache.get_or_set(key, lambda: tuple(lead.to_record() for lead in fetch()))
+        return [Lead.from_record(record) for record in records]
@@ -0,0 +1,113 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from monitoring.metrics import HTTP_LATENCY
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# batas atas jeda antar retry: Retry-After dari upstream yang rusak/nakal tidak boleh menahan worker selamanya
+MAX_BACKOFF = 30.0
+
+
+class RateLimiter:
+    """Token bucket: `rate` requests per second with bursts up to `burst`"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst or max(1, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """One RateLimiter per host, created on first use"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = RateLimiter(self.rate, self.burst)
+        limiter.acquire()
+
+
+def build_session(pool_size=10):
+    """requests.Session with a connection pool big enough for `pool_size` workers"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_with_retry(session, url, params=None, max_retries=3, backoff=0.5, timeout=30, rate_limiter=None,
+                   max_backoff=MAX_BACKOFF):
+    """
+    GET with retry on 429/5xx and connection errors.
+    Backoff is exponential (backoff * 2**attempt); a Retry-After header wins if present.
+    Every wait is capped at max_backoff seconds.
+    Every attempt is recorded in the HTTP_LATENCY histogram (rate limiting and backoff excluded).
+    """
+    return request_with_retry(session, "GET", url, max_retries, backoff, timeout, rate_limiter,
+                              max_backoff=max_backoff, params=params)
+
+
+def request_with_retry(session, method, url, max_retries=3, backoff=0.5, timeout=30, rate_limiter=None,
+                       max_backoff=MAX_BACKOFF, **kwargs):
+    """Like get_with_retry for any method; kwargs go to session.request (json=, headers=, ...)"""
+    host = urlsplit(url).netloc
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire(url)
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            HTTP_LATENCY.observe(time.perf_counter() - start, host=host, status="error")
+            if attempt >= max_retries:
+                raise
+            time.sleep(min(backoff * (2 ** attempt), max_backoff))
+            attempt += 1
+            continue
+        HTTP_LATENCY.observe(time.perf_counter() - start, host=host, status=response.status_code)
+
+        if response.status_code in RETRY_STATUSES and attempt < max_retries:
+            time.sleep(_retry_delay(response, backoff * (2 ** attempt), max_backoff))
+            response.close()
+            attempt += 1
+            continue
+
+        response.raise_for_status()
+        return response
+
+
+def _retry_delay(response, default, max_backoff=MAX_BACKOFF):
+    retry_after = response.headers.get("Retry-After")
+    try:
+        delay = max(0.0, float(retry_after)) if retry_after is not None else default
+    except ValueError:
+        delay = default
+    return min(delay, max_backoff)
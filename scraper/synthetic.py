@@ -0,0 +1,106 @@
+"""
+Sumber lead offline dengan interface sama seperti APIScraper (fetch,
+fetch_concurrent, iter_fetch_concurrent) — untuk test & benchmark tanpa
+jaringan, sampai jutaan lead.
+
+Lead ke-i adalah fungsi murni dari (seed, i): field dipilih dari COMPANIES,
+POSITIONS, INDUSTRIES, COMPANY_SIZES dan kota geonames lewat hash integer
+yang di-vektorisasi per page (numpy), jadi page bisa dibuat terpisah dan
+hasilnya selalu sama. Sebagian lead (duplicate_rate) adalah salinan persis
+lead sebelumnya, untuk menguji deduplikasi.
+"""
+import numpy as np
+
+from models.cities import get_city_index
+from models.lead import Lead, NO_TAGS
+from models.seeding import stable_hash
+from scraper.api_scraper import COMPANIES, COMPANY_SIZES, INDUSTRIES, POSITIONS
+
+FIRST_NAMES = ["John", "Jane", "Budi", "Siti", "Maria", "Ahmad", "Lena", "Kenji", "Aisha", "Lucas", "Mei", "Omar"]
+LAST_NAMES = ["Doe", "Santoso", "Wijaya", "Smith", "Garcia", "Tanaka", "Müller", "Rossi", "Kim", "Silva"]
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_SALTS = {
+    field: np.uint64(stable_hash(field, seed="synthetic-salt"))
+    for field in ("first", "last", "company", "position", "location", "industry", "company_size", "duplicate", "source")
+}
+
+
+def _mix(x):
+    """splitmix64 finalizer, vektor uint64 (overflow = wrap-around, memang diinginkan)"""
+    with np.errstate(over="ignore"):
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+
+class SyntheticScraper:
+    """
+    duplicate_rate : peluang sebuah lead menyalin (email sama) lead sebelumnya
+    random_seed    : seed dataset; None = settings.RANDOM_SEED
+    page_size      : jumlah lead per page di iter_fetch_concurrent
+    """
+
+    def __init__(self, duplicate_rate=0.0, random_seed=None, page_size=10_000):
+        self.duplicate_rate = duplicate_rate
+        self.random_seed = random_seed
+        self.page_size = page_size
+        self.api_url = f"synthetic://?duplicate_rate={duplicate_rate}&seed={random_seed}"
+        self._choices = {
+            "first": np.array(FIRST_NAMES, dtype=object),
+            "last": np.array(LAST_NAMES, dtype=object),
+            "company": np.array(COMPANIES, dtype=object),
+            "position": np.array(POSITIONS, dtype=object),
+            "location": np.array(get_city_index().names, dtype=object),
+            "industry": np.array(INDUSTRIES, dtype=object),
+            "company_size": np.array(COMPANY_SIZES, dtype=object),
+        }
+
+    def fetch(self, results=50):
+        return list(self.iter_fetch_concurrent(results))
+
+    def fetch_concurrent(self, results=50, page_size=None, max_workers=None, seed=None):
+        return list(self.iter_fetch_concurrent(results, page_size, max_workers, seed))
+
+    def iter_fetch_concurrent(self, results=50, page_size=None, max_workers=None, seed=None, ordered=True):
+        """max_workers & ordered hanya untuk kompatibilitas interface; hasil selalu urut"""
+        for record in self.iter_records(results, page_size, seed):
+            yield Lead.from_record(record)
+
+    def iter_pages(self, results=50, page_size=None, max_workers=None, seed=None, start_page=1, ordered=True):
+        """(page, leads) per page mulai dari start_page, seperti APIScraper.iter_pages"""
+        page_size = page_size or self.page_size
+        for start in range((start_page - 1) * page_size, results, page_size):
+            records = self._page(start, min(start + page_size, results), seed)
+            yield start // page_size + 1, [Lead.from_record(record) for record in records]
+
+    def iter_records(self, results=50, page_size=None, seed=None):
+        """Record tuple (Lead.FIELDS) tanpa membuat objek Lead — untuk LeadBatch.from_records"""
+        page_size = page_size or self.page_size
+        for start in range(0, results, page_size):
+            yield from self._page(start, min(start + page_size, results), seed)
+
+    def _page(self, start, stop, seed):
+        seed = self.random_seed if seed is None else seed
+        base = np.uint64(stable_hash("synthetic", seed=seed))
+        index = np.arange(start, stop, dtype=np.uint64)
+        if self.duplicate_rate and stop > 1:
+            # lead i duplikat → salin lead j < i; lead j dibuat ulang dari index-nya sendiri
+            draw = _mix(index * _GOLDEN + base + _SALTS["duplicate"]) >> np.uint64(11)
+            duplicate = (draw.astype(np.float64) / float(1 << 53) < self.duplicate_rate) & (index > 0)
+            source = _mix(index * _GOLDEN + base + _SALTS["source"]) % np.maximum(index, np.uint64(1))
+            index = np.where(duplicate, source, index)
+
+        def pick(field):
+            options = self._choices[field]
+            codes = _mix(index * _GOLDEN + base + _SALTS[field]) % np.uint64(len(options))
+            return options[codes.astype(np.intp)]
+
+        first, last = pick("first"), pick("last")
+        names = [f"{f} {l}" for f, l in zip(first, last)]
+        emails = [f"{f.lower()}.{l.lower()}.{i}@example.com" for f, l, i in zip(first, last, index.tolist())]
+        size = stop - start
+        return zip(
+            names, emails, pick("company"), pick("position"), pick("location"),
+            pick("industry"), pick("company_size"), [NO_TAGS] * size, [0] * size,
+        )
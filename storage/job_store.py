@@ -0,0 +1,103 @@
+"""
+Status job pipeline background (processors/jobs.py) di SQLite, supaya status,
+progress dan lokasi hasil tetap ada setelah server restart.
+
+Status: queued → running → succeeded | failed. Job yang masih queued/running
+saat server mati dijalankan lagi oleh JobQueue berikutnya (resume dari
+checkpoint job).
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id           TEXT PRIMARY KEY,
+    status       TEXT NOT NULL DEFAULT 'queued',
+    config       TEXT NOT NULL,
+    format       TEXT NOT NULL,
+    total        INTEGER,
+    processed    INTEGER NOT NULL DEFAULT 0,
+    stages       TEXT NOT NULL DEFAULT '[]',
+    result_path  TEXT,
+    result_count INTEGER,
+    error        TEXT,
+    created_at   REAL NOT NULL,
+    started_at   REAL,
+    finished_at  REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at);
+"""
+
+FIELDS = (
+    "id", "status", "config", "format", "total", "processed", "stages", "result_path", "result_count",
+    "error", "created_at", "started_at", "finished_at",
+)
+JSON_FIELDS = ("config", "stages")
+FINISHED = ("succeeded", "failed")
+
+
+class JobStore:
+    def __init__(self, path="output/jobs/jobs.db"):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def create(self, config, fmt, total=None):
+        """Job baru (queued); return id"""
+        job_id = uuid.uuid4().hex
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, config, format, total, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, json.dumps(config), fmt, total, time.time()),
+            )
+        return job_id
+
+    def update(self, job_id, **fields):
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"unknown job field(s): {', '.join(sorted(unknown))}")
+        values = [json.dumps(value) if key in JSON_FIELDS else value for key, value in fields.items()]
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        with self._lock, self._conn:
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*values, job_id))
+
+    def get(self, job_id):
+        """Job sebagai dict, atau None"""
+        with self._lock:
+            row = self._conn.execute(f"SELECT {', '.join(FIELDS)} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row else None
+
+    def list(self, limit=20):
+        """Job terbaru dulu"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(FIELDS)} FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def unfinished(self):
+        """Id job queued/running (urut waktu dibuat), untuk dijalankan ulang setelah restart"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+            ).fetchall()
+        return [job_id for job_id, in rows]
+
+    def close(self):
+        self._conn.close()
+
+
+def _row_to_job(row):
+    job = dict(zip(FIELDS, row))
+    for key in JSON_FIELDS:
+        job[key] = json.loads(job[key])
+    return job
@@ -0,0 +1,155 @@
+"""
+Koleksi lead in-memory dengan index, untuk query API (filter + sort + cursor).
+
+Lead disimpan urut (score desc, email). Index city/industry/tag berisi
+posisi lead dalam urutan itu, jadi hasil query sudah terurut tanpa sort
+ulang, dan cursor cukup menyimpan key (score, email) lead terakhir.
+"""
+import base64
+import hashlib
+import json
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import islice
+
+# jumlah kombinasi filter yang total-nya disimpan per koleksi
+COUNT_CACHE_SIZE = 256
+
+
+def encode_cursor(lead):
+    raw = json.dumps([lead.score, lead.email], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """(score, email) dari cursor; ValueError jika cursor rusak"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, email = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return int(score), str(email)
+    except Exception as exc:
+        raise ValueError("invalid cursor") from exc
+
+
+class LeadCollection:
+    """
+    Tidak diubah setelah dibuat: untuk dataset baru buat LeadCollection baru lalu
+    tukar referensinya, supaya request/stream yang sedang berjalan tetap membaca
+    lead, index dan version yang konsisten.
+    """
+    SORTS = ("-score", "score")
+
+    def __init__(self, leads=()):
+        leads = sorted(leads, key=lambda lead: (-lead.score, lead.email))
+        self._leads = leads
+        self._keys = [(-lead.score, lead.email) for lead in leads]
+        self._by_city = {}
+        self._by_industry = {}
+        self._by_tag = {}
+        for position, lead in enumerate(leads):
+            self._by_city.setdefault(_fold(lead.location), []).append(position)
+            self._by_industry.setdefault(_fold(lead.industry), []).append(position)
+            for tag in lead.tags:
+                self._by_tag.setdefault(_fold(tag), []).append(position)
+        digest = hashlib.blake2b(digest_size=12)
+        for lead in leads:
+            digest.update(repr(lead.to_record()).encode("utf-8"))
+        # berubah hanya jika isi koleksi berubah → dipakai untuk ETag
+        self.version = digest.hexdigest()
+        self._counts = OrderedDict()
+        self._count_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._leads)
+
+    def __iter__(self):
+        return iter(self._leads)
+
+    def query(self, city=None, industry=None, min_score=None, tags=None, sort="-score", cursor=None, limit=20):
+        """
+        Return (page, next_cursor, total).
+        city/industry/tags case-insensitive; tags harus dimiliki semua.
+        """
+        total = self.count(city, industry, min_score, tags)
+        page = list(islice(self.iter_query(city, industry, min_score, tags, sort, cursor), limit + 1))
+        has_more = len(page) > limit
+        page = page[:limit]
+        next_cursor = encode_cursor(page[-1]) if has_more and page else None
+        return page, next_cursor, total
+
+    def count(self, city=None, industry=None, min_score=None, tags=None):
+        """
+        Jumlah lead yang cocok dengan filter. Satu filter (atau tanpa filter) → O(log n)
+        dari posting list + bisect score; kombinasi filter → scan sekali lalu di-cache
+        (koleksi tidak berubah, jadi hasil valid selama instance ini dipakai).
+        """
+        key = (_fold(city) if city is not None else None, _fold(industry) if industry is not None else None,
+               min_score, tuple(sorted(_fold(tag) for tag in tags or ())))
+        with self._count_lock:
+            if key in self._counts:
+                self._counts.move_to_end(key)
+                return self._counts[key]
+        driver, others = self._plan(city, industry, tags)
+        if not others:
+            # posisi urut score desc: lead dengan score >= min_score ada di depan
+            cutoff = len(self._leads) if min_score is None else bisect_left(self._keys, (1 - min_score, ""))
+            return bisect_left(driver, cutoff) if isinstance(driver, list) else min(cutoff, len(driver))
+        total = sum(
+            1 for position in driver
+            if all(position in other for other in others) and _passes_score(self._leads, position, min_score)
+        )
+        with self._count_lock:
+            self._counts[key] = total
+            if len(self._counts) > COUNT_CACHE_SIZE:
+                self._counts.popitem(last=False)
+        return total
+
+    def iter_query(self, city=None, industry=None, min_score=None, tags=None, sort="-score", cursor=None):
+        """Seperti query, tapi lazy dan tanpa limit (untuk streaming)"""
+        # validasi di sini, bukan di dalam generator: error muncul sebelum response dimulai
+        if sort not in self.SORTS:
+            raise ValueError(f"sort must be one of {self.SORTS}")
+        key = None
+        if cursor:
+            score, email = decode_cursor(cursor)
+            key = (-score, email)
+        driver, others = self._plan(city, industry, tags)
+        if sort == "-score":
+            start = bisect_right(self._keys, key) if key else 0
+            candidates = driver[bisect_left(driver, start):]
+        else:
+            end = bisect_left(self._keys, key) if key else len(self._leads)
+            candidates = reversed(driver[:bisect_left(driver, end)])
+        return self._iter_matches(candidates, others, min_score, sort == "-score")
+
+    def _plan(self, city, industry, tags):
+        postings = []
+        for index, value in ((self._by_city, city), (self._by_industry, industry)):
+            if value is not None:
+                postings.append(index.get(_fold(value), []))
+        for tag in tags or ():
+            postings.append(self._by_tag.get(_fold(tag), []))
+
+        # posting list terpendek jadi driver, sisanya dicek via set
+        postings.sort(key=len)
+        driver = postings[0] if postings else range(len(self._leads))
+        return driver, [set(p) for p in postings[1:]]
+
+    def _iter_matches(self, candidates, others, min_score, descending):
+        leads = self._leads
+        for position in candidates:
+            if not _passes_score(leads, position, min_score):
+                if descending:
+                    break  # urut desc: sisanya pasti lebih kecil
+                continue
+            if all(position in other for other in others):
+                yield leads[position]
+
+
+def _passes_score(leads, position, min_score):
+    return min_score is None or leads[position].score >= min_score
+
+
+def _fold(value):
+    return (value or "").casefold()
@@ -0,0 +1,237 @@
+"""
+Index in-memory multi-atribut untuk filter lead yang berulang (dashboard,
+LeadFilter) tanpa scan seluruh list.
+
+- location, industry, company_size: kode kategori per lead + posting list
+  (posisi lead, urut) per nilai
+- tags: bitmap per tag (jumlah tag unik kecil)
+- score: urutan posisi berdasarkan score desc, untuk min_score & top-k
+
+Filter gabungan memakai posting list terpendek sebagai driver, lalu dicek ke
+kolom kode / bitmap lain secara vektor (numpy), jadi biaya query sebanding
+dengan ukuran hasil terkecil, bukan jumlah lead. Posisi = urutan lead saat
+index dibuat; hasil filter selalu dalam urutan itu. Index adalah snapshot
+(index.leads = tuple lead saat dibuat): buat ulang jika lead berubah (mis.
+setelah scoring ulang). None dan "All" berarti tanpa filter.
+
+    index = LeadIndex(leads)
+    index.filter(location="Jakarta", industry="Tech")      # list Lead
+    index.positions(industry="Tech", tags=["High Potential"], min_score=60)
+    index.top_k(10, location="Jakarta")                     # posisi, score tertinggi dulu
+"""
+import operator
+
+import numpy as np
+
+from models.lead_batch import LeadBatch
+
+ANY = (None, "All")
+
+
+class LeadIndex:
+    FIELDS = ("location", "industry", "company_size")
+
+    def __init__(self, leads=()):
+        # snapshot, bukan list aslinya: list yang diubah setelah ini tidak membuat hasil basi
+        self.leads = tuple(leads) if isinstance(leads, list) else None
+        batch = leads if isinstance(leads, LeadBatch) else LeadBatch(leads)
+        columns = {}
+        for field in self.FIELDS:
+            column = batch._categorical(field)
+            columns[field] = (np.array(column.codes, dtype=np.int32), list(column.categories))
+        self._build(
+            columns,
+            np.array(batch.tags.codes, dtype=np.int32),
+            batch.tags.categories,
+            np.array(batch.scores, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_frame(cls, df):
+        """Index dari DataFrame (mis. dashboard); kolom kategori dipakai kodenya langsung"""
+        import pandas as pd
+
+        index = cls.__new__(cls)
+        index.leads = None
+        columns = {}
+        for field in cls.FIELDS:
+            series = df[field]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy().astype(np.int32)
+                categories = list(series.cat.categories)
+            else:
+                codes, uniques = pd.factorize(series, use_na_sentinel=True)
+                codes, categories = codes.astype(np.int32), list(uniques)
+            if (codes < 0).any():
+                codes[codes < 0] = len(categories)
+                categories.append(None)
+            columns[field] = (codes, categories)
+        combos = {}
+        tag_codes = np.fromiter(
+            (combos.setdefault(tuple(tags), len(combos)) for tags in df["tags"]), dtype=np.int32, count=len(df)
+        )
+        index._build(columns, tag_codes, list(combos), df["score"].to_numpy(dtype=np.int64))
+        return index
+
+    def _build(self, columns, tag_codes, tag_combos, scores):
+        self._size = len(scores)
+        self._codes = {}
+        self._lookup = {}
+        self._postings = {}
+        for field, (codes, categories) in columns.items():
+            self._codes[field] = codes
+            self._lookup[field] = {value: code for code, value in enumerate(categories)}
+            # stable argsort per kode → posting list tiap nilai sudah urut posisi
+            order = np.argsort(codes, kind="stable")
+            counts = np.bincount(codes, minlength=len(categories))
+            self._postings[field] = np.split(order, np.cumsum(counts)[:-1])
+
+        self._tag_bitmaps = {}
+        tags = sorted({tag for combo in tag_combos for tag in combo})
+        for tag in tags:
+            flags = np.array([tag in combo for combo in tag_combos], dtype=bool)
+            self._tag_bitmaps[tag] = flags[tag_codes]
+        self._tag_postings = {}
+
+        self._scores = scores
+        # posisi urut score desc (seri: urutan posisi) + score-nya, untuk searchsorted
+        self._by_score = np.argsort(-scores, kind="stable")
+        self._sorted_neg_scores = -scores[self._by_score]
+
+    def __len__(self):
+        return self._size
+
+    def covers(self, leads):
+        """True jika leads berisi lead yang sama (objek & urutan) dengan snapshot index"""
+        snapshot = self.leads
+        if snapshot is None or not isinstance(leads, (list, tuple)) or len(leads) != len(snapshot):
+            return False
+        return leads is snapshot or all(map(operator.is_, leads, snapshot))
+
+    # --- metadata
+
+    def values(self, field):
+        """Nilai unik yang ada di index (untuk opsi filter)"""
+        if field == "tags":
+            return sorted(self._tag_bitmaps)
+        postings = self._postings[field]
+        return sorted(value for value, code in self._lookup[field].items() if value and len(postings[code]))
+
+    def count(self, field, value):
+        """Jumlah lead dengan field == value, langsung dari panjang posting list"""
+        if field == "tags":
+            return len(self._tag_posting(value))
+        code = self._lookup[field].get(value)
+        return 0 if code is None else len(self._postings[field][code])
+
+    # --- query
+
+    def positions(self, location=None, industry=None, company_size=None, tags=None, min_score=None):
+        """Posisi lead (urut) yang lolos semua filter; None / "All" = tanpa filter"""
+        plan = self._plan(location=location, industry=industry, company_size=company_size, tags=tags)
+        if plan is None:
+            return np.empty(0, dtype=np.intp)
+        postings, checks = plan
+        if not postings:
+            if min_score is None:
+                return np.arange(self._size)
+            return np.sort(self._above(min_score))
+
+        driver = min(range(len(postings)), key=lambda i: len(postings[i]))
+        result = postings[driver]
+        for i, (column, expected) in enumerate(checks):
+            if i != driver and len(result):
+                result = result[column[result] == expected]
+        if min_score is not None and len(result):
+            result = result[self._scores[result] >= min_score]
+        return result
+
+    def top_k(self, k, location=None, industry=None, company_size=None, tags=None, min_score=None):
+        """
+        Posisi k lead dengan score tertinggi yang lolos filter, score desc
+        (seri: urutan posisi), tanpa sort penuh: filter selektif → argpartition
+        pada hasil filter; filter longgar → scan index score sampai dapat k.
+        """
+        plan = self._plan(location=location, industry=industry, company_size=company_size, tags=tags)
+        if plan is None or k <= 0:
+            return np.empty(0, dtype=np.intp)
+        postings, checks = plan
+        ordered = self._above(min_score) if min_score is not None else self._by_score
+        if not postings:
+            return ordered[:k]
+
+        smallest = min(len(posting) for posting in postings)
+        if smallest * smallest > k * self._size:
+            # ~k * n / smallest posisi perlu dicek sebelum dapat k hasil
+            return self._scan(ordered, checks, k)
+
+        candidates = self.positions(location, industry, company_size, tags, min_score)
+        if len(candidates) > k:
+            # k terbesar dalam O(n); seri di batas k diputus dengan posisi terkecil
+            scores = self._scores[candidates]
+            threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+            above = candidates[scores > threshold]
+            tied = candidates[scores == threshold][:k - len(above)]
+            candidates = np.concatenate([above, tied])
+        return candidates[np.lexsort((candidates, -self._scores[candidates]))]
+
+    def filter(self, **filters):
+        """Seperti positions(), tapi return list Lead (index harus dibuat dari list)"""
+        return self._take(self.positions(**filters))
+
+    def top_leads(self, k, **filters):
+        return self._take(self.top_k(k, **filters))
+
+    def _take(self, positions):
+        if self.leads is None:
+            raise ValueError("LeadIndex was not built from a list of leads; use positions() instead")
+        leads = self.leads
+        return [leads[position] for position in positions.tolist()]
+
+    def _plan(self, location, industry, company_size, tags):
+        """([posting list], [(kolom kode/bitmap, nilai yang cocok)]), atau None jika pasti kosong"""
+        postings = []
+        checks = []
+        for field, value in (("location", location), ("industry", industry), ("company_size", company_size)):
+            if value in ANY:
+                continue
+            code = self._lookup[field].get(value)
+            if code is None:
+                return None
+            postings.append(self._postings[field][code])
+            checks.append((self._codes[field], code))
+        for tag in tags or ():
+            if tag not in self._tag_bitmaps:
+                return None
+            postings.append(self._tag_posting(tag))
+            checks.append((self._tag_bitmaps[tag], True))
+        return postings, checks
+
+    @staticmethod
+    def _scan(ordered, checks, k):
+        found = []
+        total = 0
+        start, step = 0, max(1024, 4 * k)
+        while start < len(ordered) and total < k:
+            chunk = ordered[start:start + step]
+            mask = np.ones(len(chunk), dtype=bool)
+            for column, expected in checks:
+                mask &= column[chunk] == expected
+            found.append(chunk[mask])
+            total += len(found[-1])
+            start += step
+            step *= 2
+        return np.concatenate(found)[:k] if found else np.empty(0, dtype=np.intp)
+
+    def _above(self, min_score):
+        """Posisi dengan score >= min_score, urut score desc"""
+        end = np.searchsorted(self._sorted_neg_scores, -min_score, side="right")
+        return self._by_score[:end]
+
+    def _tag_posting(self, tag):
+        posting = self._tag_postings.get(tag)
+        if posting is None:
+            bitmap = self._tag_bitmaps.get(tag)
+            posting = np.flatnonzero(bitmap) if bitmap is not None else np.empty(0, dtype=np.intp)
+            self._tag_postings[tag] = posting
+        return posting
@@ -0,0 +1,231 @@
+"""
+Persistent lead store (SQLite) supaya run berikutnya incremental.
+
+Alur di pipeline:
+    fetch → store.iter_new_or_changed → scoring/tagging → store.iter_upsert
+
+iter_new_or_changed membuang lead yang data upstream-nya sama dengan run
+sebelumnya (dibandingkan lewat hash kolom input), jadi hanya lead baru /
+berubah yang di-score ulang. Semua read/write dilakukan per batch.
+Hash input tidak mencakup config stage/scorer, jadi runner memanggil
+sync_fingerprint: jika config pemrosesan berubah, semua lead diproses ulang.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from itertools import islice
+
+from models.lead import Lead
+
+INPUT_FIELDS = ("name", "company", "position", "location", "industry", "company_size")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads (
+    email        TEXT PRIMARY KEY,
+    name         TEXT,
+    company      TEXT,
+    position     TEXT,
+    location     TEXT,
+    industry     TEXT,
+    company_size TEXT,
+    tags         TEXT NOT NULL DEFAULT '[]',
+    score        INTEGER NOT NULL DEFAULT 0,
+    missing_info TEXT,
+    input_hash   TEXT,
+    first_seen   REAL NOT NULL,
+    updated_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_leads_location ON leads(location, score DESC);
+CREATE INDEX IF NOT EXISTS idx_leads_industry ON leads(industry, score DESC);
+CREATE INDEX IF NOT EXISTS idx_leads_score ON leads(score DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+COLUMNS = ("email", "name", "company", "position", "location", "industry", "company_size", "tags", "score", "missing_info")
+
+
+def input_hash(lead):
+    """Hash dari field input (sebelum diproses) untuk deteksi perubahan"""
+    raw = "\x1f".join(str(getattr(lead, field) or "") for field in INPUT_FIELDS)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class LeadStore:
+    """
+    path       : file SQLite (":memory:" untuk test)
+    batch_size : jumlah lead per query/commit (dibatasi limit parameter SQLite)
+    """
+
+    def __init__(self, path="output/leads.db", batch_size=500):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.batch_size = min(batch_size, 900)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        # email → input_hash untuk lead yang sedang lewat pipeline
+        self._pending = {}
+        self.stats = {"new": 0, "changed": 0, "unchanged": 0, "written": 0}
+
+    # --- pipeline stages
+
+    def iter_new_or_changed(self, leads):
+        """Yield hanya lead yang belum ada atau data upstream-nya berubah"""
+        for chunk in _chunks(leads, self.batch_size):
+            known = self._existing_hashes([lead.email for lead in chunk])
+            for lead in chunk:
+                current = input_hash(lead)
+                if lead.email not in known:
+                    self.stats["new"] += 1
+                elif known[lead.email] == current:
+                    self.stats["unchanged"] += 1
+                    continue
+                else:
+                    self.stats["changed"] += 1
+                self._pending[lead.email] = current
+                yield lead
+
+    def iter_upsert(self, leads):
+        """Tulis lead (setelah diproses) ke store per batch, lalu teruskan ke stage berikutnya"""
+        for chunk in _chunks(leads, self.batch_size):
+            self.upsert_many(chunk)
+            yield from chunk
+
+    # --- bulk API
+
+    def upsert_many(self, leads):
+        now = time.time()
+        rows = []
+        for lead in leads:
+            hashed = self._pending.pop(lead.email, None) or input_hash(lead)
+            rows.append((
+                lead.email, lead.name, lead.company, lead.position, lead.location, lead.industry,
+                lead.company_size, json.dumps(list(lead.tags)), lead.score,
+                getattr(lead, "missing_info", None), hashed, now, now,
+            ))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO leads (email, name, company, position, location, industry, company_size,
+                                   tags, score, missing_info, input_hash, first_seen, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(email) DO UPDATE SET
+                    name = excluded.name, company = excluded.company, position = excluded.position,
+                    location = excluded.location, industry = excluded.industry,
+                    company_size = excluded.company_size, tags = excluded.tags, score = excluded.score,
+                    missing_info = excluded.missing_info, input_hash = excluded.input_hash,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+        self.stats["written"] += len(rows)
+        return len(rows)
+
+    def invalidate(self):
+        """Paksa semua lead diproses ulang di run berikutnya (mis. bobot scoring berubah)"""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE leads SET input_hash = NULL")
+
+    def sync_fingerprint(self, fingerprint):
+        """
+        Simpan fingerprint config pemrosesan (stage + scorer). Jika berbeda dengan
+        yang tersimpan, store di-invalidate dalam transaksi yang sama. Return True
+        jika invalidate dilakukan.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+            if row is not None and row[0] == fingerprint:
+                return False
+            self._conn.execute("UPDATE leads SET input_hash = NULL")
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)", (fingerprint,))
+        return True
+
+    # --- queries
+
+    def get(self, email):
+        leads = list(self.iter_query(email=email, limit=1))
+        return leads[0] if leads else None
+
+    def query(self, **filters):
+        return list(self.iter_query(**filters))
+
+    def iter_query(self, location=None, industry=None, min_score=None, email=None, limit=None, order_by_score=True):
+        """Lead dari store; filter memakai index location/industry/score"""
+        clauses, params = [], []
+        if email is not None:
+            clauses.append("email = ?")
+            params.append(email)
+        if location is not None:
+            clauses.append("location = ?")
+            params.append(location)
+        if industry is not None:
+            clauses.append("industry = ?")
+            params.append(industry)
+        if min_score is not None:
+            clauses.append("score >= ?")
+            params.append(min_score)
+        sql = f"SELECT {', '.join(COLUMNS)} FROM leads"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY score DESC, email" if order_by_score else " ORDER BY rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            rows = cursor.fetchmany(self.batch_size)
+        while rows:
+            for row in rows:
+                yield self._row_to_lead(row)
+            with self._lock:
+                rows = cursor.fetchmany(self.batch_size)
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _existing_hashes(self, emails):
+        placeholders = ",".join("?" * len(emails))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT email, input_hash FROM leads WHERE email IN ({placeholders})", emails
+            ).fetchall()
+        return dict(rows)
+
+    @staticmethod
+    def _row_to_lead(row):
+        email, name, company, position, location, industry, company_size, tags, score, missing_info = row
+        lead = Lead(name, email, company, position, location, industry, company_size)
+        lead.tags = json.loads(tags)
+        lead.score = score
+        lead.missing_info = missing_info
+        return lead
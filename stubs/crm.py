@@ -0,0 +1,137 @@
+"""
+Local stand-in for a CRM bulk-upsert endpoint, used by tests and benchmarks
+of crm/pusher.py.
+
+    POST /leads/bulk   {"leads": [{"idempotency_key": ..., "email": ..., ...}, ...]}
+    → 200 {"created": n, "updated": n, "unchanged": n}
+
+Records are upserted by idempotency_key, so a retried batch never creates
+duplicates. A repeated Idempotency-Key header replays the first response
+without touching the records.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubCRMServer:
+    """
+    Threaded HTTP server on localhost. Usable as a context manager.
+
+    latency       : seconds of artificial delay per request
+    fail_statuses : status codes returned (in order) before serving normally,
+                    e.g. [503, 429] → first request 503, second 429, then 200
+    """
+
+    def __init__(self, latency=0.0, fail_statuses=None, port=0):
+        self.latency = latency
+        self.fail_statuses = list(fail_statuses or [])
+        self.records = {}
+        self.request_count = 0
+        self.received = 0
+        self.replayed = 0
+        self.max_in_flight = 0
+        self._responses = {}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/leads/bulk"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _begin(self):
+        with self._lock:
+            self.request_count += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            return self.fail_statuses.pop(0) if self.fail_statuses else None
+
+    def _done(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _upsert(self, batch_key, leads):
+        with self._lock:
+            if batch_key and batch_key in self._responses:
+                self.replayed += 1
+                return self._responses[batch_key]
+            result = {"created": 0, "updated": 0, "unchanged": 0}
+            for lead in leads:
+                self.received += 1
+                key = lead["idempotency_key"]
+                previous = self.records.get(key)
+                if previous is None:
+                    result["created"] += 1
+                elif previous == lead:
+                    result["unchanged"] += 1
+                else:
+                    result["updated"] += 1
+                self.records[key] = lead
+            if batch_key:
+                self._responses[batch_key] = result
+            return result
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body are written separately; with Nagle + delayed ACK that costs ~40 ms per request
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                failure = stub._begin()
+                try:
+                    body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                    if stub.latency:
+                        time.sleep(stub.latency)
+                    if failure is not None:
+                        self._send(failure, {"error": "stub failure"}, {"Retry-After": "0"})
+                        return
+                    try:
+                        leads = json.loads(body)["leads"]
+                        if not all(lead.get("idempotency_key") for lead in leads):
+                            raise ValueError("missing idempotency_key")
+                    except (ValueError, KeyError, TypeError, AttributeError) as exc:
+                        self._send(400, {"error": str(exc)})
+                        return
+                    self._send(200, stub._upsert(self.headers.get("Idempotency-Key"), leads))
+                finally:
+                    stub._done()
+
+            def _send(self, status, payload, headers=None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
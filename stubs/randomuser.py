@@ -0,0 +1,129 @@
+"""
+Local stand-in for https://randomuser.me/api/ used by tests and benchmarks.
+
+Responses are deterministic for a given (seed, page, results), so pages fetched
+concurrently can be compared against pages fetched one by one.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIRST_NAMES = ["John", "Jane", "Budi", "Siti", "Maria", "Ahmad", "Lena", "Kenji"]
+LAST_NAMES = ["Doe", "Santoso", "Wijaya", "Smith", "Garcia", "Tanaka", "Müller"]
+CITIES = ["Jakarta", "Bandung", "London", "Tokyo", "Berlin", "Paris", "Surabaya"]
+
+
+def make_user(seed, index):
+    """Fake randomuser.me record; `index` is the global position across pages"""
+    return {
+        "name": {
+            "title": "Mx",
+            "first": FIRST_NAMES[index % len(FIRST_NAMES)],
+            "last": LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)],
+        },
+        "email": f"user{index}.{seed}@example.com",
+        "location": {"city": CITIES[index % len(CITIES)], "country": "Indonesia"},
+    }
+
+
+def make_page(seed, page, results):
+    start = (page - 1) * results
+    return {
+        "results": [make_user(seed, start + i) for i in range(results)],
+        "info": {"seed": seed, "results": results, "page": page, "version": "1.4"},
+    }
+
+
+class StubRandomUserServer:
+    """
+    Threaded HTTP server on localhost. Usable as a context manager.
+
+    latency       : seconds of artificial delay per request
+    fail_statuses : status codes returned (in order) before serving normally,
+                    e.g. [429, 503] → first request 429, second 503, then 200
+    retry_after   : Retry-After header sent with those failures
+    """
+
+    def __init__(self, latency=0.0, fail_statuses=None, port=0, retry_after="0"):
+        self.latency = latency
+        self.fail_statuses = list(fail_statuses or [])
+        self.retry_after = retry_after
+        self.request_count = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _next_failure(self):
+        with self._lock:
+            self.request_count += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            return self.fail_statuses.pop(0) if self.fail_statuses else None
+
+    def _done(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                failure = stub._next_failure()
+                try:
+                    if stub.latency:
+                        time.sleep(stub.latency)
+                    if failure is not None:
+                        self._send(failure, {"error": "stub failure"}, {"Retry-After": stub.retry_after})
+                        return
+                    query = parse_qs(urlsplit(self.path).query)
+                    results = int(query.get("results", ["1"])[0])
+                    page = int(query.get("page", ["1"])[0])
+                    seed = query.get("seed", ["stub"])[0]
+                    self._send(200, make_page(seed, page, results))
+                finally:
+                    stub._done()
+
+            def _send(self, status, payload, headers=None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
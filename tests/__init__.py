@@ -0,0 +1,9 @@
+import os
+import tempfile
+
+from config import settings
+
+# snapshot index kota (models/cities.py) ditulis ke folder sementara, bukan output/ project
+settings.CITY_INDEX_CACHE = os.path.join(tempfile.mkdtemp(prefix="lead-scraper-test-"), "cities.pkl")
+# create_app membuat JobQueue di JOB_DIR saat startup
+settings.JOB_DIR = os.path.join(tempfile.mkdtemp(prefix="lead-scraper-jobs-"), "jobs")
@@ -0,0 +1,39 @@
+"""Builder lead sintetis yang dipakai bersama oleh modul test"""
+from models.lead import Lead
+
+FIELDS = ("name", "email", "company", "position", "location", "industry", "company_size")
+
+
+def make_leads(n, name="L{i}", email="l{i}@example.com", company="Co", position="Engineer",
+               location="Jakarta", industry="Tech", company_size="Medium", score=None, tags=None):
+    """
+    n lead; tiap field (juga score) boleh berupa:
+    - nilai tetap — string boleh memuat {i} (nomor lead), mis. "l{i:02d}@example.com"
+    - list/tuple — nilai ke-(i % len), mis. ("Paris", "Jakarta") bergantian
+    - callable(i) → nilai
+    score None = default Lead; tags = callable(i, lead) → tag yang ditambahkan (setelah score).
+    Field dievaluasi urut FIELDS lalu score lalu tags (penting untuk callable berbasis random).
+    """
+    values = {
+        "name": name, "email": email, "company": company, "position": position,
+        "location": location, "industry": industry, "company_size": company_size,
+    }
+    leads = []
+    for i in range(n):
+        lead = Lead(*(_value(values[field], i) for field in FIELDS))
+        if score is not None:
+            lead.score = _value(score, i)
+        for tag in tags(i, lead) if tags is not None else ():
+            lead.add_tag(tag)
+        leads.append(lead)
+    return leads
+
+
+def _value(spec, i):
+    if callable(spec):
+        return spec(i)
+    if isinstance(spec, (list, tuple)):
+        return spec[i % len(spec)]
+    if isinstance(spec, str):
+        return spec.format(i=i)
+    return spec
@@ -0,0 +1,53 @@
+import asyncio
+import time
+import unittest
+import httpx
+from starlette.testclient import TestClient
+from scraper.async_client import AsyncAPIScraper
+from stubs.randomuser import StubRandomUserServer
+from ui.asgi_app import create_asgi_app
+
+class TestAsgiApp(unittest.TestCase):
+    def test_concurrent_requests_share_one_upstream_fetch(self):
+        async def burst(app, scraper):
+            async with scraper:
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    return await asyncio.gather(*(client.get("/leads?limit=5&city=Jakarta") for _ in range(20)))
+
+        with StubRandomUserServer(latency=0.1) as stub:
+            scraper = AsyncAPIScraper(api_url=stub.url)
+            responses = asyncio.run(burst(create_asgi_app(scraper, dataset_size=40), scraper))
+            self.assertEqual(stub.request_count, 1)
+        self.assertTrue(all(r.status_code == 200 for r in responses))
+        self.assertEqual(len({r.headers["etag"] for r in responses}), 1)
+        self.assertTrue(all(lead["location"] == "Jakarta" for lead in responses[0].json()["data"]))
+
+    def test_fetch_concurrent_bounded_and_rate_limited(self):
+        async def fetch(scraper):
+            async with scraper:
+                return await scraper.fetch_concurrent(results=60, page_size=5, seed="abc")
+
+        with StubRandomUserServer(latency=0.02) as stub:
+            start = time.monotonic()
+            leads = asyncio.run(fetch(AsyncAPIScraper(api_url=stub.url, pool_size=3, rate_limit=20)))
+            # burst 20 token, 12 page → tidak menunggu rate; in flight maksimal pool_size
+            self.assertLessEqual(stub.max_in_flight, 3)
+            self.assertEqual(stub.request_count, 12)
+            leads_limited = asyncio.run(fetch(AsyncAPIScraper(api_url=stub.url, pool_size=3, rate_limit=5)))
+            # burst 5, sisa 7 page dengan 5 request/detik
+            self.assertGreaterEqual(time.monotonic() - start, 1.3)
+        self.assertEqual([lead.email for lead in leads], [f"user{i}.abc@example.com" for i in range(60)])
+        self.assertEqual(len(leads_limited), 60)
+
+    def test_lifespan_opens_and_closes_pool(self):
+        with StubRandomUserServer(fail_statuses=[503]) as stub:
+            scraper = AsyncAPIScraper(api_url=stub.url, backoff=0)
+            with TestClient(create_asgi_app(scraper, dataset_size=10)) as client:
+                self.assertIsNotNone(scraper._client)
+                first = client.get("/leads")
+                self.assertEqual(first.status_code, 200)
+                self.assertEqual(first.json()["meta"]["total"], 10)
+                cached = client.get("/leads", headers={"If-None-Match": first.headers["etag"]})
+                self.assertEqual(cached.status_code, 304)
+            self.assertIsNone(scraper._client)
@@ -0,0 +1,18 @@
+import json
+import os
+import tempfile
+import unittest
+from benchmarks import suite
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_results_saved_as_json(self):
+        output = os.path.join(tempfile.mkdtemp(), "bench.json")
+        report = suite.main(["--n", "200", "--repeat", "1", "--only", "score", "export.json", "--output", output])
+        with open(output) as f:
+            saved = json.load(f)
+        self.assertEqual(set(saved["results"]), {"score.apply", "score.batch", "export.json", "export.jsonl"})
+        self.assertEqual(saved["results"]["score.apply"]["n"], 200)
+        self.assertEqual(suite.compare(report["results"], saved, threshold=10), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from scraper.api_scraper import APIScraper
+from scraper.cache import CachedScraper, ResponseCache
+from stubs.randomuser import StubRandomUserServer
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    def __call__(self):
+        return self.now
+
+class TestResponseCache(unittest.TestCase):
+    def test_lru_and_ttl(self):
+        clock = FakeClock()
+        cache = ResponseCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)  # evict b (least recently used)
+        self.assertIsNone(cache.get("b"))
+        clock.now += 11
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats, {"hits": 1, "misses": 2, "disk_hits": 0, "evictions": 1, "expired": 1})
+
+    def test_disk_cache_survives_new_instance(self):
+        disk_dir = tempfile.mkdtemp()
+        ResponseCache(ttl=60, disk_dir=disk_dir).set("k", [1, 2])
+        cache = ResponseCache(ttl=60, disk_dir=disk_dir)
+        self.assertEqual(cache.get("k"), [1, 2])
+        self.assertEqual(cache.stats["disk_hits"], 1)
+
+class TestCachedScraper(unittest.TestCase):
+    def test_repeat_fetch_hits_cache_with_fresh_leads(self):
+        with StubRandomUserServer() as stub:
+            scraper = CachedScraper(APIScraper(api_url=stub.url), ResponseCache(ttl=60))
+            first = scraper.fetch(results=10)
+            first[0].score = 99
+            second = scraper.fetch(results=10)
+            scraper.fetch(results=20)
+            self.assertEqual(stub.request_count, 2)
+        self.assertEqual([l.email for l in first], [l.email for l in second])
+        self.assertEqual(second[0].score, 0)
+        self.assertEqual(scraper.cache.stats["hits"], 1)
+
+    def test_large_streams_not_cached(self):
+        with StubRandomUserServer() as stub:
+            scraper = CachedScraper(APIScraper(api_url=stub.url), ResponseCache(ttl=60), max_cached_results=10)
+            for _ in range(2):
+                self.assertEqual(len(list(scraper.iter_fetch_concurrent(results=10, page_size=5))), 10)
+                self.assertEqual(len(list(scraper.iter_fetch_concurrent(results=25, page_size=5))), 25)
+            # 10 lead: page di-fetch sekali lalu dari cache; 25 lead: selalu fetch (5 page per stream)
+            self.assertEqual(stub.request_count, 2 + 5 * 2)
+        self.assertEqual(len(scraper.cache), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import os
+import tempfile
+import unittest
+from models.cities import City, CityIndex
+
+class TestCityIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = CityIndex([
+            City("São Paulo", "BR", 10021295),
+            City("Jakarta", "ID", 8540121),
+            City("Paris", "US", 25171),
+            City("Paris", "FR", 2138551),
+        ])
+
+    def test_membership_and_lookup(self):
+        self.assertIn("Jakarta", self.index)
+        self.assertNotIn("jakarta", self.index)
+        self.assertEqual(self.index.canonical("  sao   PAULO "), "São Paulo")
+        self.assertEqual(self.index.lookup("paris").country_code, "FR")
+        self.assertIsNone(self.index.canonical("Atlantis"))
+
+    def test_snapshot_round_trip(self):
+        path = os.path.join(tempfile.mkdtemp(), "cities.pkl")
+        self.index.save(path)
+        loaded = CityIndex.load(path)
+        self.assertEqual(loaded.names, self.index.names)
+        self.assertEqual(loaded.lookup("sao paulo"), self.index.lookup("sao paulo"))
+        self.assertIsNone(CityIndex.load(path + ".missing"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import random
+import unittest
+from models.lead import Lead
+from processors.classifier import COMPANY_KEYWORDS, POSITION_KEYWORDS, IndustryClassifier
+from processors.enricher import LeadEnricher
+from processors.tagger import LeadTagger
+
+def naive_classify(keyword_map, text, default="General"):
+    for industry, keywords in keyword_map.items():
+        if any(k.lower() in (text or "").lower() for k in keywords):
+            return industry
+    return default
+
+class TestIndustryClassifier(unittest.TestCase):
+    def test_matches_naive_scan(self):
+        keyword_map = {"A": ["hers", "ab"], "B": ["she", "bca"], "C": ["he", "c"], "D": ["his"]}
+        classifier = IndustryClassifier(keyword_map, cache_size=0)
+        rng = random.Random(3)
+        for _ in range(2000):
+            text = "".join(rng.choice("abcehirsAS ") for _ in range(rng.randint(0, 12)))
+            self.assertEqual(classifier.classify(text), naive_classify(keyword_map, text), text)
+
+    def test_priority_follows_map_order(self):
+        classifier = IndustryClassifier(POSITION_KEYWORDS)
+        self.assertEqual(classifier.classify("Investment Bank Software Developer"), "Tech")
+        self.assertEqual(classifier.classify("Medical Store Clerk"), "Retail")
+        self.assertEqual(classifier.classify("Sales Executive"), "General")
+        self.assertEqual(classifier.classify_many(["Data Engineer", "", "Shop Owner"]), ["Tech", "General", "Retail"])
+
+    def test_tagger_and_enricher_use_classifier(self):
+        leads = [Lead("A", "a@example.com", "EduSmart", "Clinic Nurse", "Jakarta")]
+        LeadTagger().tag_industry(leads)
+        self.assertEqual(leads[0].industry, "Healthcare")
+
+        lead = Lead("B", "b@example.com", "HealthPlus Tech", "Consultant", "Jakarta")
+        LeadEnricher().enrich_leads([lead])
+        self.assertEqual(lead.industry, naive_classify(COMPANY_KEYWORDS, "HealthPlus Tech"))
+
+        lead = Lead("C", "c@example.com", "Co", "Farmer", "Jakarta")
+        LeadTagger(industry_map={"Agriculture": ["farm"]}).tag_industry([lead])
+        self.assertEqual(lead.industry, "Agriculture")
+
+if __name__ == "__main__":
+    unittest.main()
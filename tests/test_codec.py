@@ -0,0 +1,48 @@
+import importlib
+import json
+import sys
+import unittest
+from unittest import mock
+from models import codec
+from models.lead import Lead
+from scraper.cache import CachedScraper
+from scraper.synthetic import SyntheticScraper
+from stubs.randomuser import make_page
+from ui.flask_app import create_app
+
+class TestCodec(unittest.TestCase):
+    def test_decode_users(self):
+        page = make_page("seed", 2, 5)
+        page["results"][0]["name"]["first"] = "Zoë"
+        users = codec.decode_users(json.dumps(page).encode("utf-8"), limit=3)
+        self.assertEqual(len(users), 3)
+        self.assertEqual(users[0], ("Zoë " + page["results"][0]["name"]["last"], page["results"][0]["email"],
+                                    page["results"][0]["location"]["city"]))
+        self.assertEqual(users[1].email, "user6.seed@example.com")
+        for body in (b"not json", b'{"error": "down"}', b'{"results": [{"name": {}}]}'):
+            with self.assertRaises(ValueError):
+                codec.decode_users(body)
+
+    def test_stdlib_fallback_matches(self):
+        payload = {"data": [Lead("Zoë", "z@example.com", "Co", location="São Paulo").to_dict()], "n": 1}
+        try:
+            with mock.patch.dict(sys.modules, {"orjson": None}):
+                fallback = importlib.reload(codec)
+                self.assertEqual(fallback.BACKEND, "json")
+                encoded = fallback.dumps(payload)
+                users = fallback.decode_users(json.dumps(make_page("s", 1, 2)))
+        finally:
+            importlib.reload(codec)
+        self.assertEqual(encoded, json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        self.assertEqual(codec.loads(codec.dumps(payload)), payload)
+        self.assertEqual(users, codec.decode_users(json.dumps(make_page("s", 1, 2))))
+
+    def test_flask_responses_use_codec(self):
+        client = create_app(CachedScraper(SyntheticScraper()), dataset_size=20).test_client()
+        response = client.get("/leads?limit=3")
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_json()["meta"]["count"], 3)
+        self.assertEqual(response.data, codec.dumps(response.get_json()) + b"\n")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import tempfile
+import time
+import unittest
+import requests
+from functools import partial
+from unittest import mock
+from crm.outbox import CRMOutbox, lead_key
+from crm.pusher import CRMPusher
+from models.lead import Lead
+from stubs.crm import StubCRMServer
+from config.pipeline import load_config
+from processors.runner import PipelineRunner
+from tests import helpers
+
+make_leads = partial(helpers.make_leads, email="L{i}@Example.com", score=60)
+
+def make_config(directory):
+    return load_config(overrides={
+        "fetch": {"source": "synthetic", "results": 100, "page_size": 10},
+        "store": os.path.join(directory, "leads.db"),
+        "checkpoint": os.path.join(directory, "checkpoint.json"),
+        "report_dir": "",
+        "exporters": [{"path": os.path.join(directory, "leads.csv")}],
+    })
+
+class TestCRMPusher(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "outbox.db")
+
+    def test_bulk_push_is_batched_concurrent_and_idempotent(self):
+        leads = make_leads(2000)
+        with StubCRMServer(latency=0.02) as stub, CRMOutbox(self.path) as outbox:
+            with CRMPusher(stub.url, outbox, batch_size=200, max_workers=4) as pusher:
+                stats = pusher.push(leads)
+                self.assertEqual((stats["sent"], stats["batches"], stub.request_count), (2000, 10, 10))
+                self.assertGreater(stub.max_in_flight, 1)
+                self.assertEqual(len(stub.records), 2000)
+                self.assertIn(lead_key("l0@example.com "), stub.records)
+
+                # sudah terkirim → tidak dikirim lagi; hanya lead yang berubah
+                leads[5].score = 99
+                stats = pusher.push(leads)
+                self.assertEqual((stats["queued"], stats["sent"], stub.request_count), (1, 1, 11))
+                self.assertEqual(stub.records[lead_key(leads[5].email)]["score"], 99)
+                self.assertEqual(stats["outbox"]["sent"], 2000)
+
+    def test_failed_batches_retried_without_duplicates(self):
+        with StubCRMServer(fail_statuses=[503] * 3) as stub, CRMOutbox(self.path) as outbox:
+            pusher = CRMPusher(stub.url, outbox, batch_size=50, max_workers=2, max_retries=0, backoff=0.01)
+            stats = pusher.push(make_leads(200))
+            self.assertEqual((stats["sent"], stats["retried"], stats["dead"]), (200, 150, 0))
+            self.assertEqual(len(stub.records), 200)
+            self.assertEqual(stub.request_count, 7)
+
+    def test_outbox_survives_restart_and_rejected_batches_are_dead(self):
+        with StubCRMServer(fail_statuses=[503, 422]) as stub:
+            with CRMOutbox(self.path) as outbox:
+                pusher = CRMPusher(stub.url, outbox, batch_size=100, max_workers=1, max_retries=0,
+                                   backoff=60, wait=False)
+                stats = pusher.push(make_leads(300))
+                self.assertEqual((stats["sent"], stats["retried"], stats["dead"]), (100, 100, 100))
+            # proses baru: batch yang ditunda masih ada di file
+            with CRMOutbox(self.path) as outbox:
+                self.assertEqual(outbox.counts(), {"pending": 100, "in_flight": 0, "sent": 100, "dead": 100})
+                self.assertEqual(outbox.requeue_dead(), 100)
+                outbox._conn.execute("UPDATE outbox SET next_attempt = 0")
+                stats = CRMPusher(stub.url, outbox, batch_size=100, max_workers=2).drain()
+                self.assertEqual(stats["sent"], 200)
+            self.assertEqual(len(stub.records), 300)
+
+    def test_push_sends_only_its_own_leads(self):
+        with StubCRMServer() as stub, CRMOutbox(self.path) as outbox:
+            outbox.enqueue(make_leads(50))
+            leads = [Lead(f"X{i}", f"x{i}@example.com", "Co", "Engineer", "Jakarta") for i in range(5)]
+            pusher = CRMPusher(stub.url, outbox, batch_size=2, max_workers=2, wait=False)
+            stats = pusher.push(leads)
+            self.assertEqual((stats["sent"], stats["batches"]), (5, 3))
+            self.assertEqual(set(outbox.statuses(stats["keys"]).values()), {"sent"})
+            # lead yang di-enqueue pipeline tetap di antrian
+            self.assertEqual(outbox.counts()["pending"], 50)
+            self.assertEqual(len(stub.records), 5)
+
+    def test_failed_send_never_left_in_flight(self):
+        with CRMOutbox(self.path) as outbox:
+            outbox.enqueue(make_leads(20))
+            with mock.patch("crm.pusher.request_with_retry", side_effect=requests.TooManyRedirects("loop")):
+                stats = CRMPusher("http://crm.invalid", outbox, batch_size=10, max_workers=2, wait=False).drain()
+            self.assertEqual((stats["retried"], outbox.counts()["in_flight"]), (20, 0))
+            outbox._conn.execute("UPDATE outbox SET next_attempt = 0")
+            with mock.patch("crm.pusher.request_with_retry", side_effect=RuntimeError("boom")):
+                with self.assertRaises(RuntimeError):
+                    CRMPusher("http://crm.invalid", outbox, batch_size=10, max_workers=1, wait=False).drain()
+            self.assertEqual(outbox.counts()["in_flight"], 0)
+            self.assertEqual(outbox.counts()["pending"], 20)
+
+    def test_rate_limit(self):
+        with StubCRMServer() as stub, CRMOutbox(self.path) as outbox:
+            start = time.monotonic()
+            # burst 10 request, 5 sisanya dibatasi 10 request/detik
+            CRMPusher(stub.url, outbox, batch_size=10, max_workers=4, rate=10).push(make_leads(150))
+            self.assertGreaterEqual(time.monotonic() - start, 0.45)
+            self.assertEqual((stub.request_count, len(stub.records)), (15, 150))
+
+    def test_runner_pushes_high_potential_leads(self):
+        directory = tempfile.mkdtemp()
+        config = make_config(directory)
+        with StubCRMServer() as stub:
+            config["crm"].update(url=stub.url, outbox=os.path.join(directory, "outbox.db"), batch_size=20, rate=0)
+            runner = PipelineRunner(config)
+            report = runner.run()
+            self.assertIn("crm.enqueue", runner.stage_names())
+            with CRMOutbox(config["crm"]["outbox"]) as outbox:
+                self.assertEqual(runner.stats["crm"]["sent"], outbox.counts()["sent"])
+            self.assertGreater(len(stub.records), 0)
+            self.assertEqual(report.stage("crm.push").items_out, len(stub.records))
+            self.assertTrue(all("High Potential" in lead["tags"] for lead in stub.records.values()))
+            # run kedua: store melewati lead lama, tidak ada yang dikirim ulang
+            PipelineRunner(config).run()
+            self.assertEqual(stub.received, len(stub.records))
+
+if __name__ == "__main__":
+    unittest.main()
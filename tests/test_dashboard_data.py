@@ -0,0 +1,61 @@
+import unittest
+from io import BytesIO
+import pandas as pd
+from storage.lead_index import LeadIndex
+from ui.dashboard_data import (
+    build_frame, filter_options, filter_positions, handoff_positions, page_frame, render_page, summary, to_csv_bytes, to_excel_bytes,
+)
+from tests import helpers
+
+def make_leads(n=30):
+    return helpers.make_leads(
+        n, location=("Paris", "Jakarta"), industry=("", "Tech", "Tech"), score=lambda i: i,
+        tags=lambda i, lead: ["High Potential"] if i % 5 == 0 else [],
+    )
+
+class TestDashboardData(unittest.TestCase):
+    def setUp(self):
+        self.df = build_frame(make_leads())
+
+    def test_frame_sorted_high_potential_then_score(self):
+        expected = sorted(make_leads(), key=lambda l: ("High Potential" not in l.tags, -l.score))
+        self.assertEqual(list(self.df["email"]), [l.email for l in expected])
+        self.assertEqual(filter_options(self.df, "industry"), ["All", "General", "Tech"])
+
+    def test_filter_summary_and_page(self):
+        positions = filter_positions(self.df, city="Jakarta", industry="Tech")
+        expected = [l for l in make_leads() if l.location == "Jakarta" and l.industry == "Tech"]
+        stats = summary(self.df, positions)
+        self.assertEqual(stats["total"], len(expected))
+        self.assertEqual(stats["jakarta"], len(expected))
+        self.assertAlmostEqual(stats["avg_score"], sum(l.score for l in expected) / len(expected))
+        page = page_frame(self.df, positions, page=2, page_size=4)
+        self.assertEqual(list(page["No"]), [5, 6, 7, 8][:len(page)])
+        self.assertEqual(len(filter_positions(self.df, city="Nowhere")), 0)
+        index = LeadIndex.from_frame(self.df)
+        for city, industry in (("Jakarta", "Tech"), ("All", "General"), ("Paris", "All"), ("All", "All")):
+            self.assertEqual(filter_positions(self.df, city, industry, index).tolist(),
+                             filter_positions(self.df, city, industry).tolist())
+
+    def test_badges_rendered_per_column(self):
+        rendered = render_page(page_frame(self.df, filter_positions(self.df), page=1, page_size=30), top_n=3)
+        badges = list(rendered["Tags / Industry"])
+        self.assertIn("Top lead!", badges[0])
+        self.assertIn("Lead has high chance", badges[3])
+        for badge, missing in zip(badges, rendered["missing_info"]):
+            self.assertEqual("Missing info" in badge, missing)
+        self.assertTrue(rendered["score"].str.contains("Score 0–100").all())
+
+    def test_handoff_positions_top_k_per_city(self):
+        positions = filter_positions(self.df)
+        got = self.df["email"].to_numpy()[handoff_positions(self.df, positions, k=4, per_segment=2, segment_by="location")]
+        # High Potential: i % 5 == 0 → Paris 0,10,20 / Jakarta 5,15,25; maks 2 per kota
+        self.assertEqual(list(got), ["l25@example.com", "l20@example.com", "l15@example.com", "l10@example.com"])
+        self.assertEqual(len(handoff_positions(self.df, positions, k=100)), 6)
+
+    def test_exports(self):
+        positions = filter_positions(self.df, city="Paris")
+        csv = pd.read_csv(BytesIO(to_csv_bytes(self.df, positions)))
+        excel = pd.read_excel(BytesIO(to_excel_bytes(self.df, positions)))
+        self.assertEqual(len(csv), len(positions))
+        self.assertEqual(list(excel["email"]), list(csv["email"]))
@@ -0,0 +1,38 @@
+import unittest
+from models.lead import Lead
+from processors.dedup import LeadDeduplicator, normalize_email, soundex
+from processors.filter import LeadFilter
+
+class TestDedup(unittest.TestCase):
+    def test_normalize_email(self):
+        self.assertEqual(normalize_email(" Jane.Doe+crm@GoogleMail.com"), "janedoe@gmail.com")
+        self.assertEqual(normalize_email("Jane.Doe+x@Example.com"), "jane.doe@example.com")
+        self.assertEqual(soundex("Robert"), soundex("Rupert"))
+
+    def test_clusters_report_merged_leads(self):
+        leads = [
+            Lead("Jane Doe", "jane.doe@example.com", "TechNova", location="Jakarta"),
+            Lead("John Smith", "john@example.com", "TechNova", location="Jakarta"),
+            Lead("Jane Doe", "JANE.DOE+news@example.com", "TechNova", location="Jakarta"),
+            Lead("Jane  Doé", "jdoe@other.com", "technova", location="Jakarta"),
+            Lead("Jane Doe", "jane@retail.com", "RetailCo", location="Jakarta"),
+            Lead("Janet Dodd", "janet@example.com", "TechNova", location="Jakarta"),
+        ]
+        result = LeadFilter().fuzzy_deduplicate(leads)
+        self.assertEqual(
+            [lead.email for lead in result.unique],
+            ["jane.doe@example.com", "john@example.com", "jane@retail.com", "janet@example.com"],
+        )
+        self.assertEqual(len(result.clusters), 1)
+        cluster = result.clusters[0].to_dict()
+        self.assertEqual(cluster["kept"], "jane.doe@example.com")
+        self.assertEqual([d["reason"] for d in cluster["duplicates"]], ["email", "name+company"])
+
+    def test_streaming_is_lazy(self):
+        dedup = LeadDeduplicator()
+        leads = (Lead(f"User {i}", f"user{i}@example.com", "Co", location="Jakarta") for i in range(10))
+        first = next(dedup.iter_unique(leads))
+        self.assertEqual(first.email, "user0@example.com")
+
+if __name__ == "__main__":
+    unittest.main()
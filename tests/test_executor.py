@@ -0,0 +1,56 @@
+import pickle
+import unittest
+from models.lead import Lead
+from processors.classifier import IndustryClassifier, COMPANY_KEYWORDS
+from processors.enricher import LeadEnricher
+from processors.filter import LeadFilter
+from processors.executor import ProcessExecutor, SerialExecutor
+from processors.pipeline import LeadPipeline
+from processors.scorer import LeadScorer
+from processors.tagger import LeadTagger
+from scraper.api_scraper import COMPANIES, INDUSTRIES, POSITIONS
+
+CITIES = ["Jakarta", "Bandung", "London", "Tokyo"]
+
+def make_stages(seed=0):
+    enricher = LeadEnricher(seed=seed)
+    scorer = LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"])
+    tagger = LeadTagger()
+    return [enricher.iter_enrich_leads, scorer.iter_apply, tagger.iter_tag_industry, tagger.iter_add_tag_high_potential]
+
+def make_input(n):
+    leads = []
+    for i in range(n):
+        lead = Lead(f"User {i}", f"user{i}@example.com", COMPANIES[i % len(COMPANIES)], POSITIONS[i % len(POSITIONS)],
+                    CITIES[i % len(CITIES)], INDUSTRIES[i % len(INDUSTRIES)], "Medium")
+        # sebagian lead butuh enrichment (company_size acak + industry dari company)
+        if i % 2:
+            lead.company_size = "Unknown"
+            lead.industry = "General"
+        leads.append(lead)
+    return leads
+
+def snapshot(leads):
+    return [(lead.to_record(), lead.missing_info) for lead in leads]
+
+class TestProcessExecutor(unittest.TestCase):
+    def test_matches_serial_run_in_order(self):
+        expected = snapshot(SerialExecutor().map(make_stages(seed=7), make_input(1000)))
+        with ProcessExecutor(workers=2, shard_size=64) as executor:
+            result = snapshot(executor.map(make_stages(seed=7), make_input(1000)))
+        self.assertEqual(result, expected)
+        self.assertIn("Unknown", {record[6] for record, _ in snapshot(make_input(10))})
+        self.assertNotIn("Unknown", {record[6] for record, _ in result})
+
+    def test_as_pipeline_stage(self):
+        leads = make_input(300)
+        leads += [lead.copy() for lead in leads[:50]]
+        with ProcessExecutor(workers=2, shard_size=40) as executor:
+            pipeline = LeadPipeline([LeadFilter().iter_deduplicate, executor.stage(*make_stages(seed=1))])
+            emails = [lead.email for lead in pipeline.run(leads)]
+        self.assertEqual(emails, [lead.email for lead in leads[:300]])
+
+    def test_classifier_is_picklable(self):
+        classifier = pickle.loads(pickle.dumps(IndustryClassifier(COMPANY_KEYWORDS)))
+        self.assertEqual(classifier.classify_many(["TechNova", "HealthPlus", "Acme"]),
+                         IndustryClassifier(COMPANY_KEYWORDS).classify_many(["TechNova", "HealthPlus", "Acme"]))
@@ -0,0 +1,94 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+import pandas as pd
+from exporters.csv_exporter import CSVExporter
+from exporters.json_exporter import JSONExporter
+from exporters.jsonl_exporter import JSONLinesExporter
+from exporters.parquet_exporter import ParquetExporter, load_batch, load_frame, load_leads
+from tests import helpers
+
+def make_leads(n=7):
+    return helpers.make_leads(
+        n, name="Lead {i}", email="lead{i}@example.com", position="Dev", industry=None, company_size=None,
+        tags=lambda i, lead: ["High Potential"] if i == 0 else [],
+    )
+
+class TestExporters(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_csv_matches_pandas_output(self):
+        CSVExporter(chunk_size=3).export(iter(make_leads()), self.path("leads.csv"))
+        expected = pd.DataFrame([lead.to_dict() for lead in make_leads()]).to_csv(index=False)
+        with open(self.path("leads.csv"), newline="") as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_json_matches_json_dump(self):
+        for leads in (make_leads(), []):
+            data = [lead.to_dict() for lead in leads]
+            JSONExporter(chunk_size=2).export(iter(leads), self.path("leads.json"))
+            with open(self.path("leads.json")) as f:
+                self.assertEqual(f.read(), json.dumps(data, indent=4))
+            JSONExporter(chunk_size=2, indent=None).export(iter(leads), self.path("compact.json"))
+            with open(self.path("compact.json")) as f:
+                self.assertEqual(f.read(), json.dumps(data, separators=(",", ":")))
+
+    def test_jsonl_gzip(self):
+        count = JSONLinesExporter(chunk_size=3).export(make_leads(), self.path("leads.jsonl.gz"))
+        with gzip.open(self.path("leads.jsonl.gz"), "rt") as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(count, 7)
+        self.assertEqual(rows, [lead.to_dict() for lead in make_leads()])
+
+    def test_failed_export_keeps_previous_file(self):
+        CSVExporter().export(make_leads(2), self.path("leads.csv"))
+        with open(self.path("leads.csv")) as f:
+            before = f.read()
+
+        def broken():
+            yield from make_leads(3)
+            raise RuntimeError("fetch failed")
+
+        with self.assertRaises(RuntimeError):
+            CSVExporter(chunk_size=1).export(broken(), self.path("leads.csv"))
+        with open(self.path("leads.csv")) as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual(os.listdir(self.dir), ["leads.csv"])
+
+    def test_export_file_mode_follows_umask(self):
+        JSONLinesExporter().export(make_leads(2), self.path("leads.jsonl"))
+        with open(self.path("plain.txt"), "w"):
+            pass
+        self.assertEqual(os.stat(self.path("leads.jsonl")).st_mode & 0o777,
+                         os.stat(self.path("plain.txt")).st_mode & 0o777)
+
+class TestParquetExporter(unittest.TestCase):
+    def test_round_trip_keeps_types(self):
+        directory = tempfile.mkdtemp()
+        leads = make_leads(25)
+        leads[3].industry = "Tech"
+        leads[20].location = "Paris"
+        leads[20].score = 70
+        for name in ("leads.parquet", "leads.arrow"):
+            path = os.path.join(directory, name)
+            self.assertEqual(ParquetExporter(batch_size=10).export(iter(leads), path), 25)
+
+            frame = load_frame(path)
+            self.assertEqual(str(frame["industry"].dtype), "category")
+            self.assertEqual(frame["tags"][0], ["High Potential"])
+            self.assertEqual(frame.to_dict("records"), [lead.to_dict() for lead in leads])
+
+            self.assertEqual([l.to_dict() for l in load_leads(path)], [l.to_dict() for l in leads])
+            self.assertEqual(load_batch(path).to_dataframe().astype(frame.dtypes).equals(frame), True)
+
+        filtered = load_frame(os.path.join(directory, "leads.parquet"), filters=[("score", ">=", 50)])
+        self.assertEqual(list(filtered["email"]), ["lead20@example.com"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from config import settings
+from processors.jobs import JobQueue
+from storage.job_store import JobStore
+from ui.flask_app import create_app
+
+SYNTHETIC = {"fetch": {"source": "synthetic", "results": 200, "page_size": 20}, "pipeline": {"checkpoint_every": 40}}
+
+class TestJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def test_job_runs_in_background_with_progress_and_result(self):
+        queue = JobQueue(self.directory, workers=1)
+        self.addCleanup(queue.shutdown)
+        job = queue.submit({**SYNTHETIC, "format": "jsonl"})
+        self.assertIn(job["status"], ("queued", "running"))
+
+        job = queue.wait(job["id"], timeout=30)
+        self.assertEqual(job["status"], "succeeded", job["error"])
+        self.assertEqual((job["processed"], job["total"]), (200, 200))
+        self.assertIn("fetch", [stage["stage"] for stage in job["stages"]])
+        path, mimetype = queue.result_path(job["id"])
+        self.assertEqual(mimetype, "application/x-ndjson")
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(sum(1 for _ in f), job["result_count"])
+        # store sementara job dihapus, hasil tetap ada
+        self.assertFalse(os.path.exists(os.path.join(self.directory, job["id"], "leads.db")))
+
+    def test_invalid_body_rejected(self):
+        queue = JobQueue(self.directory, workers=1, max_results=100)
+        self.addCleanup(queue.shutdown)
+        invalid = (
+            None, {"format": "xml"}, {"store": "/tmp/x.db"}, {"fetch": {"page_size": 0}}, SYNTHETIC,
+            {"fetch": 5}, {"pipeline": {"stages": None}}, {"pipeline": {"stages": [1]}}, {"scorer": {"weights": 3}},
+            {"scorer": {"bonus": 1}}, {"pipeline": {"workers": 5000}}, {"fetch": {"max_workers": 5000}},
+            {"fetch": {"page_size": 10 ** 7}}, {"pipeline": {"batch_size": 10 ** 7}},
+            {"pipeline": {"checkpoint_every": 10 ** 9}},
+            {"scorer": {"weights": {"city": 1.5}}}, {"scorer": {"weights": {"tags": {"High Potential": 0.5}}}},
+            {"scorer": {"base_score": 2.5}},
+        )
+        for body in invalid:
+            with self.assertRaises(ValueError, msg=body):
+                queue.submit(body)
+        self.assertEqual(queue.list(), [])
+
+    def test_failed_job_records_error(self):
+        def broken(config):
+            raise ConnectionError("upstream down")
+
+        queue = JobQueue(self.directory, workers=1, scraper_factory=broken)
+        self.addCleanup(queue.shutdown)
+        job = queue.wait(queue.submit(SYNTHETIC)["id"], timeout=30)
+        self.assertEqual(job["status"], "failed")
+        self.assertIn("upstream down", job["error"])
+        self.assertIsNone(queue.result_path(job["id"]))
+
+    def test_unfinished_job_resumed_after_restart(self):
+        store = JobStore(os.path.join(self.directory, "jobs.db"))
+        job_id = store.create(SYNTHETIC, "csv", total=200)
+        store.update(job_id, status="running", started_at=1.0)
+        store.close()
+
+        queue = JobQueue(self.directory, workers=1)
+        self.addCleanup(queue.shutdown)
+        job = queue.wait(job_id, timeout=30)
+        self.assertEqual(job["status"], "succeeded", job["error"])
+        self.assertEqual(job["started_at"], 1.0)
+        self.assertEqual(job["result_count"], 200)
+
+    def test_app_startup_resumes_unfinished_jobs(self):
+        store = JobStore(os.path.join(self.directory, "jobs.db"))
+        job_id = store.create(SYNTHETIC, "jsonl", total=200)
+        store.close()
+        with mock.patch.object(settings, "JOB_DIR", self.directory):
+            app = create_app(scraper=object())
+        queue = app.extensions["jobs"]
+        self.addCleanup(queue.shutdown)
+        # tanpa request apa pun ke /jobs
+        self.assertEqual(queue.wait(job_id, timeout=30)["status"], "succeeded")
+
+class TestJobsAPI(unittest.TestCase):
+    def setUp(self):
+        self.queue = JobQueue(tempfile.mkdtemp(), workers=1)
+        self.addCleanup(self.queue.shutdown)
+        self.client = create_app(scraper=object(), jobs=self.queue).test_client()
+
+    def test_submit_poll_download(self):
+        response = self.client.post("/jobs", json={**SYNTHETIC, "format": "jsonl"})
+        self.assertEqual(response.status_code, 202)
+        job_id = response.get_json()["id"]
+        self.assertEqual(response.headers["Location"], f"/jobs/{job_id}")
+        self.assertNotIn("result_path", response.get_json())
+
+        self.queue.wait(job_id, timeout=30)
+        job = self.client.get(f"/jobs/{job_id}").get_json()
+        self.assertEqual(job["status"], "succeeded")
+        self.assertEqual(job["processed"], 200)
+
+        response = self.client.get(f"/jobs/{job_id}/result")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        lines = response.get_data(as_text=True).splitlines()
+        response.close()
+        self.assertEqual(len(lines), job["result_count"])
+        self.assertIn("email", json.loads(lines[0]))
+        self.assertEqual([job["id"] for job in self.client.get("/jobs").get_json()["data"]], [job_id])
+
+    def test_errors(self):
+        self.assertEqual(self.client.post("/jobs", json={"format": "xml"}).status_code, 400)
+        self.assertEqual(self.client.post("/jobs", data="not json").status_code, 400)
+        self.assertEqual(self.client.post("/jobs", json={"fetch": 5}).status_code, 400)
+        self.assertEqual(self.client.post("/jobs", json={"pipeline": {"workers": 5000}}).status_code, 400)
+        self.assertEqual(self.client.get("/jobs/missing").status_code, 404)
+        self.assertEqual(self.client.get("/jobs/missing/result").status_code, 404)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
+import pandas as pd
 from models.lead import Lead
+from models.lead_batch import LeadBatch
 
 class TestLead(unittest.TestCase):
     def test_add_tag(self):
@@ -13,5 +15,34 @@ class TestLead(unittest.TestCase):
         self.assertEqual(d["name"], "Jane Doe")
         self.assertEqual(d["location"], "Jakarta")
 
+    def test_slots_and_interned_values(self):
+        a = Lead("A", "a@example.com", "Co", "".join(["Soft", "ware Engineer"]), "Jakarta")
+        b = Lead("B", "b@example.com", "Co", "".join(["Software ", "Engineer"]), "Jakarta")
+        self.assertFalse(hasattr(a, "__dict__"))
+        self.assertIs(a.position, b.position)
+        a.add_tag("Tech")
+        a.add_tag("Tech")
+        self.assertEqual(a.to_dict()["tags"], ["Tech"])
+
+    def test_record_round_trip(self):
+        lead = Lead("Jane Doe", "jane@example.com", "Company", "Engineer", "Jakarta", "Tech", "Large")
+        lead.add_tag("High Potential")
+        lead.score = 80
+        self.assertEqual(Lead.from_record(lead.to_record()).to_dict(), lead.to_dict())
+
+class TestLeadBatch(unittest.TestCase):
+    def test_dataframe_matches_to_dict(self):
+        leads = [
+            Lead("Jane Doe", "jane@example.com", "Company", "Engineer", "Jakarta", "Tech", "Large"),
+            Lead("John Doe", "john@example.com", "Other", None, "Paris"),
+        ]
+        leads[0].add_tag("High Potential")
+        batch = LeadBatch(leads)
+        expected = pd.DataFrame([lead.to_dict() for lead in leads])
+        self.assertEqual(len(batch), 2)
+        self.assertTrue(batch.to_dataframe(categorical=False).equals(expected))
+        self.assertEqual(str(batch.to_dataframe()["industry"].dtype), "category")
+        self.assertEqual([lead.to_dict() for lead in batch], expected.to_dict("records"))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,145 @@
+import json
+import unittest
+from unittest import mock
+from config import settings
+from storage.lead_collection import LeadCollection
+from ui.flask_app import create_app
+from tests import helpers
+
+def make_leads():
+    return helpers.make_leads(
+        30, email="l{i:02d}@example.com", company=("RetailCo", "TechNova"), location=("Jakarta", "Paris", "Paris"),
+        industry=("Retail", "Tech"), score=lambda i: i % 10 * 10,
+        tags=lambda i, lead: ["High Potential"] if lead.score >= 50 else [],
+    )
+
+def page_through(collection, **kwargs):
+    emails, cursor = [], None
+    while True:
+        page, cursor, _ = collection.query(cursor=cursor, limit=4, **kwargs)
+        emails.extend(lead.email for lead in page)
+        if cursor is None:
+            return emails
+
+class TestLeadCollection(unittest.TestCase):
+    def test_query_matches_linear_filter(self):
+        leads = make_leads()
+        collection = LeadCollection(leads)
+        expected = sorted(
+            (l for l in leads if l.location == "Jakarta" and l.score >= 40 and "High Potential" in l.tags),
+            key=lambda l: (-l.score, l.email),
+        )
+        page, cursor, total = collection.query(city="jakarta", min_score=40, tags=["high potential"], limit=100)
+        self.assertEqual([l.email for l in page], [l.email for l in expected])
+        self.assertIsNone(cursor)
+        self.assertEqual(total, len(expected))
+
+    def test_count_matches_linear_filter(self):
+        leads = make_leads()
+        collection = LeadCollection(leads)
+        for city, industry, min_score, tags in [(None, None, None, None), (None, None, 40, None), ("jakarta", None, None, None),
+                                                (None, "tech", 35, None), ("Paris", "Tech", 50, None),
+                                                (None, None, 0, ["high potential"]), ("jakarta", None, 90, ["High Potential"])]:
+            expected = sum(
+                1 for l in leads
+                if (city is None or l.location.casefold() == city.casefold())
+                and (industry is None or l.industry.casefold() == industry.casefold())
+                and (min_score is None or l.score >= min_score)
+                and all(tag.casefold() in {t.casefold() for t in l.tags} for tag in tags or ())
+            )
+            for _ in range(2):  # kedua kali dari cache
+                self.assertEqual(collection.count(city, industry, min_score, tags), expected)
+
+    def test_cursor_pagination_both_directions(self):
+        collection = LeadCollection(make_leads())
+        desc = page_through(collection, industry="Tech")
+        self.assertEqual(len(desc), 15)
+        self.assertEqual(len(set(desc)), 15)
+        self.assertEqual(page_through(collection, industry="Tech", sort="score"), desc[::-1])
+
+    def test_invalid_input(self):
+        collection = LeadCollection(make_leads())
+        with self.assertRaises(ValueError):
+            collection.query(cursor="not-a-cursor")
+        with self.assertRaises(ValueError):
+            collection.query(sort="name")
+
+class FakeScraper:
+    def __init__(self):
+        self.calls = 0
+
+    def fetch(self, results=50):
+        self.calls += 1
+        return make_leads()
+
+    def iter_fetch_concurrent(self, results=50):
+        self.calls += 1
+        return iter(make_leads()[:results])
+
+class ShrinkingScraper(FakeScraper):
+    """Setiap refresh dataset mengembalikan lebih sedikit lead"""
+
+    def fetch(self, results=50):
+        self.calls += 1
+        return make_leads()[:30 // self.calls]
+
+class TestLeadsEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.scraper = FakeScraper()
+        self.client = create_app(self.scraper).test_client()
+
+    def test_pagination_filters_and_etag(self):
+        first = self.client.get("/leads?limit=5&city=Jakarta&tag_keyword=Tech")
+        body = first.get_json()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(body["meta"]["count"], 5)
+        self.assertEqual(body["meta"]["total"], 10)
+        scores = [lead["score"] for lead in body["data"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        for lead in body["data"]:
+            self.assertEqual("Tech Industry" in lead["tags"], lead["company"] == "TechNova")
+
+        second = self.client.get(f"/leads?limit=5&city=Jakarta&cursor={body['meta']['next_cursor']}").get_json()
+        self.assertFalse({l["email"] for l in body["data"]} & {l["email"] for l in second["data"]})
+
+        cached = self.client.get("/leads?limit=5&city=Jakarta&tag_keyword=Tech", headers={"If-None-Match": first.headers["ETag"]})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(self.scraper.calls, 1)
+
+    def test_bad_cursor(self):
+        self.assertEqual(self.client.get("/leads?cursor=xyz").status_code, 400)
+
+    def test_ndjson_stream(self):
+        response = self.client.get("/leads?city=Jakarta", headers={"Accept": "application/x-ndjson"})
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        leads = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(len(leads), 10)
+        paged = self.client.get("/leads?city=Jakarta&limit=10").get_json()["data"]
+        self.assertEqual(leads, paged)
+
+    def test_live_ndjson_stream(self):
+        response = self.client.get("/leads?stream=1&results=12&industry=Tech&limit=3")
+        emails = [json.loads(line)["email"] for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(emails, ["l01@example.com", "l03@example.com", "l05@example.com"])
+
+    def test_stream_bounds(self):
+        for query in ("limit=-1", "results=-5", "results=0", "limit=abc"):
+            response = self.client.get(f"/leads?stream=1&{query}")
+            self.assertEqual(response.status_code, 400, query)
+        with mock.patch.object(settings, "STREAM_MAX_RESULTS", 4):
+            response = self.client.get("/leads?stream=1&results=10000000")
+            self.assertEqual(len(response.get_data(as_text=True).splitlines()), 4)
+
+    def test_stream_keeps_its_collection_across_refresh(self):
+        scraper = ShrinkingScraper()
+        client = create_app(scraper).test_client()
+        with mock.patch.object(settings, "FETCH_CACHE_TTL", -1):
+            response = client.get("/leads?stream=1&min_score=0", buffered=False)
+            lines = iter(response.response)
+            first = next(lines)
+            # refresh dataset di tengah stream
+            self.assertEqual(len(client.get("/leads?limit=100").get_json()["data"]), 15)
+            rows = [json.loads(line) for line in b"".join([first, *lines]).splitlines()]
+            response.close()
+        self.assertEqual(len(rows), 30)
+        self.assertEqual(len({row["email"] for row in rows}), 30)
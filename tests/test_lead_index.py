@@ -0,0 +1,71 @@
+import unittest
+from models.lead import Lead
+from processors.filter import LeadFilter
+from storage.lead_index import LeadIndex
+from tests import helpers
+
+CITIES = ["Jakarta", "Paris", "Tokyo"]
+INDUSTRIES = ["Tech", "Retail", "Finance", "Health"]
+SIZES = ["Small", "Medium", "Large"]
+
+def make_leads(n=500):
+    return helpers.make_leads(
+        n, location=CITIES, industry=INDUSTRIES, company_size=lambda i: SIZES[(i // 7) % 3],
+        score=lambda i: (i * 37) % 101,
+        tags=lambda i, lead: ["High Potential"] * (lead.score > 60) + ["VIP"] * (i % 11 == 0),
+    )
+
+def matches(lead, location="All", industry="All", company_size="All", tags=(), min_score=None):
+    return (location in ("All", lead.location) and industry in ("All", lead.industry)
+            and company_size in ("All", lead.company_size) and all(tag in lead.tags for tag in tags)
+            and (min_score is None or lead.score >= min_score))
+
+class TestLeadIndex(unittest.TestCase):
+    def setUp(self):
+        self.leads = make_leads()
+        self.index = LeadIndex(self.leads)
+
+    def test_combined_filters_match_linear_scan(self):
+        queries = [
+            {}, {"location": "Jakarta"}, {"industry": "Tech", "company_size": "Large"},
+            {"location": "Paris", "tags": ["High Potential"]}, {"tags": ["High Potential", "VIP"], "min_score": 80},
+            {"industry": "Retail", "min_score": 50}, {"min_score": 90}, {"location": "Nowhere"}, {"tags": ["Unknown"]},
+        ]
+        for query in queries:
+            expected = [lead for lead in self.leads if matches(lead, **query)]
+            self.assertEqual(self.index.filter(**query), expected, query)
+        self.assertEqual(self.index.count("location", "Tokyo"), sum(l.location == "Tokyo" for l in self.leads))
+        self.assertEqual(self.index.values("company_size"), sorted(SIZES))
+
+    def test_top_k_without_full_sort(self):
+        for query in ({}, {"industry": "Tech"}, {"location": "Jakarta", "company_size": "Small"},
+                      {"tags": ["VIP"]}, {"min_score": 95}):
+            expected = sorted((l for l in self.leads if matches(l, **query)), key=lambda l: -l.score)
+            for k in (1, 10, 1000):
+                self.assertEqual(self.index.top_leads(k, **query), expected[:k], (query, k))
+
+    def test_lead_filter_delegates_to_index(self):
+        lead_filter = LeadFilter(index=self.index)
+        self.assertEqual(lead_filter.filter_by_location(self.leads, "Tokyo"),
+                         LeadFilter().filter_by_location(self.leads, "Tokyo"))
+        self.assertEqual(lead_filter.filter(self.leads, industry="Tech", tags=["VIP"]),
+                         LeadFilter().filter(self.leads, industry="Tech", tags=["VIP"]))
+        # list lain (bukan yang di-index) tetap di-scan
+        other = self.leads[:10]
+        self.assertEqual(lead_filter.filter_by_industry(other, "Tech"), [l for l in other if l.industry == "Tech"])
+
+    def test_lead_filter_ignores_stale_index(self):
+        lead_filter = LeadFilter(index=self.index)
+        self.leads.append(Lead("New", "new@example.com", "Co", "Engineer", "Tokyo", "Tech", "Small"))
+        self.assertEqual(lead_filter.filter_by_location(self.leads, "Tokyo")[-1].email, "new@example.com")
+        self.leads.pop()
+        self.leads[0] = Lead("Swap", "swap@example.com", "Co", "Engineer", "Jakarta", "Tech", "Small")
+        self.assertEqual(lead_filter.filter(self.leads, location="Jakarta")[0].email, "swap@example.com")
+        # index tetap snapshot saat dibuat
+        self.assertEqual(self.index.filter(location="Jakarta")[0].email, "l0@example.com")
+
+    def test_none_is_wildcard_on_both_paths(self):
+        for lead_filter in (LeadFilter(index=self.index), LeadFilter()):
+            self.assertEqual(lead_filter.filter(self.leads, location=None, industry="Tech"),
+                             [l for l in self.leads if l.industry == "Tech"])
+            self.assertEqual(lead_filter.filter_by_location(self.leads, None), self.leads)
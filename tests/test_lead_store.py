@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from models.lead import Lead
+from processors.pipeline import LeadPipeline
+from processors.scorer import LeadScorer
+from storage.lead_store import LeadStore
+from tests import helpers
+
+def make_leads():
+    return helpers.make_leads(
+        2, name=("A", "B"), email=("a@example.com", "b@example.com"), company=("TechNova", "RetailCo"),
+        position=("Engineer", "Clerk"), location=("Jakarta", "Paris"), industry=("Tech", "Retail"),
+        company_size=("Large", "Small"),
+    )
+
+class TestLeadStore(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "leads.db")
+
+    def run_pipeline(self, store, leads):
+        scored = []
+        def record(stream):
+            for lead in stream:
+                scored.append(lead.email)
+                yield lead
+        scorer = LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"])
+        pipeline = LeadPipeline([store.iter_new_or_changed, record, scorer.iter_apply, store.iter_upsert])
+        pipeline.consume(leads)
+        return scored
+
+    def test_incremental_runs_only_process_new_or_changed(self):
+        with LeadStore(self.path) as store:
+            self.assertEqual(self.run_pipeline(store, make_leads()), ["a@example.com", "b@example.com"])
+
+        with LeadStore(self.path) as store:
+            leads = make_leads() + [Lead("C", "c@example.com", "Co", "Dev", "Jakarta", "Tech", "Medium")]
+            leads[1].location = "Jakarta"
+            self.assertEqual(self.run_pipeline(store, leads), ["b@example.com", "c@example.com"])
+            self.assertEqual(store.stats, {"new": 1, "changed": 1, "unchanged": 1, "written": 2})
+            self.assertEqual(store.count(), 3)
+            self.assertEqual(store.get("b@example.com").score, 40)
+
+    def test_indexed_queries(self):
+        with LeadStore(self.path) as store:
+            self.run_pipeline(store, make_leads())
+            self.assertEqual([l.email for l in store.query(location="Jakarta")], ["a@example.com"])
+            self.assertEqual([l.email for l in store.query(min_score=50)], ["a@example.com"])
+            self.assertEqual([l.email for l in store.query(industry="Retail")], ["b@example.com"])
+            self.assertEqual([l.score for l in store.query()], [100, 10])
+
+if __name__ == "__main__":
+    unittest.main()
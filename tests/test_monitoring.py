@@ -0,0 +1,83 @@
+import os
+import tempfile
+import time
+import unittest
+from monitoring.metrics import MetricsRegistry, quantile
+from monitoring.profiling import parse_kinds, profile_run
+from monitoring.run_report import RunReport
+from processors.pipeline import LeadPipeline
+from processors.scorer import LeadScorer
+from scraper.api_scraper import APIScraper
+from scraper.cache import CachedScraper
+from scraper.synthetic import SyntheticScraper
+from stubs.randomuser import StubRandomUserServer
+from ui.flask_app import create_app
+
+def slow(leads):
+    for lead in leads:
+        time.sleep(0.002)
+        yield lead
+
+class CollectingExporter:
+    def export(self, leads, filename=None):
+        return list(leads)
+
+class TestRunReport(unittest.TestCase):
+    def test_stages_timed_exclusively_in_pipeline_order(self):
+        report = RunReport()
+        pipeline = LeadPipeline(report=report)
+        pipeline.add_stage(slow, name="slow")
+        pipeline.add_stage(LeadScorer().iter_apply)
+        source = report.source("fetch", SyntheticScraper().iter_fetch_concurrent(20))
+        exported = pipeline.run_into(source, report.exporter("export", CollectingExporter()))
+        result = report.to_dict()
+
+        self.assertEqual(len(exported), 20)
+        self.assertEqual([s["stage"] for s in result["stages"]], ["fetch", "slow", "LeadScorer.iter_apply", "export"])
+        stages = {s["stage"]: s for s in result["stages"]}
+        self.assertEqual((stages["slow"]["items_in"], stages["export"]["items_out"]), (20, 20))
+        # sleep hanya dihitung untuk stage "slow", bukan stage sesudahnya
+        self.assertGreater(stages["slow"]["seconds"], 0.03)
+        self.assertLess(stages["LeadScorer.iter_apply"]["seconds"] + stages["export"]["seconds"], 0.02)
+        self.assertLessEqual(sum(s["seconds"] for s in result["stages"]), result["duration_s"])
+
+    def test_http_latency_in_report_and_metrics(self):
+        report = RunReport()
+        with StubRandomUserServer() as stub:
+            APIScraper(api_url=stub.url).fetch_concurrent(results=30, page_size=10)
+            host = stub.url.split("/")[2]
+        http = report.to_dict()["http"][host]
+        self.assertEqual((http["requests"], http["statuses"]), (3, {"200": 3}))
+        self.assertIsNotNone(http["p99_s"])
+
+        client = create_app(scraper=CachedScraper(SyntheticScraper())).test_client()
+        client.get("/health")
+        body = client.get("/metrics").get_data(as_text=True)
+        self.assertIn(f'lead_scraper_http_request_duration_seconds_count{{host="{host}",status="200"}}', body)
+        self.assertIn('lead_scraper_api_request_duration_seconds_count{endpoint="/health",status="200"}', body)
+
+class TestMetrics(unittest.TestCase):
+    def test_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        registry.counter("runs_total", "Runs", labels=("stage",)).inc(2, stage='a"b')
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5):
+            histogram.observe(value)
+        text = registry.render()
+        self.assertIn('runs_total{stage="a\\"b"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="1.0"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("latency_seconds_count 3", text)
+        with self.assertRaises(ValueError):
+            registry.gauge("runs_total", "Runs")
+        self.assertAlmostEqual(quantile((0.1, 1.0), [1, 1, 0], 0.5), 0.1)
+
+    def test_profile_run_writes_files(self):
+        directory = tempfile.mkdtemp()
+        with profile_run("all", directory) as paths:
+            sorted(range(1000), key=lambda x: -x)
+        self.assertEqual(set(paths), {"cpu", "cpu_text", "memory"})
+        self.assertTrue(all(os.path.getsize(path) for path in paths.values()))
+        self.assertEqual(parse_kinds(""), [])
+        with self.assertRaises(ValueError):
+            parse_kinds("gpu")
@@ -0,0 +1,55 @@
+import unittest
+from processors.filter import LeadFilter
+from processors.scorer import LeadScorer
+from processors.tagger import LeadTagger
+from processors.pipeline import LeadPipeline
+from tests import helpers
+
+def make_leads():
+    # lead ketiga duplikat email lead pertama
+    return helpers.make_leads(
+        3, name=("A", "B", "A2"), email=("a@example.com", "b@example.com"), company=("TechNova", "RetailCo"),
+        position=("Software Engineer", "Store Manager"), location=("Jakarta", "Paris"), industry=("Tech", None),
+        company_size=("Large", "Small"),
+    )
+
+class TestLeadPipeline(unittest.TestCase):
+    def test_streaming_matches_list_methods(self):
+        scorer = LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"])
+        tagger = LeadTagger()
+
+        expected = LeadFilter().deduplicate(make_leads())
+        expected = scorer.apply(expected)
+        expected = tagger.tag_industry(expected)
+        expected = tagger.add_tag_high_potential(expected)
+
+        pipeline = LeadPipeline([
+            LeadFilter().iter_deduplicate,
+            scorer.iter_apply,
+            tagger.iter_tag_industry,
+            tagger.iter_add_tag_high_potential,
+        ])
+        streamed = list(pipeline.run(iter(make_leads())))
+        self.assertEqual([l.to_dict() for l in streamed], [l.to_dict() for l in expected])
+
+    def test_stages_are_lazy(self):
+        pulled = []
+        def source():
+            for lead in make_leads():
+                pulled.append(lead.email)
+                yield lead
+        pipeline = LeadPipeline([LeadScorer().iter_apply])
+        first = next(pipeline.run(source()))
+        self.assertEqual(first.email, "a@example.com")
+        self.assertEqual(len(pulled), 1)
+
+    def test_count_stage(self):
+        pipeline = LeadPipeline()
+        pipeline.add_stage(pipeline.count("in"))
+        pipeline.add_stage(LeadFilter().iter_deduplicate)
+        pipeline.add_stage(pipeline.count("out"))
+        list(pipeline.run(make_leads()))
+        self.assertEqual(pipeline.counts, {"in": 3, "out": 2})
+
+if __name__ == "__main__":
+    unittest.main()
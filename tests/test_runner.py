@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+import main
+from config.pipeline import load_config
+from processors.runner import Checkpoint, PipelineRunner
+from scraper.synthetic import SyntheticScraper
+
+class InterruptedScraper(SyntheticScraper):
+    """Putus (seperti error jaringan) saat mencapai page `fail_at`"""
+
+    def __init__(self, fail_at, **kwargs):
+        super().__init__(**kwargs)
+        self.fail_at = fail_at
+        self.pages = []
+
+    def iter_pages(self, *args, **kwargs):
+        for page, leads in super().iter_pages(*args, **kwargs):
+            if page == self.fail_at:
+                raise ConnectionError("upstream down")
+            self.pages.append(page)
+            yield page, leads
+
+def make_config(directory, **pipeline):
+    return load_config(overrides={
+        "fetch": {"source": "synthetic", "results": 100, "page_size": 10},
+        "pipeline": {"checkpoint_every": 20, **pipeline},
+        "store": os.path.join(directory, "leads.db"),
+        "checkpoint": os.path.join(directory, "checkpoint.json"),
+        "report_dir": "",
+        "exporters": [{"path": os.path.join(directory, "leads.csv")}],
+    })
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+class TestPipelineRunner(unittest.TestCase):
+    def test_resume_from_checkpoint(self):
+        expected_dir, directory = tempfile.mkdtemp(), tempfile.mkdtemp()
+        PipelineRunner(make_config(expected_dir)).run()
+
+        config = make_config(directory)
+        with self.assertRaises(ConnectionError):
+            PipelineRunner(config, scraper=InterruptedScraper(fail_at=6, duplicate_rate=0.0)).run()
+        # chunk = 2 page; page 5 belum masuk checkpoint karena chunk-nya belum selesai
+        state = Checkpoint(config["checkpoint"], PipelineRunner(config).fingerprint()).load()
+        self.assertEqual((state["next_page"], state["fetched"]), (5, 40))
+
+        scraper = InterruptedScraper(fail_at=None)
+        runner = PipelineRunner(config, scraper=scraper)
+        runner.run(resume=True)
+        self.assertEqual(scraper.pages, list(range(5, 11)))
+        self.assertEqual(runner.stats["stored"], 100)
+        self.assertFalse(os.path.exists(config["checkpoint"]))
+        self.assertEqual(read(os.path.join(directory, "leads.csv")), read(os.path.join(expected_dir, "leads.csv")))
+
+    def test_scorer_change_rescores_stored_leads(self):
+        directory = tempfile.mkdtemp()
+        PipelineRunner(make_config(directory)).run()
+        config = make_config(directory)
+        config["scorer"]["base_score"] = 7
+        runner = PipelineRunner(config)
+        runner.run()
+        self.assertEqual(runner.store.stats["unchanged"], 0)
+        self.assertEqual(runner.store.stats["written"], 100)
+
+        runner = PipelineRunner(config)
+        runner.run()
+        self.assertEqual((runner.store.stats["unchanged"], runner.store.stats["written"]), (100, 0))
+
+    def test_plan_groups_per_lead_stages_for_workers(self):
+        config = make_config(tempfile.mkdtemp(), workers=2, stages=["dedup", "enrich", "score", "tag_industry"])
+        plan = PipelineRunner(config).plan()
+        self.assertEqual(plan["stages"], ["dedup", "store.new_or_changed", "workers[enrich+score+tag_industry]", "store.upsert"])
+        self.assertEqual((plan["pages"], plan["exporters"][0]["format"]), (10, "csv"))
+
+    def test_config_file_and_flags(self):
+        path = os.path.join(tempfile.mkdtemp(), "run.toml")
+        with open(path, "w") as f:
+            f.write('[fetch]\nresults = 300\n[scorer]\ntarget_cities = ["Paris"]\nweights = { city = 50 }\n')
+        plan = main.main(["--config", path, "--dry-run", "--page-size", "100", "--stages", "dedup,score", "--no-store"])
+        self.assertEqual((plan["results"], plan["pages"], plan["stages"], plan["store"]), (300, 3, ["dedup", "score"], None))
+        config = load_config(path)
+        self.assertEqual((config["scorer"]["target_cities"], config["scorer"]["weights"]), (["Paris"], {"city": 50}))
+        with self.assertRaises(ValueError):
+            load_config(overrides={"pipeline": {"stages": ["dedup", "magic"]}})
+
+    def test_benchmark_mode_writes_nothing(self):
+        directory = tempfile.mkdtemp()
+        config = make_config(directory)
+        runner = PipelineRunner(config, benchmark=True)
+        report = runner.run()
+        self.assertEqual(runner.stats["fetched"], 100)
+        self.assertIn("export.csv", report.stages)
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_handoff_list_from_store(self):
+        directory = tempfile.mkdtemp()
+        config = make_config(directory)
+        config["handoff"].update(path=os.path.join(directory, "handoff.jsonl"), k=10, per_segment=2, segment_by="location")
+        runner = PipelineRunner(config)
+        report = runner.run()
+        self.assertIn("handoff.select", report.stages)
+        self.assertEqual(report.stage("handoff.select").items_in, 100)
+        with open(config["handoff"]["path"], encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(runner.stats["handoff"], len(lines))
+        self.assertLessEqual(len(lines), 10)
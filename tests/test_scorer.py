@@ -0,0 +1,64 @@
+import random
+import unittest
+import pandas as pd
+from models.lead import Lead
+from models.lead_batch import LeadBatch
+from processors.scorer import LeadScorer
+from tests import helpers
+
+def make_leads(n=500, seed=7):
+    rng = random.Random(seed)
+    return helpers.make_leads(
+        n, name="Lead {i}", email="lead{i}@example.com",
+        position=lambda i: rng.choice(["Software Engineer", "Consultant"]),
+        location=lambda i: rng.choice(["Jakarta", "Bandung", "Paris"]),
+        industry=lambda i: rng.choice(["Tech", "Finance", "General"]),
+        company_size=lambda i: rng.choice(["Small", "Medium", "Large", "Unknown"]),
+        tags=lambda i, lead: [tag for tag, p in (("High Potential", 0.3), ("VIP", 0.2)) if rng.random() < p],
+    )
+
+class TestVectorizedScorer(unittest.TestCase):
+    def assert_vectorized_matches(self, scorer):
+        expected = [scorer.score(lead) for lead in make_leads()]
+
+        batch = LeadBatch(make_leads())
+        self.assertEqual(scorer.score_batch(batch).tolist(), expected)
+        self.assertEqual(list(batch.scores), expected)
+        self.assertEqual(list(scorer.apply_batch(LeadBatch(make_leads())).scores), expected)
+
+        self.assertEqual([lead.score for lead in scorer.apply_batch(make_leads())], expected)
+
+        frame = pd.DataFrame([lead.to_dict() for lead in make_leads()])
+        self.assertEqual(scorer.score_frame(frame).tolist(), expected)
+        self.assertEqual(scorer.score_frame(LeadBatch(make_leads()).to_dataframe()).tolist(), expected)
+
+    def test_default_weights(self):
+        self.assert_vectorized_matches(LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"]))
+
+    def test_custom_weights(self):
+        scorer = LeadScorer(
+            target_cities=["Paris", "Bandung"], target_industries=["Finance"], base_score=5,
+            weights={"city": 50, "tags": {"High Potential": 10, "VIP": 25}}, max_score=90,
+        )
+        self.assert_vectorized_matches(scorer)
+
+    def test_partial_table_override_keeps_defaults(self):
+        scorer = LeadScorer(weights={"company_size": {"Large": 5}})
+        self.assertEqual(scorer.weights["company_size"], {"Large": 5, "Medium": 10, "Small": 0})
+        self.assertEqual(LeadScorer().weights["company_size"]["Large"], 20)
+        self.assert_vectorized_matches(scorer)
+
+    def test_non_integer_weights_rejected(self):
+        for kwargs in ({"weights": {"city": 12.5}}, {"weights": {"tags": {"VIP": 0.5}}}, {"base_score": 1.5}):
+            with self.assertRaises(ValueError):
+                LeadScorer(**kwargs)
+
+    def test_default_rules_unchanged(self):
+        lead = Lead("A", "a@example.com", "Co", "Dev", "Jakarta", "Tech", "Large")
+        lead.add_tag("High Potential")
+        self.assertEqual(LeadScorer(["Jakarta"], ["Tech"]).score(lead), 100)
+        lead = Lead("B", "b@example.com", "Co", "Dev", "Paris", "Retail", "Small")
+        self.assertEqual(LeadScorer(["Jakarta"], ["Tech"]).score(lead), 10)
+
+if __name__ == "__main__":
+    unittest.main()
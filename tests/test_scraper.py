@@ -1,5 +1,9 @@
+import time
 import unittest
+import requests
 from scraper.api_scraper import APIScraper
+from scraper.http_client import build_session, get_with_retry
+from stubs.randomuser import StubRandomUserServer
 
 class TestAPIScraper(unittest.TestCase):
     def test_fetch(self):
@@ -9,5 +13,62 @@ class TestAPIScraper(unittest.TestCase):
         self.assertTrue(hasattr(leads[0], "name"))
         self.assertTrue(hasattr(leads[0], "email"))
 
+class TestConcurrentFetch(unittest.TestCase):
+    def test_pages_fetched_concurrently_in_order(self):
+        with StubRandomUserServer(latency=0.05) as stub:
+            scraper = APIScraper(api_url=stub.url, max_workers=4)
+            leads = scraper.fetch_concurrent(results=95, page_size=10, seed="abc")
+            self.assertEqual(stub.request_count, 10)
+            self.assertGreater(stub.max_in_flight, 1)
+        self.assertEqual(len(leads), 95)
+        self.assertEqual([lead.email for lead in leads],
+                         [f"user{i}.abc@example.com" for i in range(95)])
+
+    def test_unordered_stream_yields_all(self):
+        with StubRandomUserServer() as stub:
+            scraper = APIScraper(api_url=stub.url, max_workers=3)
+            emails = {lead.email for lead in scraper.iter_fetch_concurrent(30, page_size=7, ordered=False)}
+        self.assertEqual(len(emails), 30)
+
+    def test_retry_on_429_and_5xx(self):
+        with StubRandomUserServer(fail_statuses=[429, 503]) as stub:
+            scraper = APIScraper(api_url=stub.url, max_workers=1, backoff=0)
+            leads = scraper.fetch_concurrent(results=5, page_size=5)
+            self.assertEqual(stub.request_count, 3)
+        self.assertEqual(len(leads), 5)
+
+    def test_gives_up_after_max_retries(self):
+        with StubRandomUserServer(fail_statuses=[500] * 5) as stub:
+            scraper = APIScraper(api_url=stub.url, max_retries=2, backoff=0)
+            with self.assertRaises(requests.HTTPError) as caught:
+                scraper.fetch(results=5)
+            self.assertEqual(caught.exception.response.status_code, 500)
+            self.assertEqual(stub.request_count, 3)
+
+    def test_connection_error_after_max_retries(self):
+        with StubRandomUserServer() as stub:
+            url = stub.url
+        scraper = APIScraper(api_url=url, max_retries=1, backoff=0)
+        with self.assertRaises(requests.ConnectionError):
+            scraper.fetch(results=5)
+
+    def test_retry_after_capped(self):
+        with StubRandomUserServer(fail_statuses=[503], retry_after="3600") as stub:
+            start = time.perf_counter()
+            response = get_with_retry(build_session(), stub.url, params={"results": 1}, backoff=0, max_backoff=0.05)
+            self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(response.status_code, 200)
+
+    def test_pages_in_flight_bounded(self):
+        with StubRandomUserServer() as stub:
+            scraper = APIScraper(api_url=stub.url, max_workers=2)
+            pages = scraper.iter_pages(results=50, page_size=1)
+            next(pages)
+            time.sleep(0.2)
+            # 2 * max_workers in flight + 1 page pengganti untuk page yang sudah di-yield
+            self.assertLessEqual(stub.request_count, 5)
+            self.assertEqual(sum(1 for _ in pages), 49)
+            self.assertEqual(stub.request_count, 50)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+import unittest
+from models.lead import Lead
+from models.seeding import stable_choice
+from processors.enricher import LeadEnricher
+from scraper.api_scraper import APIScraper
+from stubs.randomuser import StubRandomUserServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def fingerprint(leads):
+    return [(lead.company, lead.position, lead.location, lead.industry, lead.company_size) for lead in leads]
+
+class TestSeeding(unittest.TestCase):
+    def test_stable_across_processes(self):
+        code = "from models.seeding import stable_choice; print(stable_choice(list(range(1000)), 'a@b.com', 'x'))"
+        outputs = {
+            subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+                           env={**os.environ, "PYTHONHASHSEED": str(hash_seed)}).stdout
+            for hash_seed in (1, 2)
+        }
+        self.assertEqual(outputs, {f"{stable_choice(list(range(1000)), 'a@b.com', 'x')}\n"})
+
+    def test_scraper_values_derived_from_email(self):
+        with StubRandomUserServer() as stub:
+            first = APIScraper(api_url=stub.url).fetch(results=30)
+            second = APIScraper(api_url=stub.url).fetch(results=30)
+            other = APIScraper(api_url=stub.url, random_seed="other").fetch(results=30)
+        self.assertEqual(fingerprint(first), fingerprint(second))
+        self.assertNotEqual(fingerprint(first), fingerprint(other))
+
+    def test_model_and_enricher_are_pure(self):
+        self.assertEqual(Lead("A", "a@example.com", "Co").location, Lead("B", "a@example.com", "Co").location)
+        make = lambda: [Lead("A", f"a{i}@example.com", "Co", company_size="Unknown") for i in range(20)]
+        sizes = [lead.company_size for lead in LeadEnricher(seed=3).enrich_leads(make())]
+        again = [lead.company_size for lead in LeadEnricher(seed=3).enrich_leads(reversed(make()))]
+        self.assertEqual(sizes, again[::-1])
+        self.assertGreater(len(set(sizes)), 1)
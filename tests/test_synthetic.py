@@ -0,0 +1,24 @@
+import unittest
+from processors.filter import LeadFilter
+from scraper.cache import CachedScraper
+from scraper.synthetic import SyntheticScraper
+from scraper.api_scraper import COMPANIES, INDUSTRIES
+
+class TestSyntheticScraper(unittest.TestCase):
+    def test_same_interface_and_deterministic(self):
+        scraper = SyntheticScraper()
+        leads = scraper.fetch(results=50)
+        self.assertEqual(len(leads), 50)
+        self.assertTrue(all(lead.company in COMPANIES and lead.industry in INDUSTRIES for lead in leads))
+        paged = SyntheticScraper().fetch_concurrent(results=50, page_size=7)
+        self.assertEqual([l.to_record() for l in leads], [l.to_record() for l in paged])
+        self.assertNotEqual([l.email for l in leads], [l.email for l in scraper.fetch_concurrent(50, seed="other")])
+        cached = CachedScraper(scraper)
+        self.assertEqual([l.email for l in cached.iter_fetch_concurrent(20)], [l.email for l in leads[:20]])
+
+    def test_duplicate_rate(self):
+        leads = SyntheticScraper(duplicate_rate=0.2).fetch(results=5000)
+        unique = LeadFilter().deduplicate(leads)
+        # sumber duplikat bisa saja lead yang sendirinya duplikat, jadi yang hilang sedikit < rate
+        self.assertTrue(0.12 < 1 - len(unique) / len(leads) <= 0.2)
+        self.assertEqual(len(LeadFilter().deduplicate(SyntheticScraper().fetch(results=5000))), 5000)
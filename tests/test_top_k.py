@@ -0,0 +1,59 @@
+import random
+import unittest
+from processors.pipeline import LeadPipeline
+from processors.top_k import TopKSelector, select_top
+from tests import helpers
+
+CITIES = ["Jakarta", "Paris", "Surabaya", "Berlin"]
+
+def make_leads(n=500, seed=7):
+    rng = random.Random(seed)
+    # banyak score sama → cek urutan seri
+    return helpers.make_leads(n, location=lambda i: rng.choice(CITIES), score=lambda i: rng.randint(0, 100))
+
+def ranked(leads):
+    return sorted(leads, key=lambda l: -l.score)  # sort stabil: seri → urutan datang
+
+def quota_top(leads, quota, segment):
+    result, taken = [], {}
+    for lead in ranked(leads):
+        if taken.get(segment(lead), 0) < quota:
+            taken[segment(lead)] = taken.get(segment(lead), 0) + 1
+            result.append(lead)
+    return result
+
+class TestTopKSelector(unittest.TestCase):
+    def test_matches_full_sort(self):
+        leads = make_leads()
+        for k in (0, 1, 10, 499, 500, 1000):
+            self.assertEqual(select_top(iter(leads), k=k), ranked(leads)[:k])
+        got = select_top(leads, k=20, min_score=90)
+        self.assertEqual(got, [l for l in ranked(leads) if l.score >= 90][:20])
+
+    def test_per_segment_quota(self):
+        leads = make_leads()
+        selector = TopKSelector(per_segment=3, segment_by="location").extend(leads)
+        for city, chosen in selector.segments().items():
+            self.assertEqual(chosen, [l for l in ranked(leads) if l.location == city][:3])
+        self.assertEqual(selector.results(), quota_top(leads, 3, lambda l: l.location))
+        self.assertEqual(select_top(leads, k=5, per_segment=3, segment_by="location"),
+                         quota_top(leads, 3, lambda l: l.location)[:5])
+
+    def test_many_segments_pruned_to_k(self):
+        leads = make_leads(2000)
+        segment = lambda l: int(l.name[1:]) % 150
+        selector = TopKSelector(k=10, per_segment=2, segment_by=segment).extend(leads)
+        self.assertEqual(selector.results(), quota_top(leads, 2, segment)[:10])
+        self.assertLessEqual(sum(len(heap) for heap in selector._heaps.values()), 2 * 10 + 2)
+
+    def test_pipeline_stage_passes_leads_through(self):
+        leads = make_leads(50)
+        selector = TopKSelector(k=5)
+        out = list(LeadPipeline([selector.iter_collect]).run(leads))
+        self.assertEqual(out, leads)
+        self.assertEqual((selector.results(), selector.seen), (ranked(leads)[:5], 50))
+        with self.assertRaises(ValueError):
+            TopKSelector(per_segment=3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Mode server async (ASGI) untuk API leads — endpoint sama dengan ui/flask_app.py.
+
+    uvicorn ui.asgi_app:app --workers 2
+    python ui/asgi_app.py
+
+Upstream di-fetch dengan satu httpx.AsyncClient bersama (dibuka/ditutup lewat
+lifespan), dan request /leads yang datang bersamaan saat dataset perlu
+di-load/refresh berbagi satu fetch upstream.
+"""
+import asyncio
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+# Pastikan bisa import dari root project (scraper, models, processors, exporters)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from config import settings
+from models import codec
+from monitoring.metrics import CONTENT_TYPE, REGISTRY
+from scraper.async_client import AsyncAPIScraper, Coalescer
+from storage.lead_collection import LeadCollection
+from ui.lead_query import leads_payload, make_etag, parse_query, process_leads
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse yang di-encode lewat models/codec.py (orjson jika ada)"""
+
+    def render(self, content: Any) -> bytes:
+        return codec.dumps(content)
+
+
+def create_asgi_app(scraper: Optional[Any] = None, dataset_size: Optional[int] = None) -> Starlette:
+    scraper = scraper or AsyncAPIScraper()
+    dataset_size = dataset_size or settings.API_DATASET_SIZE
+    coalescer = Coalescer()
+    state = {"collection": None, "loaded_at": None}
+
+    async def load_collection() -> LeadCollection:
+        leads = await scraper.fetch(results=dataset_size)
+        # dedup/scoring/index CPU-bound → jangan blok event loop
+        collection = await asyncio.to_thread(lambda: LeadCollection(process_leads(leads)))
+        state["collection"], state["loaded_at"] = collection, time.monotonic()
+        return collection
+
+    async def get_collection() -> LeadCollection:
+        loaded_at = state["loaded_at"]
+        if loaded_at is None or time.monotonic() - loaded_at > settings.FETCH_CACHE_TTL:
+            # koleksi baru di-swap utuh, request yang sedang berjalan tetap pakai yang lama
+            return await coalescer.run("dataset", load_collection)
+        return state["collection"]
+
+    async def home(request: Request) -> Response:
+        """
+        Root endpoint — info singkat.
+        """
+        return FastJSONResponse(
+            {
+                "message": "🚀 Lead Scraper API is running (async)",
+                "endpoints": {
+                    "health": "/health",
+                    "metrics": "/metrics",
+                    "leads": "/leads?limit=20&city=Jakarta&min_score=50&tag_keyword=Tech",
+                },
+            }
+        )
+
+    async def health(request: Request) -> Response:
+        """
+        Health check + statistik coalescing.
+        """
+        return FastJSONResponse({"status": "ok", "coalescing": coalescer.stats})
+
+    async def metrics(request: Request) -> Response:
+        """
+        Metric format Prometheus (sama seperti /metrics di flask_app).
+        """
+        return Response(REGISTRY.render(), headers={"Content-Type": CONTENT_TYPE})
+
+    async def get_leads(request: Request) -> Response:
+        """
+        Sama seperti /leads di flask_app (filter, sort, cursor, ETag).
+        """
+        params = parse_query(request.query_params)
+        try:
+            leads = await get_collection()
+
+            etag = make_etag(leads.version, params)
+            headers = {"ETag": f'"{etag}"'}
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+
+            try:
+                payload = leads_payload(leads, params)
+            except ValueError as exc:
+                return FastJSONResponse({"error": "bad_request", "message": str(exc)}, status_code=400)
+            return FastJSONResponse(payload, headers=headers)
+
+        except Exception as exc:  # fallback guardrail
+            return FastJSONResponse({"error": "internal_error", "message": str(exc)}, status_code=500)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # pool koneksi upstream hidup selama server hidup
+        await scraper.start()
+        try:
+            yield
+        finally:
+            await scraper.close()
+
+    return Starlette(
+        routes=[
+            Route("/", home),
+            Route("/health", health),
+            Route("/metrics", metrics),
+            Route("/leads", get_leads),
+        ],
+        lifespan=lifespan,
+    )
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/").strip('"') for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+app = create_asgi_app()
+
+
+# -------------- Entrypoint ---------------
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="127.0.0.1", port=8000)
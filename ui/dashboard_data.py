@@ -0,0 +1,183 @@
+"""
+Data layer dashboard Streamlit (ui/streamlit_app.py), tanpa dependensi Streamlit.
+
+Dataset dibangun sekali (LeadBatch → DataFrame kategori, sudah urut High
+Potential lalu score), setiap rerun hanya membuat mask filter dan merender
+baris yang terlihat di halaman. Badge & tooltip dirender per kolom, bukan
+`apply` per baris; export dibuat hanya saat diminta.
+"""
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from models.lead import Lead
+from models.lead_batch import LeadBatch
+from processors.top_k import TopKSelector
+
+CAPRAE_PRIMARY = "#1B3A57"
+CAPRAE_SECONDARY = "#4A90E2"
+HIGH_POTENTIAL = "High Potential"
+TOP_N = 10
+
+DISPLAY_COLUMNS = ["No", "name", "email", "company", "position", "location", "score", "Tags / Industry"]
+EXPORT_COLUMNS = ["No", "name", "email", "company", "position", "location", "industry", "company_size", "tags", "score"]
+
+MISSING_BADGE = "<span style='color:red; font-weight:bold;'>⚠️ Missing info</span>"
+TOP_BADGE = (
+    "<span title='High Potential: Top lead!' style='background-color:#FF4500; color:white; "
+    "padding:2px 5px; border-radius:5px; cursor: help;'>🔥 High Potential</span> "
+)
+HIGH_POTENTIAL_BADGE = (
+    "<span title='High Potential: Lead has high chance' style='background-color:#FF6B6B; color:white; "
+    "padding:2px 5px; border-radius:5px; cursor: help;'>🔥 High Potential</span> "
+)
+INDUSTRY_BADGE = (
+    f"<span title='Industry' style='background-color:{CAPRAE_SECONDARY}; color:white; "
+    "padding:2px 5px; border-radius:5px; cursor: help;'>"
+)
+SCORE_TOOLTIP = "<span title='Score 0–100, higher = better' style='cursor: help;'>"
+
+
+def build_frame(leads):
+    """
+    Lead (sudah di-score & ditag) → DataFrame urut High Potential, lalu score.
+    Kolom tambahan: high_potential (bool), missing_info (bool).
+    """
+    batch = leads if isinstance(leads, LeadBatch) else LeadBatch(leads)
+    df = batch.to_dataframe(categorical=True)
+    # flag dihitung per kombinasi tags unik, lalu disebar lewat kode kategori
+    flags = np.array([HIGH_POTENTIAL in tags for tags in batch.tags.categories] or [False])
+    codes = np.frombuffer(batch.tags.codes, dtype=np.uint32) if len(batch) else np.empty(0, dtype=np.uint32)
+    df["high_potential"] = flags[codes]
+    df["missing_info"] = df["industry"].isna().to_numpy() | (df["industry"].astype(object) == "").to_numpy()
+    order = np.lexsort((-df["score"].to_numpy(), ~df["high_potential"].to_numpy()))
+    return df.take(order).reset_index(drop=True)
+
+
+def filter_options(df, column):
+    values = df[column].cat.categories if isinstance(df[column].dtype, pd.CategoricalDtype) else df[column].unique()
+    return ["All"] + sorted(value for value in values if value)
+
+
+def filter_positions(df, city="All", industry="All", index=None):
+    """Posisi baris (urut) yang lolos filter; dengan LeadIndex dari df, tanpa scan semua baris"""
+    if index is not None:
+        return index.positions(location=city, industry=industry)
+    mask = np.ones(len(df), dtype=bool)
+    for column, value in (("location", city), ("industry", industry)):
+        if value and value != "All":
+            mask &= _equals(df[column], value)
+    return np.flatnonzero(mask)
+
+
+def summary(df, positions):
+    scores = df["score"].to_numpy()[positions]
+    return {
+        "total": len(positions),
+        "jakarta": int(_equals(df["location"].iloc[positions], "Jakarta").sum()),
+        "tech": int(_equals(df["industry"].iloc[positions], "Tech").sum()),
+        "avg_score": float(scores.mean()) if len(positions) else 0.0,
+    }
+
+
+def _equals(series, value):
+    # kolom kategori: bandingkan kode int, bukan string per baris
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        if value not in categories:
+            return np.zeros(len(series), dtype=bool)
+        return series.cat.codes.to_numpy() == categories.get_loc(value)
+    return (series == value).to_numpy()
+
+
+def handoff_positions(df, positions, k=None, per_segment=None, segment_by=None, high_potential_only=True):
+    """
+    Posisi hand-off ke CRM: k lead score tertinggi (maks per_segment per nilai
+    kolom segment_by) dari hasil filter, score desc — heap top-k satu kali
+    jalan atas posisi, tanpa sort/salin DataFrame.
+    """
+    if high_potential_only:
+        positions = positions[df["high_potential"].to_numpy()[positions]]
+    scores = df["score"].to_numpy()
+    segments = None
+    if segment_by is not None:
+        column = df[segment_by]
+        segments = (column.cat.codes if isinstance(column.dtype, pd.CategoricalDtype) else column).to_numpy()
+    selector = TopKSelector(
+        k=k, per_segment=per_segment, key=scores.__getitem__,
+        segment_by=segments.__getitem__ if segments is not None else None,
+    )
+    return np.array(selector.extend(positions.tolist()).results(), dtype=np.intp)
+
+
+def page_frame(df, positions, page, page_size=20):
+    """Baris halaman `page` (1-based) dengan kolom No (nomor urut dalam hasil filter)"""
+    start = (page - 1) * page_size
+    page_df = df.take(positions[start:start + page_size]).reset_index(drop=True)
+    page_df.insert(0, "No", np.arange(start + 1, start + 1 + len(page_df)))
+    return page_df
+
+
+def render_page(page_df, top_n=TOP_N):
+    """Kolom HTML untuk tabel: badge Tags / Industry + tooltip score"""
+    rendered = page_df.copy()
+    high_potential = rendered["high_potential"].to_numpy()
+    top = rendered["No"].to_numpy() <= top_n
+    hp_badge = np.where(high_potential & top, TOP_BADGE, np.where(high_potential, HIGH_POTENTIAL_BADGE, ""))
+    industry = rendered["industry"].astype(object).fillna("").to_numpy(dtype=object)
+    badges = hp_badge.astype(object) + INDUSTRY_BADGE + industry + "</span>"
+    rendered["Tags / Industry"] = np.where(rendered["missing_info"].to_numpy(), MISSING_BADGE, badges)
+    rendered["score"] = SCORE_TOOLTIP + rendered["score"].astype(str) + "</span>"
+    return rendered
+
+
+def aggregate(df, positions, column):
+    """Jumlah lead & rata-rata score per nilai kolom (untuk chart; bukan satu bar per lead)"""
+    subset = df.take(positions)
+    grouped = subset.groupby(column, observed=True)["score"].agg(leads="size", avg_score="mean", total_score="sum")
+    return grouped.reset_index().sort_values("total_score", ascending=False)
+
+
+def bar_chart(data, column, title):
+    """
+    Bar chart hasil aggregate: y = total score, warna = rata-rata score.
+    Pakai plotly.graph_objects langsung (~5 ms) — plotly.express ~25x lebih lambat.
+    """
+    import plotly.graph_objects as go
+
+    bar = go.Bar(
+        x=data[column].astype(str),
+        y=data["total_score"],
+        text=data["leads"],
+        marker={"color": data["avg_score"], "colorscale": "Blues", "showscale": True},
+        customdata=data[["leads", "avg_score"]].to_numpy(),
+        hovertemplate="%{x}<br>total score %{y}<br>leads %{customdata[0]}<br>avg score %{customdata[1]:.1f}<extra></extra>",
+    )
+    return go.Figure(bar, layout={"title": title, "xaxis_title": column, "yaxis_title": "score"})
+
+
+def crm_records(frame):
+    """Baris DataFrame (belum dirender) → record lead untuk CRMPusher; nilai kosong → None"""
+    columns = [column for column in Lead.FIELDS if column in frame.columns]
+    subset = frame[columns].astype(object)
+    return subset.where(subset.notna(), None).to_dict("records")
+
+
+def export_frame(df, positions):
+    frame = df.take(positions).reset_index(drop=True)
+    frame.insert(0, "No", np.arange(1, len(frame) + 1))
+    return frame[EXPORT_COLUMNS]
+
+
+def to_csv_bytes(df, positions):
+    return export_frame(df, positions).to_csv(index=False).encode("utf-8")
+
+
+def to_excel_bytes(df, positions):
+    frame = export_frame(df, positions)
+    frame["tags"] = frame["tags"].str.join(", ")  # sel Excel tidak bisa berisi list
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        frame.to_excel(writer, index=False, sheet_name="Leads")
+    return output.getvalue()
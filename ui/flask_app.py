@@ -1,18 +1,101 @@
 import os
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, Optional
 
 # Pastikan bisa import dari root project (scraper, models, processors, exporters)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from flask import Flask, jsonify, request
-from scraper.api_scraper import APIScraper
-from processors.filter import LeadFilter
-from processors.tagger import LeadTagger
+from flask import Flask, g, jsonify, request, send_file, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from config import settings
+from models import codec
+from monitoring.metrics import API_LATENCY, CONTENT_TYPE, REGISTRY
+from monitoring.run_report import RunReport
+from processors.jobs import RESULT_FORMATS, JobQueue
+from scraper.cache import CachedScraper
+from storage.lead_collection import LeadCollection
+from ui.lead_query import (
+    NDJSON_MIMETYPE,
+    iter_collection_leads,
+    iter_live_leads,
+    iter_ndjson,
+    leads_payload,
+    make_etag,
+    parse_query,
+    process_leads,
+    stream_query,
+    wants_ndjson,
+)
 
 
-def create_app() -> Flask:
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    jsonify lewat models/codec.py (orjson jika ada): body langsung bytes, tanpa
+    sort key. Output indent (app.debug) tetap lewat json stdlib.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return codec.dumps(obj).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return codec.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(codec.dumps(obj) + b"\n", mimetype=self.mimetype)
+
+
+def create_app(
+    scraper: Optional[Any] = None, dataset_size: Optional[int] = None, jobs: Optional[JobQueue] = None
+) -> Flask:
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    # satu scraper ber-cache per app: request berulang tidak memanggil API lagi
+    scraper = scraper or CachedScraper()
+    dataset_size = dataset_size or settings.API_DATASET_SIZE
+    # antrian job dibuat saat startup: job yang belum selesai dari run sebelumnya langsung dilanjutkan
+    jobs = jobs or JobQueue(settings.JOB_DIR)
+    app.extensions["jobs"] = jobs
+    state = {"collection": None, "loaded_at": None}
+    lock = threading.Lock()
+
+    def get_collection() -> LeadCollection:
+        """
+        Dataset di-fetch & diproses sekali, lalu di-refresh setelah TTL cache fetch habis.
+        Refresh membuat koleksi baru dan menukar referensinya (seperti ui/asgi_app.py):
+        request / stream NDJSON yang sudah memegang koleksi lama tidak ikut berubah.
+        """
+        with lock:
+            loaded_at = state["loaded_at"]
+            if loaded_at is None or time.monotonic() - loaded_at > settings.FETCH_CACHE_TTL:
+                # waktu fetch & proses tercatat di /metrics (lead_scraper_stage_*)
+                report = RunReport("api-dataset")
+                with report.timed("api.fetch") as stats:
+                    leads = scraper.fetch(results=dataset_size)
+                    stats.items_out = len(leads)
+                with report.timed("api.process", len(leads)):
+                    state["collection"] = LeadCollection(process_leads(leads))
+                report.finish()
+                state["loaded_at"] = time.monotonic()
+            return state["collection"]
+
+    @app.before_request
+    def start_timer():
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def record_latency(response):
+        start = g.pop("request_start", None)
+        if start is not None:
+            endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+            API_LATENCY.observe(time.perf_counter() - start, endpoint=endpoint, status=response.status_code)
+        return response
 
     @app.route("/", methods=["GET"])
     def home():
@@ -25,7 +108,9 @@ def create_app() -> Flask:
                 "docs": "/docs",
                 "endpoints": {
                     "health": "/health",
-                    "leads": "/leads?limit=20&city=Jakarta&tag_keyword=Tech",
+                    "metrics": "/metrics",
+                    "leads": "/leads?limit=20&city=Jakarta&min_score=50&tag_keyword=Tech",
+                    "jobs": "/jobs",
                 },
             }
         )
@@ -35,7 +120,14 @@ def create_app() -> Flask:
         """
         Health check sederhana
         """
-        return jsonify({"status": "ok"}), 200
+        return jsonify({"status": "ok", "fetch_cache": scraper.cache.stats}), 200
+
+    @app.route("/metrics", methods=["GET"])
+    def metrics():
+        """
+        Metric format Prometheus: latency HTTP upstream & API, waktu/lead per stage, peak memory
+        """
+        return app.response_class(REGISTRY.render(), mimetype=None, content_type=CONTENT_TYPE)
 
     @app.route("/docs", methods=["GET"])
     def docs():
@@ -57,12 +149,31 @@ def create_app() -> Flask:
                         "method": "GET",
                         "desc": "Health check sederhana.",
                         "params": [],
-                        "response_example": {"status": "ok"},
+                        "response_example": {
+                            "status": "ok",
+                            "fetch_cache": {"hits": 3, "misses": 1, "disk_hits": 0, "evictions": 0, "expired": 0},
+                        },
+                    },
+                    {
+                        "path": "/metrics",
+                        "method": "GET",
+                        "desc": "Metric format Prometheus (latency HTTP, waktu per stage pipeline, peak memory).",
+                        "params": [],
                     },
                     {
                         "path": "/leads",
                         "method": "GET",
-                        "desc": "Ambil leads dari Random User API, bisa difilter & ditag.",
+                        "desc": "Ambil leads (sudah di-score & ditag), bisa difilter, diurutkan & dipaginasi.",
+                        "headers": [
+                            {
+                                "name": "If-None-Match",
+                                "desc": "ETag dari response sebelumnya; 304 jika hasil tidak berubah.",
+                            },
+                            {
+                                "name": "Accept",
+                                "desc": "application/x-ndjson → response streaming, satu lead per baris (sama dengan stream=1).",
+                            },
+                        ],
                         "params": [
                             {
                                 "name": "limit",
@@ -70,7 +181,13 @@ def create_app() -> Flask:
                                 "required": False,
                                 "default": 20,
                                 "example": 50,
-                                "desc": "Jumlah lead yang diambil.",
+                                "desc": "Jumlah lead per halaman (maks 500).",
+                            },
+                            {
+                                "name": "cursor",
+                                "type": "str",
+                                "required": False,
+                                "desc": "Nilai meta.next_cursor dari halaman sebelumnya.",
                             },
                             {
                                 "name": "city",
@@ -79,6 +196,49 @@ def create_app() -> Flask:
                                 "example": "Jakarta",
                                 "desc": "Filter berdasarkan nama kota (case-insensitive).",
                             },
+                            {
+                                "name": "industry",
+                                "type": "str",
+                                "required": False,
+                                "example": "Tech",
+                                "desc": "Filter berdasarkan industry (case-insensitive).",
+                            },
+                            {
+                                "name": "min_score",
+                                "type": "int",
+                                "required": False,
+                                "example": 50,
+                                "desc": "Hanya lead dengan score >= nilai ini.",
+                            },
+                            {
+                                "name": "tags",
+                                "type": "str",
+                                "required": False,
+                                "example": "High Potential",
+                                "desc": "Daftar tag dipisah koma; lead harus punya semua tag.",
+                            },
+                            {
+                                "name": "sort",
+                                "type": "str",
+                                "required": False,
+                                "default": "-score",
+                                "example": "score",
+                                "desc": "-score (tertinggi dulu) atau score (terendah dulu).",
+                            },
+                            {
+                                "name": "stream",
+                                "type": "int",
+                                "required": False,
+                                "example": 1,
+                                "desc": "1 → NDJSON streaming; limit opsional (default semua lead), tanpa cursor berikutnya.",
+                            },
+                            {
+                                "name": "results",
+                                "type": "int",
+                                "required": False,
+                                "example": 5000,
+                                "desc": "Hanya dengan stream=1: fetch N lead live & kirim sambil diproses (tanpa sort); maksimal STREAM_MAX_RESULTS.",
+                            },
                             {
                                 "name": "tag_keyword",
                                 "type": "str",
@@ -91,8 +251,14 @@ def create_app() -> Flask:
                             "meta": {
                                 "limit": 20,
                                 "count": 5,
+                                "total": 5,
                                 "city": "Jakarta",
+                                "industry": None,
+                                "min_score": None,
+                                "tags": [],
+                                "sort": "-score",
                                 "tag_keyword": "Tech",
+                                "next_cursor": None,
                             },
                             "data": [
                                 {
@@ -101,53 +267,132 @@ def create_app() -> Flask:
                                     "company": "Unknown Company",
                                     "position": "Unknown",
                                     "location": "Jakarta",
+                                    "industry": "General",
+                                    "company_size": "Medium",
                                     "tags": ["Tech Industry"],
+                                    "score": 30,
                                 }
                             ],
                         },
                     },
+                    {
+                        "path": "/jobs",
+                        "method": "POST",
+                        "desc": "Jalankan pipeline besar di background; return 202 + job (status queued).",
+                        "body": {
+                            "fetch": "section fetch config pipeline (results, page_size, source, ...)",
+                            "pipeline": "section pipeline (chunk_size, dedupe, ...)",
+                            "scorer": "section scorer",
+                            "format": " | ".join(RESULT_FORMATS),
+                        },
+                        "body_example": {"fetch": {"results": 1000000, "page_size": 5000}, "format": "jsonl"},
+                    },
+                    {
+                        "path": "/jobs/<id>",
+                        "method": "GET",
+                        "desc": "Status job: queued | running | succeeded | failed, processed/total, waktu per stage.",
+                    },
+                    {
+                        "path": "/jobs/<id>/result",
+                        "method": "GET",
+                        "desc": "Download hasil job yang succeeded (streaming file); 409 jika belum selesai.",
+                    },
                 ],
             }
         )
 
+    @app.route("/jobs", methods=["POST"])
+    def submit_job():
+        """
+        Body JSON: section fetch / pipeline / scorer + format (jsonl | csv | json).
+        """
+        try:
+            job = jobs.submit(request.get_json(silent=True))
+        except ValueError as exc:
+            return jsonify({"error": "bad_request", "message": str(exc)}), 400
+        response = jsonify(job)
+        response.headers["Location"] = f"/jobs/{job['id']}"
+        return response, 202
+
+    @app.route("/jobs", methods=["GET"])
+    def list_jobs():
+        limit = min(max(request.args.get("limit", default=20, type=int) or 20, 1), 100)
+        return jsonify({"data": jobs.list(limit)})
+
+    @app.route("/jobs/<job_id>", methods=["GET"])
+    def get_job(job_id):
+        job = jobs.get(job_id)
+        if job is None:
+            return jsonify({"error": "not_found", "message": f"job {job_id} not found"}), 404
+        return jsonify(job)
+
+    @app.route("/jobs/<job_id>/result", methods=["GET"])
+    def get_job_result(job_id):
+        """
+        File hasil dikirim bertahap dari disk (send_file), tidak dimuat ke memori.
+        """
+        job = jobs.get(job_id)
+        if job is None:
+            return jsonify({"error": "not_found", "message": f"job {job_id} not found"}), 404
+        result = jobs.result_path(job_id)
+        if result is None:
+            return jsonify({"error": "not_ready", "message": f"job {job_id} is {job['status']}", "job": job}), 409
+        path, mimetype = result
+        return send_file(
+            os.path.abspath(path), mimetype=mimetype, as_attachment=True,
+            download_name=f"leads-{job_id}{os.path.splitext(path)[1]}",
+        )
+
     @app.route("/leads", methods=["GET"])
     def get_leads():
         """
-        Ambil leads → optional filter by city → optional tagging by keyword.
+        Query leads dari index → optional tagging by keyword (pada salinan lead).
         Query:
-          - limit: int (default 20)
-          - city: str (optional)
+          - limit: int (default 20), cursor: str (optional)
+          - city, industry: str (optional)
+          - min_score: int (optional)
+          - tags: str dipisah koma (optional)
+          - sort: -score | score (default -score)
           - tag_keyword: str (optional)
+          - stream=1 / Accept: application/x-ndjson → NDJSON, satu lead per baris
+            (limit opsional; results=N → fetch live, lead dikirim sambil diproses;
+            limit & results maksimal STREAM_MAX_RESULTS, nilai < 1 → 400)
         """
-        # --- Query params & validasi ringan
-        limit = _parse_int(request.args.get("limit"), default=20, minimum=1, maximum=500)
-        city: Optional[str] = _normalize_str(request.args.get("city"))
-        tag_keyword: Optional[str] = _normalize_str(request.args.get("tag_keyword"))
-
         try:
-            # --- Scrape
-            scraper = APIScraper()
-            leads = scraper.fetch(results=limit)
+            # --- Query params & validasi ringan
+            stream = wants_ndjson(request.args, request.headers.get("Accept"))
+            try:
+                params = stream_query(request.args) if stream else parse_query(request.args)
+                if stream and params["results"]:
+                    # --- Live: tidak ada dataset/ETag, lead keluar sesuai urutan fetch
+                    source = iter_live_leads(scraper, params)
+                    return app.response_class(stream_with_context(iter_ndjson(source)), mimetype=NDJSON_MIMETYPE)
+            except ValueError as exc:
+                return jsonify({"error": "bad_request", "message": str(exc)}), 400
+
+            leads = get_collection()
 
-            # --- Filter (jika ada city)
-            if city:
-                leads = LeadFilter().filter_by_location(leads, city)
+            # --- ETag: versi dataset + parameter query
+            etag = make_etag(leads.version, {**params, "stream": stream})
+            if request.if_none_match.contains(etag):
+                response = app.response_class(status=304)
+                response.set_etag(etag)
+                return response
 
-            # --- Tagging (jika ada keyword)
-            if tag_keyword:
-                LeadTagger().tag_industry(leads, keyword=tag_keyword)
+            try:
+                if stream:
+                    source = iter_collection_leads(leads, params)
+                    response = app.response_class(stream_with_context(iter_ndjson(source)), mimetype=NDJSON_MIMETYPE)
+                    response.set_etag(etag)
+                    return response
+                payload = leads_payload(leads, params)
+            except ValueError as exc:
+                return jsonify({"error": "bad_request", "message": str(exc)}), 400
 
             # --- Response
-            payload: Dict[str, Any] = {
-                "meta": {
-                    "limit": limit,
-                    "count": len(leads),
-                    "city": city,
-                    "tag_keyword": tag_keyword,
-                },
-                "data": [lead.to_dict() for lead in leads],
-            }
-            return jsonify(payload), 200
+            response = jsonify(payload)
+            response.set_etag(etag)
+            return response, 200
 
         except Exception as exc:  # fallback guardrail
             return (
@@ -163,34 +408,6 @@ def create_app() -> Flask:
     return app
 
 
-# ----------------- Helpers -----------------
-def _parse_int(
-    value: Optional[str], default: int = 20, minimum: int = 1, maximum: int = 1000
-) -> int:
-    """
-    Safely parse int with bounds.
-    """
-    try:
-        parsed = int(value) if value is not None else default
-        if parsed < minimum:
-            return minimum
-        if parsed > maximum:
-            return maximum
-        return parsed
-    except Exception:
-        return default
-
-
-def _normalize_str(value: Optional[str]) -> Optional[str]:
-    """
-    Trim & handle empty strings.
-    """
-    if value is None:
-        return None
-    v = value.strip()
-    return v if v else None
-
-
 # -------------- Entrypoint ---------------
 if __name__ == "__main__":
     app = create_app()
@@ -0,0 +1,205 @@
+"""
+Logika query /leads yang dipakai bersama oleh Flask (ui/flask_app.py) dan
+ASGI (ui/asgi_app.py): parsing parameter, proses dataset, ETag & payload.
+"""
+import hashlib
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from config import settings
+from models import codec
+from processors.filter import LeadFilter
+from processors.scorer import LeadScorer
+from processors.tagger import LeadTagger
+
+
+def process_leads(leads: List[Any]) -> List[Any]:
+    """
+    deduplicate → scoring → tagging, sama seperti pipeline di main.py
+    """
+    scorer = LeadScorer(target_cities=settings.TARGET_CITIES, target_industries=settings.TARGET_INDUSTRIES)
+    tagger = LeadTagger()
+    leads = LeadFilter().deduplicate(leads)
+    leads = scorer.apply(leads)
+    leads = tagger.tag_industry(leads)
+    return tagger.add_tag_high_potential(leads)
+
+
+def parse_query(args: Mapping[str, str]) -> Dict[str, Any]:
+    """
+    Query string → parameter LeadCollection.query (+ tag_keyword).
+    """
+    return {
+        "limit": parse_int(args.get("limit"), default=20, minimum=1, maximum=500),
+        "cursor": normalize_str(args.get("cursor")),
+        "city": normalize_str(args.get("city")),
+        "industry": normalize_str(args.get("industry")),
+        "min_score": parse_optional_int(args.get("min_score")),
+        "tags": parse_list(args.get("tags")),
+        "sort": normalize_str(args.get("sort")) or "-score",
+        "tag_keyword": normalize_str(args.get("tag_keyword")),
+    }
+
+
+def make_etag(version: str, params: Dict[str, Any]) -> str:
+    """
+    ETag dari versi dataset + parameter query.
+    """
+    raw = repr((version, sorted(params.items())))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def query_page(collection: Any, params: Dict[str, Any]):
+    """
+    Return (page, next_cursor, total); ValueError jika cursor/sort tidak valid.
+    Tagging keyword dilakukan pada salinan, koleksi tidak berubah.
+    """
+    query = {key: value for key, value in params.items() if key != "tag_keyword"}
+    page, next_cursor, total = collection.query(**query)
+    if params["tag_keyword"]:
+        page = LeadTagger().tag_keyword([lead.copy() for lead in page], params["tag_keyword"])
+    return page, next_cursor, total
+
+
+def leads_payload(collection: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    page, next_cursor, total = query_page(collection, params)
+    meta = {key: value for key, value in params.items() if key != "cursor"}
+    meta.update({"count": len(page), "total": total, "next_cursor": next_cursor})
+    return {"meta": meta, "data": [lead.to_dict() for lead in page]}
+
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def wants_ndjson(args: Mapping[str, str], accept: Optional[str]) -> bool:
+    """
+    Streaming jika `stream=1` atau header Accept meminta NDJSON.
+    """
+    return args.get("stream", "").strip().lower() in ("1", "true", "yes") or NDJSON_MIMETYPE in (accept or "")
+
+
+def stream_query(args: Mapping[str, str]) -> Dict[str, Any]:
+    """
+    Seperti parse_query, tapi `limit` opsional (default: semua lead) dan
+    `results` → fetch live dari scraper, bukan dari dataset ter-index.
+    Keduanya dibatasi STREAM_MAX_RESULTS; ValueError jika bukan bilangan bulat positif.
+    """
+    params = parse_query(args)
+    params["limit"] = parse_stream_int(args, "limit")
+    params["results"] = parse_stream_int(args, "results")
+    return params
+
+
+def parse_stream_int(args: Mapping[str, str], name: str) -> Optional[int]:
+    """
+    None jika kosong; nilai > STREAM_MAX_RESULTS dipotong ke batas itu.
+    """
+    value = parse_optional_int(args.get(name))
+    if value is None and normalize_str(args.get(name)) is None:
+        return None
+    if value is None or value < 1:
+        raise ValueError(f"{name} must be a positive integer")
+    return parse_int(value, minimum=1, maximum=settings.STREAM_MAX_RESULTS)
+
+
+def iter_collection_leads(collection: Any, params: Dict[str, Any]) -> Iterator[Any]:
+    """
+    Lead dari dataset ter-index, lazy & terurut; ValueError langsung jika cursor/sort tidak valid.
+    """
+    query = {key: params[key] for key in ("city", "industry", "min_score", "tags", "sort", "cursor")}
+    return _finish_stream(collection.iter_query(**query), params)
+
+
+def iter_live_leads(scraper: Any, params: Dict[str, Any]) -> Iterator[Any]:
+    """
+    Fetch → deduplicate → scoring → tagging → filter, lead demi lead.
+    Urutan = urutan fetch (tanpa sort), lead pertama keluar sebelum fetch selesai.
+    """
+    scorer = LeadScorer(target_cities=settings.TARGET_CITIES, target_industries=settings.TARGET_INDUSTRIES)
+    tagger = LeadTagger()
+    leads = scraper.iter_fetch_concurrent(results=params["results"])
+    leads = LeadFilter().iter_deduplicate(leads)
+    leads = scorer.iter_apply(leads)
+    leads = tagger.iter_tag_industry(leads)
+    leads = tagger.iter_add_tag_high_potential(leads)
+    return _finish_stream((lead for lead in leads if _matches(lead, params)), params)
+
+
+def iter_ndjson(leads: Iterable[Any], chunk_size: int = 100) -> Iterator[bytes]:
+    """
+    Satu JSON per baris; baris digabung per chunk supaya tidak ada write per lead.
+    Chunk pertama berisi satu lead saja → time-to-first-byte tidak menunggu chunk penuh.
+    """
+    dumps = codec.dumps
+    leads = iter(leads)
+    size = 1
+    while True:
+        lines = [dumps(lead.to_dict()) for lead in islice(leads, size)]
+        if not lines:
+            return
+        lines.append(b"")
+        yield b"\n".join(lines)
+        size = chunk_size
+
+
+def _finish_stream(leads: Iterable[Any], params: Dict[str, Any]) -> Iterator[Any]:
+    if params["limit"] is not None:
+        leads = islice(leads, params["limit"])
+    if params["tag_keyword"]:
+        leads = LeadTagger().iter_tag_keyword((lead.copy() for lead in leads), params["tag_keyword"])
+    return iter(leads)
+
+
+def _matches(lead: Any, params: Dict[str, Any]) -> bool:
+    if params["city"] and (lead.location or "").casefold() != params["city"].casefold():
+        return False
+    if params["industry"] and (lead.industry or "").casefold() != params["industry"].casefold():
+        return False
+    if params["min_score"] is not None and lead.score < params["min_score"]:
+        return False
+    tags = {tag.casefold() for tag in lead.tags}
+    return all(tag.casefold() in tags for tag in params["tags"])
+
+
+def parse_int(value: Optional[str], default: int = 20, minimum: int = 1, maximum: int = 1000) -> int:
+    """
+    Safely parse int with bounds.
+    """
+    try:
+        parsed = int(value) if value is not None else default
+        if parsed < minimum:
+            return minimum
+        if parsed > maximum:
+            return maximum
+        return parsed
+    except Exception:
+        return default
+
+
+def parse_optional_int(value: Optional[str]) -> Optional[int]:
+    """
+    int atau None jika kosong/tidak valid.
+    """
+    try:
+        return int(value) if value is not None and value.strip() else None
+    except ValueError:
+        return None
+
+
+def parse_list(value: Optional[str]) -> List[str]:
+    """
+    "a, b,,c" → ["a", "b", "c"]
+    """
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def normalize_str(value: Optional[str]) -> Optional[str]:
+    """
+    Trim & handle empty strings.
+    """
+    if value is None:
+        return None
+    v = value.strip()
+    return v if v else None
@@ -1,112 +1,84 @@
-import sys, os, base64
-from io import BytesIO
+import sys, os, time
 import math
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from scraper.api_scraper import APIScraper
-from processors.filter import LeadFilter
-from processors.tagger import LeadTagger
-from processors.scorer import LeadScorer
+from config import settings
+from crm.outbox import CRMOutbox
+from crm.pusher import CRMPusher
+from scraper.cache import CachedScraper
+from storage.lead_index import LeadIndex
+from ui.lead_query import process_leads
+from ui.dashboard_data import (
+    CAPRAE_PRIMARY, CAPRAE_SECONDARY, DISPLAY_COLUMNS, aggregate, bar_chart, build_frame, crm_records, filter_options,
+    filter_positions, handoff_positions, page_frame, render_page, summary, to_csv_bytes, to_excel_bytes,
+)
 
 # ----------------------------
 # Page config
 # ----------------------------
 st.set_page_config(page_title="Caprae Lead Scraper Advanced", layout="wide", page_icon="💼")
-CAPRAE_PRIMARY = "#1B3A57"
-CAPRAE_SECONDARY = "#4A90E2"
 
 st.markdown(f"<h1 style='color:{CAPRAE_PRIMARY}'>💼 Caprae Lead Scraper Advanced Demo</h1>", unsafe_allow_html=True)
 
 # ----------------------------
-# Fetch & process leads
+# Cached data layer (lihat ui/dashboard_data.py)
 # ----------------------------
-scraper = APIScraper()
-leads = scraper.fetch(results=200)
-lead_filter = LeadFilter()
-leads = lead_filter.deduplicate(leads)
-
-scorer = LeadScorer(target_cities=["Jakarta"], target_industries=["Tech"])
-leads = scorer.apply(leads)
-tagger = LeadTagger()
-leads = tagger.tag_industry(leads)
-leads = tagger.add_tag_high_potential(leads)
+@st.cache_resource
+def get_scraper():
+    # dibuat sekali per server; rerun Streamlit memakai cache fetch yang sama
+    return CachedScraper()
+
+@st.cache_resource(ttl=settings.FETCH_CACHE_TTL, show_spinner="Fetching leads...")
+def load_dataset(results):
+    # cache_resource (bukan cache_data): DataFrame besar tidak di-copy/pickle tiap rerun, perlakukan read-only
+    df = build_frame(process_leads(get_scraper().fetch(results=results)))
+    df.attrs["loaded_at"] = time.time()
+    # index dibuat sekali per dataset; filter di setiap rerun hanya membaca posting list
+    return df, LeadIndex.from_frame(df)
+
+@st.cache_resource(max_entries=64)
+def chart_figure(loaded_at, city, industry, column, title, _df, _index):
+    # `_df`/`_index` tidak di-hash; key cache = versi dataset + filter
+    # diagregasi per kota/industry: ukuran chart tidak tumbuh dengan jumlah lead
+    data = aggregate(_df, filter_positions(_df, city, industry, _index), column).head(30)
+    return bar_chart(data, column, title)
+
+@st.cache_resource
+def get_crm_pusher():
+    # satu outbox + connection pool per server (hanya jika LEAD_SCRAPER_CRM_URL diisi);
+    # wait=False: klik tidak menunggu backoff retry, lead yang gagal tetap di outbox
+    return CRMPusher.from_settings(CRMOutbox(settings.CRM_OUTBOX_PATH), wait=False)
+
+CRM_STATUS_LABELS = {"sent": "Sent", "pending": "Queued for retry", "in_flight": "Queued for retry", "dead": "Rejected"}
+
+def refresh_data():
+    # invalidasi eksplisit: cache fetch, dataset & chart
+    get_scraper().invalidate()
+    load_dataset.clear()
+    chart_figure.clear()
+    st.session_state.page = 1
 
-df = pd.DataFrame([lead.to_dict() for lead in leads])
+df, index = load_dataset(settings.DASHBOARD_RESULTS)
 
 # ----------------------------
 # Sidebar filters
 # ----------------------------
-cities = ["All"] + sorted(df["location"].unique())
-industries = ["All"] + sorted(df["industry"].unique())
-selected_city = st.sidebar.selectbox("Filter by City", cities)
-selected_industry = st.sidebar.selectbox("Filter by Industry", industries)
-
-filtered_df = df.copy()
-if selected_city != "All":
-    filtered_df = filtered_df[filtered_df["location"] == selected_city]
-if selected_industry != "All":
-    filtered_df = filtered_df[filtered_df["industry"] == selected_industry]
-
-# Sort High Potential on top
-filtered_df["high_potential_flag"] = filtered_df["tags"].apply(lambda x: "High Potential" in x)
-filtered_df = filtered_df.sort_values(by=["high_potential_flag", "score"], ascending=[False, False])
-
-# Reset index + No column
-filtered_df_display = filtered_df.reset_index(drop=True)
-if "No" not in filtered_df_display.columns:
-    filtered_df_display.insert(0, "No", range(1, len(filtered_df_display)+1))
-
-# ----------------------------
-# Render badges with top 10 highlight and missing info
-# ----------------------------
-def render_badges(row):
-    badges = []
-    # Missing info check
-    if not row["industry"]:
-        badges.append("<span style='color:red; font-weight:bold;'>⚠️ Missing info</span>")
-    else:
-        if "High Potential" in row["tags"]:
-            if row["No"] <= 10:
-                # Highlight top 10
-                badges.append(
-                    f"<span title='High Potential: Top lead!' style='background-color:#FF4500; color:white; padding:2px 5px; border-radius:5px; cursor: help;'>🔥 High Potential</span>"
-                )
-            else:
-                badges.append(
-                    f"<span title='High Potential: Lead has high chance' style='background-color:#FF6B6B; color:white; padding:2px 5px; border-radius:5px; cursor: help;'>🔥 High Potential</span>"
-                )
-        badges.append(
-            f"<span title='Industry' style='background-color:{CAPRAE_SECONDARY}; color:white; padding:2px 5px; border-radius:5px; cursor: help;'>{row['industry']}</span>"
-        )
-    return " ".join(badges)
+selected_city = st.sidebar.selectbox("Filter by City", filter_options(df, "location"))
+selected_industry = st.sidebar.selectbox("Filter by Industry", filter_options(df, "industry"))
+st.sidebar.button("🔄 Refresh data", on_click=refresh_data)
 
-filtered_df_display["Tags / Industry"] = filtered_df_display.apply(render_badges, axis=1)
-
-# ----------------------------
-# Download functions
-# ----------------------------
-def convert_df_to_csv(df):
-    return df.to_csv(index=False).encode("utf-8")
-
-def convert_df_to_excel(df):
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        df.to_excel(writer, index=False, sheet_name='Leads')
-    return output.getvalue()
-
-csv_data = convert_df_to_csv(filtered_df_display)
-excel_data = convert_df_to_excel(filtered_df_display)
+# dataset sudah urut High Potential lalu score → posisi dari index sudah urut, tanpa sort ulang
+positions = filter_positions(df, selected_city, selected_industry, index)
 
 # ----------------------------
 # Metrics cards
 # ----------------------------
-total_leads = len(filtered_df)
-jakarta_count = len(filtered_df[filtered_df["location"]=="Jakarta"])
-tech_count = len(filtered_df[filtered_df["industry"]=="Tech"])
-avg_score = filtered_df["score"].mean() if total_leads > 0 else 0
+stats = summary(df, positions)
+total_leads = stats["total"]
+jakarta_count = stats["jakarta"]
+tech_count = stats["tech"]
+avg_score = stats["avg_score"]
 
 card_style = f"""
 <div style='padding:20px; margin:5px; border-radius:10px; 
@@ -125,50 +97,74 @@ cols[3].markdown(card_style.format(content=f"<h3 style='color:{CAPRAE_PRIMARY}'>
 # ----------------------------
 # Pagination
 # ----------------------------
-if 'page' not in st.session_state:
-    st.session_state.page = 1
 PAGE_SIZE = 20
-total_pages = math.ceil(len(filtered_df_display) / PAGE_SIZE)
+total_pages = max(1, math.ceil(total_leads / PAGE_SIZE))
+filter_key = (selected_city, selected_industry, df.attrs["loaded_at"])
+if 'page' not in st.session_state or st.session_state.get("filter_key") != filter_key:
+    st.session_state.page = 1
+    st.session_state.filter_key = filter_key
+st.session_state.page = min(st.session_state.page, total_pages)
 
 # ----------------------------
 # CRM Sender
 # ----------------------------
 class CRMSender:
-    def __init__(self, dataframe):
+    def __init__(self, dataframe, positions):
         self.df = dataframe
+        self.positions = positions
 
     def get_visible_high_potential_leads(self, page=1, page_size=20):
-        start = (page - 1) * page_size
-        end = start + page_size
-        page_df = self.df.iloc[start:end]
-        return page_df[page_df['tags'].apply(lambda x: "High Potential" in x)]
-
-    def send_to_crm(self, page=1, page_size=20):
-        leads_to_send = self.get_visible_high_potential_leads(page, page_size)
+        page_df = page_frame(self.df, self.positions, page, page_size)
+        return page_df[page_df["high_potential"]]
+
+    def get_handoff_leads(self, k=None, per_segment=None, segment_by=None):
+        # top-k streaming (heap) atas hasil filter, bukan sort ulang seluruh DataFrame
+        ranked = handoff_positions(self.df, self.positions, k, per_segment, segment_by)
+        return page_frame(self.df, ranked, 1, max(len(ranked), 1))
+
+    def send_to_crm(self, page=1, page_size=20, handoff=None):
+        if handoff is not None:
+            leads_to_send = self.get_handoff_leads(**handoff)
+        else:
+            leads_to_send = self.get_visible_high_potential_leads(page, page_size)
         num_leads = len(leads_to_send)
-        leads_to_send = leads_to_send.copy()
-        leads_to_send['CRM Status'] = 'Sent'
+        statuses = ["Sent"] * num_leads
+        if settings.CRM_URL and num_leads:
+            # bulk + outbox persisten: hanya lead ini yang dikirim; yang gagal dicoba lagi di push berikutnya
+            pusher = get_crm_pusher()
+            keys = pusher.push(crm_records(leads_to_send))["keys"]
+            by_key = pusher.outbox.statuses(keys)
+            statuses = [CRM_STATUS_LABELS.get(by_key.get(key), "Queued for retry") for key in keys]
+        leads_to_send = render_page(leads_to_send)
+        leads_to_send['CRM Status'] = statuses
         return num_leads, leads_to_send
 
-crm_sender = CRMSender(filtered_df_display)
+def show_crm_result(num_leads, sent_df, label):
+    if not settings.CRM_URL:
+        st.success(f"✅ {num_leads} {label} sent to CRM (simulated).")
+        return
+    counts = sent_df["CRM Status"].value_counts()
+    sent, rejected = int(counts.get("Sent", 0)), int(counts.get("Rejected", 0))
+    queued = num_leads - sent - rejected
+    if sent == num_leads:
+        st.success(f"✅ {sent} {label} sent to CRM.")
+    else:
+        st.warning(f"{sent} {label} sent to CRM, {queued} queued for retry, {rejected} rejected.")
+
+crm_sender = CRMSender(df, positions)
 
 # ----------------------------
-# Display table with top 10 highlight
+# Display table with top 10 highlight (hanya baris di halaman ini yang dirender)
 # ----------------------------
 start_idx = (st.session_state.page - 1) * PAGE_SIZE
 end_idx = start_idx + PAGE_SIZE
-page_df = filtered_df_display.iloc[start_idx:end_idx]
+page_df = render_page(page_frame(df, positions, st.session_state.page, PAGE_SIZE))
 
-def render_score_tooltip(row):
-    return f"<span title='Score 0–100, higher = better' style='cursor: help;'>{row}</span>"
-
-page_df["score"] = page_df["score"].apply(render_score_tooltip)
-
-st.markdown(f"### Showing leads {start_idx+1} to {min(end_idx, len(filtered_df_display))} of {len(filtered_df_display)}")
+st.markdown(f"### Showing leads {min(start_idx+1, total_leads)} to {min(end_idx, total_leads)} of {total_leads}")
 st.markdown(
     page_df.to_html(
         escape=False,
-        columns=["No","name","email","company","position","location","score","Tags / Industry"],
+        columns=DISPLAY_COLUMNS,
         index=False,
         table_id="leads_table"
     ),
@@ -205,14 +201,14 @@ with cols[3]:
 # ----------------------------
 # Send to CRM
 # ----------------------------
-if st.button("🔗 Send High Potential Leads to CRM (Simulated)"):
+if st.button("🔗 Send High Potential Leads to CRM" + ("" if settings.CRM_URL else " (Simulated)")):
     num_sent, sent_df = crm_sender.send_to_crm(st.session_state.page, PAGE_SIZE)
-    st.success(f"✅ {num_sent} High Potential leads sent to CRM (simulated).")
+    show_crm_result(num_sent, sent_df, "High Potential leads")
     if num_sent > 0:
         st.markdown(
             sent_df.to_html(
                 escape=False,
-                columns=["No","name","email","company","position","location","score","Tags / Industry"],
+                columns=DISPLAY_COLUMNS,
                 index=False
             ),
             unsafe_allow_html=True
@@ -220,37 +216,46 @@ if st.button("🔗 Send High Potential Leads to CRM (Simulated)"):
     else:
         st.info("No High Potential leads on this page")
 
+with st.expander("📋 Daily hand-off list (top-k High Potential)"):
+    cols = st.columns(3)
+    handoff_k = cols[0].number_input("Top leads", min_value=1, value=50, step=10)
+    segment_label = cols[1].selectbox("Quota per", ["None", "City", "Industry"])
+    handoff_quota = cols[2].number_input("Max per segment", min_value=1, value=5, step=1)
+    segment_by = {"City": "location", "Industry": "industry"}.get(segment_label)
+    handoff = {
+        "k": int(handoff_k),
+        "per_segment": int(handoff_quota) if segment_by else None,
+        "segment_by": segment_by,
+    }
+    if st.button("🔗 Send hand-off list to CRM" + ("" if settings.CRM_URL else " (Simulated)")):
+        num_sent, sent_df = crm_sender.send_to_crm(handoff=handoff)
+        show_crm_result(num_sent, sent_df, "hand-off leads")
+        if num_sent > 0:
+            st.markdown(sent_df.to_html(escape=False, columns=DISPLAY_COLUMNS, index=False), unsafe_allow_html=True)
+
 # ----------------------------
-# Download buttons
+# Download buttons (file dibuat saat tombol diklik, bukan tiap rerun)
 # ----------------------------
-csv_base64 = base64.b64encode(csv_data).decode()
-excel_base64 = base64.b64encode(excel_data).decode()
-st.markdown(
-    f"""
-    <div style='display:flex; gap:10px; margin-top:20px; margin-bottom:20px;'>
-        <a href='data:file/csv;base64,{csv_base64}' download='leads.csv'>
-            <button style='padding:10px 20px; border-radius:5px; background-color:{CAPRAE_SECONDARY}; color:white; border:none;'>⬇️ Download CSV</button>
-        </a>
-        <a href='data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{excel_base64}' download='leads.xlsx'>
-            <button style='padding:10px 20px; border-radius:5px; background-color:{CAPRAE_SECONDARY}; color:white; border:none;'>⬇️ Download Excel</button>
-        </a>
-    </div>
-    """, unsafe_allow_html=True
+cols = st.columns([1, 1, 4])
+cols[0].download_button(
+    "⬇️ Download CSV", data=lambda: to_csv_bytes(df, positions),
+    file_name="leads.csv", mime="text/csv", on_click="ignore",
+)
+cols[1].download_button(
+    "⬇️ Download Excel", data=lambda: to_excel_bytes(df, positions),
+    file_name="leads.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    on_click="ignore",
 )
 
 # ----------------------------
 # Charts
 # ----------------------------
 st.subheader("📈 Leads Distribution by City")
-fig_city = px.bar(filtered_df, x="location", y="score", color="score", text="score",
-                  hover_data=["name", "company", "tags"], title="Leads by City",
-                  color_continuous_scale="Blues")
+fig_city = chart_figure(df.attrs["loaded_at"], selected_city, selected_industry, "location", "Leads by City", df, index)
 st.plotly_chart(fig_city, use_container_width=True)
 
 st.subheader("📈 Leads Distribution by Industry")
-fig_industry = px.bar(filtered_df, x="industry", y="score", color="score", text="score",
-                      hover_data=["name", "company", "tags"], title="Leads by Industry",
-                      color_continuous_scale="Blues")
+fig_industry = chart_figure(df.attrs["loaded_at"], selected_city, selected_industry, "industry", "Leads by Industry", df, index)
 st.plotly_chart(fig_industry, use_container_width=True)
 
 # ----------------------------